@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark sampled frame reading: seek-per-sample vs. sequential FrameSource.
+
+Compares the frame loop previously used by create_summary_video
+(cap.set(CAP_PROP_POS_FRAMES) before every sampled read) with the
+sequential grab/retrieve reader in vogel_video_analyzer.video_io.
+
+Without --video a long-GOP H.264 test clip is generated with ffmpeg
+(keyframe every --gop frames).  If ffmpeg is missing, OpenCV's mp4v
+writer is used instead (GOP size not configurable).
+
+Usage:
+    python scripts/benchmark_frame_source.py                    # Generated clip
+    python scripts/benchmark_frame_source.py --video clip.mp4   # Own video
+    python scripts/benchmark_frame_source.py --sample-rate 10 --duration 300
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# Run from a source checkout without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from vogel_video_analyzer.video_io import FrameSource
+
+
+def create_test_clip(path, duration, fps, gop, width, height):
+    """Create a test clip, preferring H.264 with a fixed (long) GOP."""
+    if shutil.which('ffmpeg'):
+        cmd = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', f'testsrc2=size={width}x{height}:rate={fps}:duration={duration}',
+            '-c:v', 'libx264', '-preset', 'veryfast',
+            '-g', str(gop), '-keyint_min', str(gop), '-sc_threshold', '0',
+            '-pix_fmt', 'yuv420p',
+            str(path)
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            return f"H.264, GOP {gop}"
+        print(f"⚠️  ffmpeg failed, falling back to OpenCV writer: {result.stderr.strip()}")
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError("Could not create test clip (neither ffmpeg nor OpenCV mp4v available)")
+    total = int(duration * fps)
+    for index in range(total):
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        x = (index * 4) % max(1, width - 40)
+        frame[height // 3:height // 3 + 40, x:x + 40] = (0, 200, 255)
+        cv2.putText(frame, str(index), (10, height - 20), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
+        writer.write(frame)
+    writer.release()
+    return "MPEG-4 Part 2 (OpenCV default GOP)"
+
+
+def read_seek_per_sample(video_path, sample_rate):
+    """Previous create_summary_video loop: seek before every sampled frame."""
+    cap = cv2.VideoCapture(str(video_path))
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    checksums = []
+    for frame_number in range(0, total_frames, sample_rate):
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        ret, frame = cap.read()
+        if not ret:
+            break
+        checksums.append(int(frame[::16, ::16].sum()))
+    cap.release()
+    return checksums
+
+
+def read_sequential(video_path, sample_rate):
+    """Current loop: grab skipped frames, retrieve sampled ones."""
+    checksums = []
+    with FrameSource(video_path) as source:
+        for sampled in source.iter_sampled(sample_rate, start=0):
+            checksums.append(int(sampled.image[::16, ::16].sum()))
+    return checksums
+
+
+def benchmark(label, func, video_path, sample_rate, repeat):
+    """Run func `repeat` times and return (best seconds, result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(video_path, sample_rate)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"   {label:<22} {best:8.2f}s  ({len(result) / best:7.1f} sampled frames/s)")
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark seek-per-sample vs. sequential frame sampling',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--video', metavar='PATH', help='Video to benchmark (default: generated test clip)')
+    parser.add_argument('--sample-rate', type=int, default=5, help='Read every Nth frame (default: 5)')
+    parser.add_argument('--duration', type=float, default=120.0, help='Generated clip length in seconds (default: 120)')
+    parser.add_argument('--fps', type=int, default=30, help='Generated clip frame rate (default: 30)')
+    parser.add_argument('--gop', type=int, default=250, help='Generated clip keyframe interval (default: 250)')
+    parser.add_argument('--size', default='1280x720', help='Generated clip resolution (default: 1280x720)')
+    parser.add_argument('--repeat', type=int, default=1, help='Repetitions per method, best time is reported (default: 1)')
+    args = parser.parse_args()
+
+    temp_dir = None
+    try:
+        if args.video:
+            video_path = Path(args.video)
+            clip_info = "user-supplied"
+        else:
+            width, height = (int(v) for v in args.size.lower().split('x'))
+            temp_dir = Path(tempfile.mkdtemp())
+            video_path = temp_dir / 'benchmark.mp4'
+            print(f"🎞️  Creating {args.duration:.0f}s test clip ({args.size}, {args.fps} FPS)...")
+            clip_info = create_test_clip(video_path, args.duration, args.fps, args.gop, width, height)
+
+        with FrameSource(video_path) as source:
+            total_frames = source.total_frames
+            fps = source.fps
+
+        print(f"\n📹 {video_path.name}: {total_frames} frames, {fps:.1f} FPS, {clip_info}")
+        print(f"🔍 Sampling every {args.sample_rate}. frame\n")
+
+        seek_time, seek_result = benchmark("seek per sample", read_seek_per_sample,
+                                           video_path, args.sample_rate, args.repeat)
+        seq_time, seq_result = benchmark("sequential (grab)", read_sequential,
+                                         video_path, args.sample_rate, args.repeat)
+
+        print(f"\n⚡ Speedup: {seek_time / seq_time:.1f}x")
+        if seek_result == seq_result:
+            print(f"✅ Identical frames ({len(seq_result)} sampled)")
+        else:
+            mismatches = sum(a != b for a, b in zip(seek_result, seq_result))
+            mismatches += abs(len(seek_result) - len(seq_result))
+            # Inaccurate seeking in some containers returns neighbouring frames
+            print(f"⚠️  {mismatches} of {max(len(seek_result), len(seq_result))} sampled frames differ "
+                  f"(seeking is not frame-accurate for this file)")
+        return 0
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,10 +17,12 @@ from .analyzer import (
     DEFAULT_FLAG_SIZE,
     DEFAULT_FONT_SIZE
 )
+from .detection_track import DetectionTrack
 from .cli import main
 
 __all__ = [
     "VideoAnalyzer",
+    "DetectionTrack",
     "main",
     "__version__",
     "COCO_CLASS_BIRD",
@@ -8,11 +8,21 @@ import tempfile
 import os
 import base64
 import io
+import functools
+import heapq
+from collections import deque
 import numpy as np
 from pathlib import Path
 from datetime import timedelta
-from ultralytics import YOLO
 from .i18n import t
+from .video_io import (open_frame_source, ScaledFrameSource, FFmpegVideoWriter,
+                       DEFAULT_PRESET, DEFAULT_CRF, DEFAULT_DECODER)
+from .prefetch import PrefetchIterator, DEFAULT_QUEUE_SIZE
+from .detection_track import thumbnail_image
+from .tracker import IoUTracker, vote_species, DEFAULT_CROPS_PER_TRACK, DEFAULT_MAX_GAP_SECONDS
+from .motion import MotionGate, DEFAULT_MOTION_THRESHOLD, DEFAULT_MOTION_REFRESH_SECONDS
+from .sampling import (AdaptiveSampler, sample_weights, weighted_share,
+                       DEFAULT_FINE_SAMPLE_RATE, DEFAULT_RELAX_AFTER)
 
 # Try to import PIL for Unicode text rendering
 try:
@@ -23,11 +33,12 @@ except ImportError:
 
 # Optional species classification
 try:
-    from .species_classifier import BirdSpeciesClassifier, aggregate_species_detections
+    from .species_classifier import BirdSpeciesClassifier, SpeciesCropQueue, aggregate_species_detections
     SPECIES_AVAILABLE = True
 except ImportError:
     SPECIES_AVAILABLE = False
     BirdSpeciesClassifier = None
+    SpeciesCropQueue = None
     aggregate_species_detections = None
 
 # Optional Hailo NPU engine (Raspberry Pi AI HAT+)
@@ -37,13 +48,24 @@ except ImportError:
     HAILO_AVAILABLE = False
     HailoDetector = None
 
+# Optional ONNX Runtime engine (CPU, without torch/ultralytics)
+try:
+    from .onnx_engine import OnnxDetector, ONNXRUNTIME_AVAILABLE
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+    OnnxDetector = None
+
 # Constants
 COCO_CLASS_BIRD = 14  # COCO dataset class ID for birds
 DEFAULT_DETECTION_THRESHOLD = 0.3  # Default confidence threshold for bird detection
 DEFAULT_SPECIES_THRESHOLD = 0.3  # Default confidence threshold for species classification
 DEFAULT_SAMPLE_RATE = 5  # Default frame sampling rate for analysis
+DEFAULT_BATCH_SIZE = 1  # Default number of sampled frames per detector call
+DEFAULT_SPECIES_BATCH_SIZE = 16  # Default number of bird crops per species classifier call
 DEFAULT_FLAG_SIZE = 24  # Default size for flag icons in pixels
 DEFAULT_FONT_SIZE = 20  # Default font size for annotations
+DEFAULT_TRIAGE_CONFIDENCE = 0.5  # Detection confidence that ends a triage scan with "bird"
+DEFAULT_TRIAGE_INTERVAL = 2.0  # Minimum seconds between frames checked by a triage scan
 
 # Embedded flag images (PNG as Base64) - Public Domain from Wikimedia Commons
 EMBEDDED_FLAGS = {
@@ -453,7 +475,7 @@ def put_unicode_text(img, text, position, font_size=30, color=(255, 255, 255), b
 class VideoAnalyzer:
     """Analyzes videos for bird content using YOLOv26"""
     
-    def __init__(self, model_path="yolo26n.pt", threshold=DEFAULT_DETECTION_THRESHOLD, target_class=COCO_CLASS_BIRD, identify_species=False, species_model="dima806/bird_species_image_detection", species_threshold=DEFAULT_SPECIES_THRESHOLD, engine="auto", hef_model=None, hailo_num_classes=80):
+    def __init__(self, model_path="yolo26n.pt", threshold=DEFAULT_DETECTION_THRESHOLD, target_class=COCO_CLASS_BIRD, identify_species=False, species_model="dima806/bird_species_image_detection", species_threshold=DEFAULT_SPECIES_THRESHOLD, engine="auto", hef_model=None, hailo_num_classes=80, cache=None, species_engine="transformers", species_fast_preprocess=False):
         """
         Initialize the analyzer
         
@@ -464,22 +486,37 @@ class VideoAnalyzer:
             identify_species: Enable bird species classification (requires species dependencies)
             species_model: Hugging Face model for species classification (default: dima806/bird_species_image_detection)
             species_threshold: Minimum confidence threshold for species classification (default: 0.3)
-            engine: Inference backend – "auto" (ultralytics default), "hailo" (Raspberry Pi AI HAT+)
+            engine: Inference backend – "auto" (ultralytics default), "hailo" (Raspberry Pi AI HAT+),
+                    "onnx" (ONNX Runtime with an exported .onnx model, no torch import)
             hef_model: Path to HEF model file (required when engine="hailo")
             hailo_num_classes: Number of classes in HEF model (default: 80 for COCO).
                                Use 1 for a single-class bird model compiled from yolov26n.pt.
+            cache: Optional AnalysisCache; analyze_video() returns stored statistics
+                   for unchanged videos analyzed with identical settings
+            species_engine: Species classifier backend – "transformers" (PyTorch,
+                            default) or "onnx" (cached ONNX export run with onnxruntime)
+            species_fast_preprocess: Preprocess species crops with OpenCV/NumPy
+                                     instead of the Hugging Face image processor
+                                     (faster, scores can differ slightly; always
+                                     used by the onnx engine; default: False)
         """
         self.threshold = threshold
         self.target_class = target_class
         self.identify_species = identify_species
         self.species_classifier = None
+        self.cache = cache
 
         # ── Select inference engine ──────────────────────────────────────────
         if engine == "hailo":
             self._init_hailo_engine(hef_model)
+        elif engine == "onnx":
+            self._init_onnx_engine(model_path)
         else:
-            # "auto": use ultralytics YOLO (CPU/GPU)
+            # "auto": use ultralytics YOLO (CPU/GPU); imported here so the
+            # other engines start without torch
+            from ultralytics import YOLO
             model_path = self._find_model(model_path)
+            self._model_source = str(model_path)
             print(f"🤖 {t('loading_model')} {model_path}")
             try:
                 self.model = YOLO(model_path, task='detect')
@@ -503,7 +540,9 @@ class VideoAnalyzer:
                 self.identify_species = False
             else:
                 try:
-                    self.species_classifier = BirdSpeciesClassifier(model_name=species_model, confidence_threshold=species_threshold)
+                    self.species_classifier = BirdSpeciesClassifier(model_name=species_model, confidence_threshold=species_threshold,
+                                                                    engine=species_engine,
+                                                                    fast_preprocess=species_fast_preprocess)
                 except Exception as e:
                     print(f"   ⚠️  Could not load species classifier: {e}")
                     print(f"   Continuing with basic bird detection only.\n")
@@ -515,6 +554,7 @@ class VideoAnalyzer:
 
         Sets self.model to a HailoDetector so the rest of VideoAnalyzer can
         call self.model(frame, verbose=False) without any further changes.
+        Only target_class detections are decoded.
 
         Args:
             hef_model:   Path to the HEF model file.
@@ -532,8 +572,38 @@ class VideoAnalyzer:
             raise ValueError(t('hailo_hef_required'))
 
         hef_path = self._find_hef_model(hef_model)
+        self._model_source = str(hef_path)
         print(f"⚡ {t('loading_hailo_model')} {hef_path}")
-        self.model = HailoDetector(hef_path, num_classes=num_classes)
+        self.model = HailoDetector(hef_path, num_classes=num_classes, target_classes=[self.target_class])
+
+    def _init_onnx_engine(self, model_path):
+        """
+        Initialise the ONNX Runtime inference engine.
+
+        Sets self.model to an OnnxDetector. A .pt model name is mapped to the
+        .onnx file next to it (created with --export-onnx).
+
+        Args:
+            model_path: Path or name of the .onnx (or exported .pt) model.
+
+        Raises:
+            RuntimeError:      onnxruntime not installed.
+            FileNotFoundError: ONNX model not found.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError(t('onnx_not_installed'))
+
+        onnx_name = str(Path(model_path).with_suffix('.onnx'))
+        candidates = [Path(onnx_name)] if Path(onnx_name).is_absolute() else [
+            Path('models') / onnx_name, Path('config/models') / onnx_name, Path(onnx_name)
+        ]
+        onnx_path = next((path for path in candidates if path.exists()), None)
+        if onnx_path is None:
+            raise FileNotFoundError(t('onnx_model_not_found').format(path=onnx_name))
+
+        self._model_source = str(onnx_path)
+        print(f"🤖 {t('loading_model')} {onnx_path}")
+        self.model = OnnxDetector(onnx_path)
 
     def _find_hef_model(self, hef_name: str) -> str:
         """
@@ -606,13 +676,92 @@ class VideoAnalyzer:
         # Not a recognized YOLO model - return as is (will error properly if invalid)
         return model_name
         
-    def analyze_video(self, video_path, sample_rate=5):
+    def analyze_video(self, video_path, sample_rate=5, batch_size=DEFAULT_BATCH_SIZE, pipeline=False, track=None,
+                      species_batch_size=DEFAULT_SPECIES_BATCH_SIZE, track_birds=False,
+                      crops_per_track=DEFAULT_CROPS_PER_TRACK, motion_gate=False,
+                      motion_threshold=DEFAULT_MOTION_THRESHOLD, adaptive_sampling=False,
+                      fine_sample_rate=DEFAULT_FINE_SAMPLE_RATE, relax_after=DEFAULT_RELAX_AFTER,
+                      detect_width=None, decoder=DEFAULT_DECODER, decode_threads=0, keyframes_only=False,
+                      triage=False, triage_confidence=DEFAULT_TRIAGE_CONFIDENCE,
+                      triage_interval=DEFAULT_TRIAGE_INTERVAL, stop_at_first_bird=False,
+                      min_bird_percentage=None):
         """
         Analyze video frame by frame
         
         Args:
             video_path: Path to MP4 video
             sample_rate: Analyze every Nth frame (1=all, 5=every 5th, etc.)
+            batch_size: Number of sampled frames passed to the detector at once
+                        (default: 1). Larger batches improve throughput on
+                        multi-core CPUs and GPUs; results are identical.
+            pipeline: Run decoding and YOLO inference in background threads
+                      connected by bounded queues, while species classification
+                      and statistics run in the calling thread (default: False).
+                      Results are identical to the sequential mode.
+            track: Optional DetectionTrack that records the boxes, confidences,
+                   species and report thumbnails of every analyzed frame, so
+                   annotate_video(), create_summary_video() and HTMLReporter
+                   can reuse this pass instead of running detection again.
+                   The result cache is not read when a track is given (the
+                   result is still stored).
+            species_batch_size: Number of bird crops, collected across sampled
+                                frames, classified per species model call
+                                (default: 16)
+            track_birds: Link bird boxes of consecutive sampled frames into
+                         tracks (one track per visit). Adds 'bird_visits' and
+                         'visits' to the statistics; with species
+                         identification only the best crops of each track are
+                         classified and the voted species is used for all of
+                         its boxes (default: False)
+            crops_per_track: Crops per track, ranked by box area × confidence,
+                             sent to the species classifier (default: 3)
+            motion_gate: Skip YOLO on sampled frames that did not change since
+                         the last detector frame and reuse its result. Adds
+                         'frames_gated' to the statistics (default: False)
+            motion_threshold: Fraction of changed pixels (0-1) that counts as
+                              motion for the motion gate (default: 0.0005)
+            adaptive_sampling: Use sample_rate as a coarse stride, switch to
+                               fine_sample_rate while birds are in view
+                               (analyzing the skipped frames before the first
+                               detection) and back after relax_after empty
+                               samples. Percentages become time-weighted
+                               (default: False)
+            fine_sample_rate: Stride while birds are in view (default: 1)
+            relax_after: Consecutive empty fine samples before returning to
+                         the coarse stride (default: 30)
+            detect_width: Decode the frames for detection at this width
+                          (ffmpeg scaling pipe when installed, otherwise
+                          OpenCV) when the video is wider. Boxes are mapped
+                          back to the original resolution and species crops
+                          are cut from full-resolution frames, which are only
+                          decoded for frames with birds (default: None)
+            decoder: Frame reader backend - "opencv" (cv2.VideoCapture) or
+                     "pyav" (threaded FFmpeg decoding, real presentation
+                     timestamps for variable-frame-rate files; requires PyAV)
+                     (default: "opencv")
+            decode_threads: Decoder threads (default: 0 = backend default)
+            keyframes_only: Analyze keyframes only, at least sample_rate
+                            frames apart (requires decoder="pyav"; default: False)
+            triage: Answer only "bird or no bird" with a coarse scan first -
+                    keyframes (decoder="pyav") or frames triage_interval
+                    seconds apart (decoder="opencv"), stopping at the first detection with at least
+                    triage_confidence. Files without any detection are
+                    reported empty, files with only weaker detections get the
+                    full analysis. Decided files have 'triage' statistics
+                    over the checked frames only. Ignored when a track is
+                    recorded (default: False)
+            triage_confidence: Confidence that decides a triage scan (default: 0.5)
+            triage_interval: Minimum seconds between triage frames (default: 2.0)
+            stop_at_first_bird: Stop at the first sampled frame with a bird
+                                (default: False)
+            min_bird_percentage: Stop as soon as it is certain whether the
+                                 bird percentage of the whole video reaches
+                                 this value (fixed sample rate only;
+                                 default: None)
+            
+            With an early-exit condition the statistics gain 'early_terminated'
+            and, if it stopped, 'early_exit'; counts, percentage and segments
+            then cover the analyzed part only.
             
         Returns:
             dict with statistics
@@ -620,119 +769,259 @@ class VideoAnalyzer:
         video_path = Path(video_path)
         if not video_path.exists():
             raise FileNotFoundError(t('video_not_found').format(path=str(video_path)))
+        if min_bird_percentage is not None and (adaptive_sampling or keyframes_only):
+            raise ValueError(t('early_exit_bound_fixed_rate'))
             
         print(f"\n📹 {t('analyzing')} {video_path.name}")
         
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
-            raise RuntimeError(t('cannot_open_video').format(path=str(video_path)))
+        # Unchanged video analyzed with identical settings → stored result
+        # (not looked up when a track is recorded: a hit cannot fill it)
+        cache_params = None
+        if self.cache is not None:
+            cache_params = self._analysis_params(
+                sample_rate, track_birds, crops_per_track,
+                motion_threshold if motion_gate else None,
+                (fine_sample_rate, relax_after) if adaptive_sampling else None,
+                detect_width, decoder, keyframes_only,
+                (triage_confidence, triage_interval) if triage else None,
+                (stop_at_first_bird, min_bird_percentage)
+            )
+            cached_stats = None
+            if track is None:
+                try:
+                    cached_stats = self.cache.get(video_path, cache_params)
+                except Exception as e:
+                    print(f"   ⚠️  {t('cache_read_failed')} {e}")
+            if cached_stats is not None:
+                print(f"   ⚡ {t('cache_hit')}")
+                return cached_stats
+        
+        # Coarse scan first: decided files skip the full analysis
+        triage_info = None
+        if triage and track is None:
+            triage_stats, triage_info = self._triage_video(
+                video_path, triage_confidence, triage_interval, decoder, decode_threads
+            )
+            if triage_stats is not None:
+                self._store_cached(video_path, cache_params, triage_stats)
+                print(f"\n   ✅ {t('analysis_complete')}")
+                return triage_stats
+            print(f"   🔁 {t('triage_escalate')}")
+        
+        source = open_frame_source(video_path, decoder, threads=decode_threads, keyframes_only=keyframes_only)
             
         # Video properties
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
+        total_frames = source.total_frames
+        fps = source.fps
         duration = total_frames / fps if fps > 0 else 0
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        width = source.width
+        height = source.height
         
         print(f"   📊 {t('video_info')} {width}x{height}, {fps:.1f} FPS, {duration:.1f}s, {total_frames} {t('frames')}")
+        if decoder != DEFAULT_DECODER or decode_threads or keyframes_only:
+            print(f"   🎞️  {t('decoder_info').format(decoder=self._decoder_label(decoder, decode_threads, keyframes_only))}")
+        
+        # High-resolution footage: detect on downscaled frames, crop species
+        # regions from full-resolution frames read on demand
+        box_scale = None
+        if detect_width and 0 < detect_width < width:
+            source.release()
+            source = ScaledFrameSource(video_path, detect_width, decoder=decoder, threads=decode_threads,
+                                       keyframes_only=keyframes_only)
+            box_scale = (source.scale_x, source.scale_y)
+            print(f"   🔬 {t('detect_width_info').format(width=source.scaled_width, height=source.scaled_height, decoder=source.scaler)}")
+        
+        if track is not None:
+            track.begin(video_path, fps, total_frames, width, height, sample_rate)
+        
+        # Bird crops of many frames are classified together; results are
+        # written back to their detection entries when a batch completes
+        classify = self.identify_species and self.species_classifier
+        species_queue = SpeciesCropQueue(self.species_classifier, species_batch_size, top_k=1) if classify else None
+        keep_thumbnails = track is not None and track.max_thumbnails > 0
+        
+        # Per-visit tracking: species votes are collected per track and
+        # written back to all of its boxes when the track ends
+        tracker = None
+        track_states = {}  # track_id -> {'members': [...], 'crops': heap}
+        visits = []
+        frame_times = {}  # frame number -> presentation timestamp (PyAV)
+        if track_birds and adaptive_sampling:
+            # Variable stride: tracks end after a gap in time, not in samples
+            tracker = IoUTracker(max_gap_frames=int(DEFAULT_MAX_GAP_SECONDS * fps))
+        elif track_birds:
+            max_missed = int(DEFAULT_MAX_GAP_SECONDS * fps / sample_rate) if fps > 0 else 0
+            tracker = IoUTracker(max_missed=max_missed)
+        if track_birds:
+            crops_per_track = max(1, int(crops_per_track))
+        finish_track = functools.partial(
+            self._finish_bird_track, track_states=track_states, species_queue=species_queue,
+            track=track, visits=visits, fps=fps, frame_times=frame_times
+        )
         
         # Analysis variables
         frames_analyzed = 0
         frames_with_birds = 0
         bird_detections = []
-        current_frame = 0
+        
+        # Early exit: stop once the caller's question is answered
+        early_exit_enabled = stop_at_first_bird or min_bird_percentage is not None
+        early_exit = None
+        expected_samples = len(range(sample_rate - 1, total_frames, sample_rate)) if total_frames > 0 else 0
         
         print(f"   🔍 {t('analyzing_every_nth').format(n=sample_rate)}")
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-                
-            current_frame += 1
+        # Motion gate: static frames reuse the previous detector result; the
+        # detector still runs every DEFAULT_MOTION_REFRESH_SECONDS
+        gate = None
+        if motion_gate:
+            max_gated = int(DEFAULT_MOTION_REFRESH_SECONDS * fps / sample_rate) if fps > 0 else None
+            gate = MotionGate(motion_threshold, max_gated=max_gated)
+            print(f"   🌙 {t('motion_gate_info').format(threshold=motion_threshold * 100)}")
+        
+        # Pipelined mode: decode, inference and bookkeeping run concurrently,
+        # connected by bounded queues (backpressure on the decoder)
+        stages = []
+        queue_size = max(DEFAULT_QUEUE_SIZE, 2 * batch_size)
+        
+        sampler = None
+        sample_frames = []  # Adaptive sampling: analyzed frame numbers ...
+        sample_birds = []   # ... and whether they contain birds
+        if adaptive_sampling:
+            # Decoding follows the detections: one stage for both
+            sampler = AdaptiveSampler(sample_rate, fine_sample_rate, relax_after)
+            print(f"   🎚️  {t('adaptive_sampling_info').format(coarse=sampler.coarse_step, fine=sampler.fine_step, n=sampler.relax_after)}")
+            detections = self._iter_adaptive_detections(source, sampler, batch_size, gate)
+        else:
+            # Only every Nth frame is retrieved; skipped frames are grabbed
+            sampled_frames = source.iter_sampled(sample_rate, start=sample_rate - 1)
+            if pipeline:
+                sampled_frames = PrefetchIterator(sampled_frames, maxsize=queue_size, name='vogel-decode')
+                stages.append(sampled_frames)
             
-            # Apply sample rate
-            if current_frame % sample_rate != 0:
-                continue
+            # YOLO inference (batched across sampled frames)
+            detections = self._iter_detections(sampled_frames, batch_size, gate)
+        if pipeline:
+            detections = PrefetchIterator(detections, maxsize=queue_size, name='vogel-inference')
+            stages.append(detections)
+        
+        try:
+            for sampled, result in detections:
+                frame = sampled.image
+                current_frame = sampled.index + 1
+                # Full-resolution frame for species crops (decoded only if needed)
+                full_frame = functools.partial(source.read_full, sampled.index) if box_scale else None
                 
-            frames_analyzed += 1
-            
-            # YOLO inference
-            results = self.model(frame, verbose=False)
-            
-            # Check bird detection
-            birds_in_frame = 0
-            frame_species = []
-            bird_bboxes = []  # Collect all bounding boxes for batch processing
-            
-            for result in results:
-                boxes = result.boxes
-                for box in boxes:
-                    cls = int(box.cls[0])
-                    conf = float(box.conf[0])
-                    
-                    if cls == self.target_class and conf >= self.threshold:
-                        birds_in_frame += 1
-                        
-                        # Collect bounding boxes for batch species identification
-                        if self.identify_species and self.species_classifier:
-                            xyxy = box.xyxy[0].cpu().numpy()
-                            x1, y1, x2, y2 = int(xyxy[0]), int(xyxy[1]), int(xyxy[2]), int(xyxy[3])
-                            bird_bboxes.append((x1, y1, x2, y2))
-            
-            # Batch process all bird crops at once (GPU-efficient)
-            if bird_bboxes and self.identify_species and self.species_classifier:
-                try:
-                    batch_predictions = self.species_classifier.classify_crops_batch(
-                        frame, bird_bboxes, top_k=1
-                    )
-                    
-                    for predictions in batch_predictions:
-                        if predictions:
-                            species_info = predictions[0]
-                            # Translate species name to current language
-                            translated_name = BirdSpeciesClassifier.format_species_name(
-                                species_info['label'], translate=True
-                            )
-                            frame_species.append({
-                                'species': translated_name,
-                                'confidence': species_info['score']
-                            })
-                except Exception as e:
-                    # Log error for debugging
-                    import sys
-                    print(f"   ⚠️  Species classification error (frame {current_frame}): {e}", file=sys.stderr)
-                    import traceback
-                    traceback.print_exc()
-                    pass
-                        
-            if birds_in_frame > 0:
-                frames_with_birds += 1
-                timestamp = current_frame / fps if fps > 0 else 0
-                detection_entry = {
-                    'frame': current_frame,
-                    'timestamp': timestamp,
-                    'birds': birds_in_frame
-                }
+                frames_analyzed += 1
+                
+                # Check bird detection
+                bird_bboxes = []  # Collect all bounding boxes for batch processing
+                frame_boxes = []  # Box records for the detection track
+                
+                # Class and threshold filter on the whole frame at once
+                bird_xyxy, bird_conf = self._filter_birds(result.boxes, box_scale)
+                birds_in_frame = len(bird_conf)
+                
+                # Collect bounding boxes for batch species identification
+                if birds_in_frame and (classify or track is not None or tracker is not None):
+                    bird_bboxes = [tuple(bbox) for bbox in bird_xyxy.tolist()]
+                    frame_boxes = [
+                        {'bbox': bbox, 'conf': conf, 'species': None}
+                        for bbox, conf in zip(bird_bboxes, bird_conf.tolist())
+                    ]
                 
-                # Add species information if available
-                if frame_species:
-                    detection_entry['species'] = frame_species
+                if tracker is not None:
+                    track_ids, finished = tracker.update(bird_xyxy, current_frame)
+                    for box_info, track_id in zip(frame_boxes, track_ids):
+                        box_info['track_id'] = track_id
+                    for bird in finished:
+                        finish_track(bird)
                 
-                bird_detections.append(detection_entry)
+                if track is not None:
+                    track.add_frame(current_frame, frame_boxes)
                 
-            # Progress every 30 analyzed frames
-            if frames_analyzed % 30 == 0:
-                progress = (frames_analyzed * sample_rate / total_frames) * 100
-                print(f"   ⏳ {progress:.1f}% ({frames_analyzed}/{total_frames//sample_rate} {t('frames')})", end='\r')
+                if sampler is not None:
+                    sample_frames.append(current_frame)
+                    sample_birds.append(birds_in_frame > 0)
                 
-        cap.release()
+                if birds_in_frame > 0:
+                    frames_with_birds += 1
+                    if sampled.timestamp is not None:
+                        # Real presentation time (variable frame rate safe)
+                        timestamp = sampled.timestamp
+                        frame_times[current_frame] = timestamp
+                    else:
+                        timestamp = current_frame / fps if fps > 0 else 0
+                    detection_entry = {
+                        'frame': current_frame,
+                        'timestamp': timestamp,
+                        'birds': birds_in_frame
+                    }
+                    bird_detections.append(detection_entry)
+                
+                    # Queue bird crops for cross-frame species classification
+                    if bird_bboxes and classify:
+                        pending_frame = {
+                            'entry': detection_entry,
+                            'remaining': len(frame_boxes),
+                            'thumbnail': thumbnail_image(frame) if keep_thumbnails and tracker is None else None,
+                        }
+                        if tracker is None:
+                            crop_frame = frame if full_frame is None else full_frame()
+                            for box_info in frame_boxes:
+                                species_queue.add(
+                                    BirdSpeciesClassifier.crop_image(crop_frame, box_info['bbox']),
+                                    functools.partial(self._store_species, pending_frame, box_info, track)
+                                )
+                        else:
+                            self._collect_track_crops(track_states, pending_frame, frame_boxes, frame,
+                                                      crops_per_track, keep_thumbnails, full_frame)
+                
+                # Progress every 30 analyzed frames
+                if frames_analyzed % 30 == 0:
+                    progress = (current_frame / total_frames) * 100
+                    print(f"   ⏳ {progress:.1f}% ({frames_analyzed}/{total_frames//sample_rate} {t('frames')})", end='\r')
+                
+                if early_exit_enabled:
+                    reason = self._early_exit_reason(frames_analyzed, frames_with_birds, expected_samples,
+                                                     stop_at_first_bird, min_bird_percentage)
+                    if reason is not None:
+                        early_exit = {'reason': reason, 'frame': current_frame}
+                        print(f"\n   ⏹️  {t('early_exit_' + reason).format(frame=current_frame, percent=min_bird_percentage)}")
+                        break
+            
+            # Tracks still open at the end of the video
+            if tracker is not None:
+                for bird in tracker.finish():
+                    finish_track(bird)
+            
+            # Classify the crops left in the last, partial batch
+            if species_queue is not None:
+                species_queue.flush()
+        finally:
+            for stage in reversed(stages):
+                stage.close()
+            source.release()
         
-        # Calculate statistics
-        bird_percentage = (frames_with_birds / frames_analyzed * 100) if frames_analyzed > 0 else 0
+        if track is not None:
+            track.finish()
         
-        # Find continuous bird segments
-        segments = self._find_bird_segments(bird_detections, fps, sample_rate)
+        # Calculate statistics
+        if sampler is not None:
+            # Variable stride: every sample counts for the frames it stands for
+            # (after an early exit only the analyzed part of the video)
+            weights = sample_weights(sample_frames, total_frames if early_exit is None else sample_frames[-1])
+            bird_percentage = weighted_share(weights, sample_birds)
+            frame_shares = dict(zip(sample_frames, (weights * 100 / max(float(np.sum(weights)), 1.0)).tolist()))
+            segments = self._find_bird_segments(
+                bird_detections, fps, sample_rate, max_gap=DEFAULT_MAX_GAP_SECONDS,
+                shares=[frame_shares[d['frame']] for d in bird_detections]
+            )
+        else:
+            bird_percentage = (frames_with_birds / frames_analyzed * 100) if frames_analyzed > 0 else 0
+            
+            # Find continuous bird segments
+            segments = self._find_bird_segments(bird_detections, fps, sample_rate)
         
         stats = {
             'video_file': video_path.name,
@@ -752,6 +1041,29 @@ class VideoAnalyzer:
             'model': str(self.model.ckpt_path if hasattr(self.model, 'ckpt_path') else 'unknown')
         }
         
+        if decoder != DEFAULT_DECODER:
+            stats['decoder'] = decoder
+        if keyframes_only:
+            stats['keyframes_only'] = True
+        
+        if box_scale is not None:
+            stats['detect_resolution'] = f"{source.scaled_width}x{source.scaled_height}"
+        
+        if gate is not None:
+            stats['frames_gated'] = gate.frames_gated
+        
+        if sampler is not None:
+            stats['adaptive_sampling'] = {
+                'fine_sample_rate': sampler.fine_step,
+                'relax_after': sampler.relax_after,
+            }
+            stats['frames_backfilled'] = sampler.frames_backfilled
+        
+        if tracker is not None:
+            visits.sort(key=lambda visit: (visit['start_frame'], visit['track_id']))
+            stats['bird_visits'] = len(visits)
+            stats['visits'] = visits
+        
         # Add species statistics if species identification was enabled
         if self.identify_species and SPECIES_AVAILABLE:
             # Extract all species detections from bird_detections
@@ -763,11 +1075,563 @@ class VideoAnalyzer:
             if all_species:
                 species_stats = aggregate_species_detections(all_species)
                 stats['species_stats'] = species_stats
+                
+                # Visits per species (one track = one visit)
+                if tracker is not None:
+                    for data in species_stats.values():
+                        data['visits'] = 0
+                    for visit in visits:
+                        if visit['species'] in species_stats:
+                            species_stats[visit['species']]['visits'] += 1
+        
+        if triage_info is not None:
+            stats['triage'] = triage_info
+        
+        if early_exit_enabled:
+            stats['early_terminated'] = early_exit is not None
+            if early_exit is not None:
+                stats['early_exit'] = early_exit
+        
+        self._store_cached(video_path, cache_params, stats)
         
         print(f"\n   ✅ {t('analysis_complete')}")
         return stats
+    
+    def _triage_video(self, video_path, confidence, interval, decoder=DEFAULT_DECODER, threads=0):
+        """
+        Coarse "bird or no bird" scan for analyze_video(triage=True)
+        
+        Checks keyframes (decoder="pyav") or frames ``interval`` seconds apart
+        (decoder="opencv") and stops at the first detection with at least
+        ``confidence``.
         
-    def _find_bird_segments(self, detections, fps, sample_rate):
+        Args:
+            video_path: Path to the video
+            confidence: Detection confidence that decides "bird"
+            interval: Minimum seconds between checked frames
+            decoder: Frame reader backend
+            threads: Decoder threads (0: backend default)
+            
+        Returns:
+            (stats, triage_info) tuple: analyze_video() statistics over the
+            checked frames when the scan decides (confident bird, or no
+            detection at all), otherwise None; and the 'triage' dict
+        """
+        keyframes = decoder == 'pyav'
+        source = open_frame_source(video_path, decoder, threads=threads, keyframes_only=keyframes)
+        total_frames = source.total_frames
+        fps = source.fps
+        width = source.width
+        height = source.height
+        step = max(1, int(round(interval * fps))) if fps > 0 else 1
+        print(f"   🔎 {t('triage_scan').format(frames=t('triage_keyframes') if keyframes else t('triage_frames'), seconds=interval)}")
+        
+        frames_checked = 0
+        weak_detections = False
+        found = None
+        try:
+            # Batch size 1: no frames are decoded past the deciding one
+            for sampled, result in self._iter_detections(source.iter_sampled(step), 1):
+                frames_checked += 1
+                _, bird_conf = self._filter_birds(result.boxes)
+                if len(bird_conf) and bird_conf.max() >= confidence:
+                    found = (sampled, len(bird_conf))
+                    break
+                weak_detections = weak_detections or len(bird_conf) > 0
+        finally:
+            source.release()
+        
+        triage_info = {'frames_checked': frames_checked, 'keyframes': keyframes}
+        if found is None and (weak_detections or frames_checked == 0):
+            # Ambiguous (or unreadable with this reader): full analysis decides
+            triage_info['result'] = 'escalated'
+            return None, triage_info
+        
+        bird_detections = []
+        if found is not None:
+            sampled, birds = found
+            timestamp = sampled.timestamp if sampled.timestamp is not None else (
+                (sampled.index + 1) / fps if fps > 0 else 0)
+            bird_detections.append({'frame': sampled.index + 1, 'timestamp': timestamp, 'birds': birds})
+        triage_info['result'] = 'bird' if found is not None else 'empty'
+        print(f"   {'🐦' if found is not None else '📭'} {t('triage_' + triage_info['result']).format(n=frames_checked)}")
+        
+        stats = {
+            'video_file': video_path.name,
+            'video_path': str(video_path),
+            'resolution': f"{width}x{height}",
+            'fps': fps,
+            'duration_seconds': total_frames / fps if fps > 0 else 0,
+            'total_frames': total_frames,
+            'frames_analyzed': frames_checked,
+            'sample_rate': step,
+            'frames_with_birds': len(bird_detections),
+            'bird_percentage': len(bird_detections) / frames_checked * 100,
+            'bird_detections': len(bird_detections),
+            'bird_segments': self._find_bird_segments(bird_detections, fps, step),
+            'detections': bird_detections,
+            'threshold': self.threshold,
+            'model': str(self.model.ckpt_path if hasattr(self.model, 'ckpt_path') else 'unknown'),
+            'triage': triage_info,
+        }
+        return stats, triage_info
+    
+    @staticmethod
+    def _early_exit_reason(frames_analyzed, frames_with_birds, expected_samples,
+                           stop_at_first_bird=False, min_bird_percentage=None):
+        """
+        Check whether an early-exit condition of analyze_video() is met
+        
+        The bird percentage bound is decided when even all remaining samples
+        cannot change the outcome: the birds found so far already reach it,
+        or they stay below it with every remaining sample a bird frame.
+        
+        Args:
+            frames_analyzed: Samples analyzed so far
+            frames_with_birds: Samples with birds so far
+            expected_samples: Samples of the whole video (0: unknown)
+            stop_at_first_bird: Stop at the first bird
+            min_bird_percentage: Bird percentage bound (None: disabled)
+            
+        Returns:
+            'first_bird', 'above_bound', 'below_bound' or None
+        """
+        if stop_at_first_bird and frames_with_birds:
+            return 'first_bird'
+        # Past the expected count the frame count metadata was wrong: no bound
+        if min_bird_percentage is not None and frames_analyzed < expected_samples:
+            if frames_with_birds * 100 >= min_bird_percentage * expected_samples:
+                return 'above_bound'
+            remaining = expected_samples - frames_analyzed
+            if (frames_with_birds + remaining) * 100 < min_bird_percentage * expected_samples:
+                return 'below_bound'
+        return None
+    
+    def _store_cached(self, video_path, cache_params, stats):
+        """Store analysis statistics in the result cache (if enabled)"""
+        if self.cache is None:
+            return
+        try:
+            self.cache.put(video_path, cache_params, stats)
+        except Exception as e:
+            # A read-only or locked cache must never fail the analysis
+            print(f"\n   ⚠️  {t('cache_write_failed')} {e}")
+    
+    @staticmethod
+    def _store_species(pending_frame, box_info, track, predictions):
+        """
+        Write the species result of one queued bird crop back to its frame
+        
+        Args:
+            pending_frame: Dict with the frame's detection 'entry', the number
+                           of crops still 'remaining' and an optional
+                           downscaled 'thumbnail' image
+            box_info: Track box dict of the crop
+            track: DetectionTrack or None
+            predictions: Filtered predictions (top_k=1) of the crop
+        """
+        entry = pending_frame['entry']
+        box_info['species'] = list(predictions)
+        if predictions:
+            species_info = predictions[0]
+            # Translate species name to current language
+            translated_name = BirdSpeciesClassifier.format_species_name(
+                species_info['label'], translate=True
+            )
+            entry.setdefault('species', []).append({
+                'species': translated_name,
+                'confidence': species_info['score']
+            })
+        
+        pending_frame['remaining'] -= 1
+        if pending_frame['remaining'] == 0:
+            # All crops of the frame are classified - offer the report thumbnail
+            if track is not None and pending_frame['thumbnail'] is not None and 'species' in entry:
+                best_score = max(s['confidence'] for s in entry['species'])
+                track.offer_thumbnail(entry['frame'], best_score, pending_frame['thumbnail'])
+            pending_frame['thumbnail'] = None
+    
+    @staticmethod
+    def _collect_track_crops(track_states, pending_frame, frame_boxes, frame, crops_per_track, keep_thumbnails,
+                             full_frame=None):
+        """
+        Register the boxes of a frame with their tracks and keep candidate crops
+        
+        Each track keeps its best `crops_per_track` crops, ranked by box
+        area × detection confidence, until it ends.
+        
+        Args:
+            track_states: Dict track_id -> {'members', 'crops'} (updated in place)
+            pending_frame: Pending frame dict (see _store_species)
+            frame_boxes: Track box dicts of the frame, with 'track_id'
+            frame: BGR frame
+            crops_per_track: Number of crops kept per track
+            keep_thumbnails: Keep a downscaled frame with each crop for the report
+            full_frame: Optional callable returning the full-resolution frame
+                        to crop from (called at most once, only if a crop is
+                        kept); default: crop from ``frame``
+        """
+        frame_number = pending_frame['entry']['frame']
+        thumbnail = None
+        crop_frame = frame if full_frame is None else None
+        for box_index, box_info in enumerate(frame_boxes):
+            state = track_states.setdefault(box_info['track_id'], {'members': [], 'crops': []})
+            state['members'].append((pending_frame, box_info))
+            
+            x1, y1, x2, y2 = box_info['bbox']
+            score = (x2 - x1) * (y2 - y1) * box_info['conf']
+            crops = state['crops']
+            if len(crops) >= crops_per_track and score <= crops[0][0]:
+                continue
+            if crop_frame is None:
+                crop_frame = full_frame()
+            crop = BirdSpeciesClassifier.crop_image(crop_frame, box_info['bbox'])
+            if crop is None:
+                continue
+            if keep_thumbnails and thumbnail is None:
+                thumbnail = thumbnail_image(frame)
+            candidate = (score, frame_number, box_index, crop, thumbnail)
+            if len(crops) < crops_per_track:
+                heapq.heappush(crops, candidate)
+            else:
+                heapq.heapreplace(crops, candidate)
+    
+    def _finish_bird_track(self, bird, track_states, species_queue, track, visits, fps, frame_times=None):
+        """
+        Classify the kept crops of an ended track and record the visit
+        
+        The crops go through the shared species queue; once all of them are
+        classified the voted species is written to every box of the track.
+        
+        Args:
+            bird: Ended BirdTrack
+            track_states: Dict track_id -> {'members', 'crops'}
+            species_queue: SpeciesCropQueue or None (tracking without species)
+            track: DetectionTrack or None
+            visits: List the visit record is appended to
+            fps: Video frame rate
+            frame_times: Optional dict frame number -> presentation timestamp;
+                         frames without an entry use frame / fps
+        """
+        state = track_states.pop(bird.track_id, None)
+        frame_times = frame_times or {}
+        
+        def frame_time(frame_number):
+            if frame_number in frame_times:
+                return frame_times[frame_number]
+            return frame_number / fps if fps > 0 else 0
+        
+        def record(best):
+            visits.append({
+                'track_id': bird.track_id,
+                'start_frame': bird.first_frame,
+                'end_frame': bird.last_frame,
+                'start_time': frame_time(bird.first_frame),
+                'end_time': frame_time(bird.last_frame),
+                'detections': bird.hits,
+                'species': BirdSpeciesClassifier.format_species_name(best['label'], translate=True) if best else None,
+                'confidence': best['score'] if best else None,
+            })
+        
+        if species_queue is None or state is None:
+            record(None)
+            return
+        
+        crops = sorted(state['crops'], key=lambda candidate: candidate[:3], reverse=True)
+        
+        def resolve(results):
+            best = vote_species(results)
+            predictions = [best] if best else []
+            for pending_frame, box_info in state['members']:
+                self._store_species(pending_frame, box_info, track, predictions)
+            if best and track is not None:
+                for _, frame_number, _, _, thumbnail in crops:
+                    if thumbnail is not None:
+                        track.offer_thumbnail(frame_number, best['score'], thumbnail)
+            record(best)
+        
+        if not crops:
+            resolve([])
+            return
+        
+        results = []
+        
+        def on_result(predictions):
+            results.append(predictions)
+            if len(results) == len(crops):
+                resolve(results)
+        
+        for candidate in crops:
+            species_queue.add(candidate[3], on_result)
+    
+    def _analysis_params(self, sample_rate, track_birds=False, crops_per_track=DEFAULT_CROPS_PER_TRACK,
+                         motion_threshold=None, adaptive=None, detect_width=None,
+                         decoder=DEFAULT_DECODER, keyframes_only=False, triage=None,
+                         early_exit=(False, None)):
+        """
+        Collect every setting that influences analyze_video() results
+        
+        Used as part of the AnalysisCache key.
+        
+        Args:
+            sample_rate: Frame sample rate of the analysis
+            track_birds: Per-visit tracking enabled
+            crops_per_track: Classified crops per track
+            motion_threshold: Motion gate threshold (None: gate disabled)
+            adaptive: (fine_sample_rate, relax_after) of adaptive sampling
+                      (None: fixed sample rate)
+            detect_width: Width of the downscaled detection frames
+                          (None: full resolution)
+            decoder: Frame reader backend (timestamps differ between backends)
+            keyframes_only: Keyframe-only decoding
+            triage: (confidence, interval) of the triage scan (None: disabled)
+            early_exit: (stop_at_first_bird, min_bird_percentage) early-exit
+                        conditions
+            
+        Returns:
+            JSON-serialisable dict
+        """
+        params = {
+            'model': self._model_source,
+            'threshold': self.threshold,
+            'target_class': self.target_class,
+            'sample_rate': sample_rate,
+            'identify_species': bool(self.identify_species and self.species_classifier),
+        }
+        
+        # Only added when enabled, so existing cache entries stay valid
+        if track_birds:
+            params['track_birds'] = True
+            params['crops_per_track'] = crops_per_track
+        if motion_threshold is not None:
+            params['motion_threshold'] = motion_threshold
+        if adaptive is not None:
+            params['adaptive_sampling'] = list(adaptive)
+        if detect_width:
+            params['detect_width'] = detect_width
+        if decoder != DEFAULT_DECODER:
+            params['decoder'] = decoder
+        if keyframes_only:
+            params['keyframes_only'] = True
+        if triage is not None:
+            params['triage'] = list(triage)
+        if early_exit[0]:
+            params['stop_at_first_bird'] = True
+        if early_exit[1] is not None:
+            params['min_bird_percentage'] = early_exit[1]
+        
+        # Local model files: a retrained model with the same name is a miss
+        model_file = Path(self._model_source)
+        if model_file.is_file():
+            model_stat = model_file.stat()
+            params['model_file'] = [model_stat.st_size, model_stat.st_mtime_ns]
+        
+        if params['identify_species']:
+            params['species_model'] = self.species_classifier.model_name
+            params['species_threshold'] = self.species_classifier.confidence_threshold
+            if getattr(self.species_classifier, 'fast_preprocess', False):
+                params['species_fast_preprocess'] = True
+            if getattr(self.species_classifier, 'engine', 'transformers') != 'transformers':
+                params['species_engine'] = self.species_classifier.engine
+        
+        return params
+        
+    @staticmethod
+    def _decoder_label(decoder, threads=0, keyframes_only=False):
+        """Human-readable decoder description for the progress output"""
+        details = []
+        if threads:
+            details.append(f"{threads} threads")
+        if keyframes_only:
+            details.append(t('decoder_keyframes_only'))
+        name = {'opencv': 'OpenCV', 'pyav': 'PyAV'}.get(decoder, decoder)
+        return f"{name} ({', '.join(details)})" if details else name
+    
+    def _detect_batch(self, images):
+        """
+        Run the detector on a list of frames
+        
+        Ultralytics models and engines with ``supports_batch`` (HailoDetector)
+        receive the whole list as one batch. Other engines (OnnxDetector) are
+        called once per frame.
+        
+        Args:
+            images: List of BGR frames
+            
+        Returns:
+            List with one detection result (having a .boxes attribute) per frame
+        """
+        if len(images) > 1 and (getattr(self.model, 'supports_batch', False)
+                                or type(self.model).__module__.startswith('ultralytics')):
+            return list(self.model(images, verbose=False))
+        return [self.model(image, verbose=False)[0] for image in images]
+    
+    def _filter_birds(self, boxes, scale=None):
+        """
+        Select target-class boxes above the detection threshold
+        
+        The detector output is converted to one NumPy array per frame
+        (a single device transfer) and filtered with a mask instead of
+        reading every box tensor separately.
+        
+        Args:
+            boxes: ultralytics Boxes or HailoDetector _MockBoxes
+            scale: Optional (x, y) factors mapping box coordinates of a
+                   downscaled frame to the original resolution
+            
+        Returns:
+            (xyxy, conf) tuple: (N, 4) int array of pixel coordinates and
+            (N,) float64 array of confidences of the kept boxes
+        """
+        if boxes is None or len(boxes) == 0:
+            return np.empty((0, 4), dtype=int), np.empty(0)
+        
+        data = boxes.data
+        if hasattr(data, 'cpu'):
+            data = data.cpu().numpy()
+        data = np.asarray(data)
+        
+        # Columns: x1, y1, x2, y2, [track_id,] conf, cls
+        conf = data[:, -2].astype(np.float64)
+        cls = data[:, -1].astype(int)
+        mask = (cls == self.target_class) & (conf >= self.threshold)
+        xyxy = data[mask, :4]
+        if scale is not None:
+            xyxy = xyxy * np.array([scale[0], scale[1], scale[0], scale[1]])
+        return xyxy.astype(int), conf[mask]
+    
+    def _iter_detections(self, frames, batch_size=DEFAULT_BATCH_SIZE, gate=None, previous=None):
+        """
+        Group sampled frames into batches and run the detector on each batch
+        
+        Engines with an asynchronous submit/collect API (HailoDetector) keep
+        one batch in flight: the next batch is read and preprocessed while
+        the accelerator still works on the previous one.
+        
+        Args:
+            frames: Iterable of VideoFrame objects
+            batch_size: Maximum number of frames per detector call
+            gate: Optional MotionGate. Frames it rejects are not sent to the
+                  detector and get the result of the previous detector frame.
+            previous: Result of the last detector frame before ``frames``
+                      (for gated frames at the start)
+            
+        Yields:
+            (VideoFrame, result) tuples in input order
+        """
+        batch_size = max(1, int(batch_size))
+        batches = self._group_batches(frames, batch_size, gate)
+        if hasattr(self.model, 'submit') and hasattr(self.model, 'collect'):
+            batch_results = self._iter_batch_results_async(batches)
+        else:
+            batch_results = (
+                (batch, self._detect_batch([frame.image for frame, run in batch if run]))
+                for batch in batches
+            )
+        
+        result = previous
+        for batch, results in batch_results:
+            results = iter(results)
+            for frame, run in batch:
+                if run:
+                    result = next(results)
+                yield frame, result
+    
+    def _iter_adaptive_detections(self, source, sampler, batch_size, gate=None):
+        """
+        Decode and detect the frames chosen by an AdaptiveSampler
+        
+        Scheduled frames are detected one at a time, since each result
+        decides the next frame. When a bird appears during coarse sampling
+        the skipped frames since the previous sample are read back and
+        detected (in batches) before the frame itself is yielded.
+        
+        Args:
+            source: Open frame source (see open_frame_source)
+            sampler: AdaptiveSampler
+            batch_size: Maximum number of backfill frames per detector call
+            gate: Optional MotionGate
+            
+        Yields:
+            (VideoFrame, result) tuples in frame order
+        """
+        index = sampler.first_index
+        result = None
+        while source.total_frames <= 0 or index < source.total_frames:
+            sampled = source.read_frame(index)
+            if sampled is None:
+                break
+            ((frame, result),) = self._iter_detections([sampled], 1, gate, result)
+            backfill, index = sampler.update(frame.index, len(self._filter_birds(result.boxes)[1]) > 0)
+            
+            if backfill:
+                earlier = (
+                    earlier_frame
+                    for earlier_frame in map(source.read_frame, backfill)
+                    if earlier_frame is not None
+                )
+                yield from self._iter_detections(earlier, batch_size, gate, result)
+            yield frame, result
+    
+    def _iter_batch_results_async(self, batches):
+        """
+        Run batches on an engine with submit()/collect(), one batch in flight
+        
+        Args:
+            batches: Iterable of batches from _group_batches()
+            
+        Yields:
+            (batch, results) tuples in input order
+        """
+        in_flight = deque()  # (batch, submitted)
+        try:
+            for batch in batches:
+                images = [frame.image for frame, run in batch if run]
+                if images:
+                    self.model.submit(images)
+                in_flight.append((batch, bool(images)))
+                if len(in_flight) > 1:
+                    batch, submitted = in_flight.popleft()
+                    yield batch, self.model.collect() if submitted else []
+            while in_flight:
+                batch, submitted = in_flight.popleft()
+                yield batch, self.model.collect() if submitted else []
+        finally:
+            # Abandoned early (error or consumer stopped): drop leftover results
+            while in_flight:
+                if in_flight.popleft()[1]:
+                    try:
+                        self.model.collect()
+                    except Exception:
+                        pass
+    
+    @staticmethod
+    def _group_batches(frames, batch_size, gate=None):
+        """
+        Split frames into batches of at most batch_size detector frames
+        
+        Args:
+            frames: Iterable of VideoFrame objects
+            batch_size: Maximum number of detector frames per batch
+            gate: Optional MotionGate deciding which frames need the detector
+            
+        Yields:
+            Lists of (VideoFrame, run_detector) tuples
+        """
+        batch = []
+        detector_frames = 0
+        for frame in frames:
+            run = gate is None or gate.check(frame.image)
+            batch.append((frame, run))
+            detector_frames += run
+            if detector_frames >= batch_size:
+                yield batch
+                batch = []
+                detector_frames = 0
+        if batch:
+            yield batch
+    
+    def _find_bird_segments(self, detections, fps, sample_rate, max_gap=None, shares=None):
         """
         Find continuous time segments with bird presence
         
@@ -775,6 +1639,10 @@ class VideoAnalyzer:
             detections: List of bird detections
             fps: Video FPS
             sample_rate: Frame sample rate
+            max_gap: Largest gap in seconds between detections of one segment
+                     (default: 2 × sample_rate)
+            shares: Optional percentage of the video each detection stands
+                    for (variable stride); segments then get a 'share' key
             
         Returns:
             List of segments with start/end times
@@ -784,9 +1652,10 @@ class VideoAnalyzer:
             
         segments = []
         current_segment = None
-        max_gap = 2.0 * sample_rate  # Max 2 second gap
+        if max_gap is None:
+            max_gap = 2.0 * sample_rate  # Max 2 second gap
         
-        for detection in detections:
+        for index, detection in enumerate(detections):
             timestamp = detection['timestamp']
             
             if current_segment is None:
@@ -808,6 +1677,8 @@ class VideoAnalyzer:
                     'end': timestamp,
                     'detections': 1
                 }
+            if shares is not None:
+                current_segment['share'] = current_segment.get('share', 0.0) + shares[index]
                 
         # Add last segment
         if current_segment:
@@ -830,6 +1701,18 @@ class VideoAnalyzer:
         print(f"⏱️  {t('report_duration')} {stats['duration_seconds']:.1f} {t('report_seconds')}")
         print(f"🐦 {t('report_bird_frames')} {stats['frames_with_birds']} ({stats['bird_percentage']:.1f}%)")
         print(f"🎯 {t('report_bird_segments')} {len(stats['bird_segments'])}")
+        if 'bird_visits' in stats:
+            print(f"👣 {t('report_bird_visits')} {stats['bird_visits']}")
+        if 'frames_gated' in stats:
+            print(f"🌙 {t('report_frames_gated')} {stats['frames_gated']}/{stats['frames_analyzed']}")
+        if 'detect_resolution' in stats:
+            print(f"🔬 {t('report_detect_resolution')} {stats['detect_resolution']}")
+        if stats.get('early_terminated'):
+            print(f"⏹️  {t('report_early_exit')} {t('report_early_exit_' + stats['early_exit']['reason']).format(frame=stats['early_exit']['frame'])}")
+        if 'triage' in stats:
+            print(f"🔎 {t('report_triage')} {t('report_triage_' + stats['triage']['result']).format(n=stats['triage']['frames_checked'])}")
+        if 'adaptive_sampling' in stats:
+            print(f"🎚️  {t('report_adaptive_sampling').format(coarse=stats['sample_rate'], fine=stats['adaptive_sampling']['fine_sample_rate'], n=stats['frames_backfilled'])}")
         
         if stats['bird_segments']:
             print(f"\n📍 {t('report_detected_segments')}")
@@ -837,7 +1720,10 @@ class VideoAnalyzer:
                 start = timedelta(seconds=int(segment['start']))
                 end = timedelta(seconds=int(segment['end']))
                 duration = segment['end'] - segment['start']
-                bird_pct = (segment['detections'] / stats['frames_analyzed']) * 100
+                if 'share' in segment:
+                    bird_pct = segment['share']
+                else:
+                    bird_pct = (segment['detections'] / stats['frames_analyzed']) * 100
                 print(f"  {'┌' if i == 1 else '├'} {t('report_segment')} {i}: {start} - {end} ({bird_pct:.0f}% {t('report_bird_frames_short')})")
                 if i == len(stats['bird_segments']):
                     print(f"  └")
@@ -865,13 +1751,16 @@ class VideoAnalyzer:
                     count = data['count']
                     avg_conf = data['avg_confidence']
                     print(f"  • {translated_name}")
-                    print(f"    {t('species_detections').format(detections=count)} ({t('species_avg_confidence')}: {avg_conf:.2f})")
+                    detections_text = t('species_detections').format(detections=count)
+                    if 'visits' in data:
+                        detections_text += f", {t('species_visits').format(visits=data['visits'])}"
+                    print(f"    {detections_text} ({t('species_avg_confidence')}: {avg_conf:.2f})")
             else:
                 print(f"   {t('species_no_detections')}")
         
         print("━" * 70)
 
-    def annotate_video(self, video_path, output_path, sample_rate=1, show_timestamp=True, show_confidence=True, box_color=(0, 255, 0), text_color=(255, 255, 255), multilingual=False, font_size=20, flag_dir=None):
+    def annotate_video(self, video_path, output_path, sample_rate=1, show_timestamp=True, show_confidence=True, box_color=(0, 255, 0), text_color=(255, 255, 255), multilingual=False, font_size=20, flag_dir=None, track=None, writer="auto", preset=DEFAULT_PRESET, crf=DEFAULT_CRF, decoder=DEFAULT_DECODER, decode_threads=0):
         """
         Create annotated video with bounding boxes and species labels
         
@@ -887,6 +1776,18 @@ class VideoAnalyzer:
             font_size: Font size for species labels (default: 20)
             flag_dir: Directory containing flag image files (optional, default: assets/flags/)
                      If None, uses pixel-rendered flags for DE, GB, JP
+            track: Completed DetectionTrack from analyze_video(). If given, its
+                   detections are drawn and no detection is run (sample_rate
+                   is taken from the track)
+            writer: Output backend - "ffmpeg" pipes frames into ffmpeg (H.264,
+                    original audio muxed in the same pass), "opencv" uses
+                    cv2.VideoWriter (mp4v) plus a separate audio merge,
+                    "auto" prefers ffmpeg if installed (default: "auto")
+            preset: x264 preset of the ffmpeg writer (default: "medium")
+            crf: x264 constant rate factor of the ffmpeg writer (default: 23)
+            decoder: Frame reader backend, "opencv" or "pyav" (PyAV also
+                     shows the real presentation time; default: "opencv")
+            decode_threads: Decoder threads (default: 0 = backend default)
             
         Returns:
             dict with processing statistics
@@ -911,47 +1812,60 @@ class VideoAnalyzer:
         print(f"{t('annotation_output')} {output_path}")
         
         # Open input video
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
-            raise RuntimeError(t('cannot_open_video').format(path=str(video_path)))
+        source = open_frame_source(video_path, decoder, threads=decode_threads)
             
         # Video properties
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        
-        # Handle high framerates that exceed codec limits
-        # MPEG4 timebase denominator max is 65535, which limits FPS to ~65
-        output_fps = fps
-        if fps > 60:
-            output_fps = 30.0  # Reduce to standard 30 FPS for compatibility
-            print(f"   ℹ️  Original FPS ({fps:.1f}) exceeds codec limits, reducing output to {output_fps} FPS")
-        
-        # Create output video writer
-        # Try different codecs for better compatibility
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(str(output_path), fourcc, output_fps, (width, height))
-        
-        # Check if writer opened successfully
-        if not out.isOpened():
-            # Fallback to XVID with AVI container
-            print(f"   ⚠️  MP4V codec not available, trying XVID with AVI...")
-            fourcc = cv2.VideoWriter_fourcc(*'XVID')
-            output_path_avi = output_path.parent / (output_path.stem + '.avi')
-            out = cv2.VideoWriter(str(output_path_avi), fourcc, output_fps, (width, height))
+        total_frames = source.total_frames
+        fps = source.fps
+        width = source.width
+        height = source.height
+        
+        # Stream frames into ffmpeg when available: H.264 encoding and audio
+        # muxing in one pass, no second copy of the output file
+        use_ffmpeg = writer == "ffmpeg" or (writer == "auto" and FFmpegVideoWriter.available())
+        if use_ffmpeg:
+            output_fps = fps
+            out = FFmpegVideoWriter(output_path, fps, width, height,
+                                    audio_source=video_path, preset=preset, crf=crf)
+            print(f"   🎞️  {t('annotation_ffmpeg_writer').format(preset=preset, crf=crf)}")
+        else:
+            # Handle high framerates that exceed codec limits
+            # MPEG4 timebase denominator max is 65535, which limits FPS to ~65
+            output_fps = fps
+            if fps > 60:
+                output_fps = 30.0  # Reduce to standard 30 FPS for compatibility
+                print(f"   ℹ️  Original FPS ({fps:.1f}) exceeds codec limits, reducing output to {output_fps} FPS")
+            
+            # Create output video writer
+            # Try different codecs for better compatibility
+            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+            out = cv2.VideoWriter(str(output_path), fourcc, output_fps, (width, height))
+            
+            # Check if writer opened successfully
             if not out.isOpened():
-                raise RuntimeError(f"Could not open video writer. Try installing ffmpeg: sudo apt install ffmpeg")
-            output_path = output_path_avi
-            print(f"   ℹ️  Output changed to: {output_path}")
+                # Fallback to XVID with AVI container
+                print(f"   ⚠️  MP4V codec not available, trying XVID with AVI...")
+                fourcc = cv2.VideoWriter_fourcc(*'XVID')
+                output_path_avi = output_path.parent / (output_path.stem + '.avi')
+                out = cv2.VideoWriter(str(output_path_avi), fourcc, output_fps, (width, height))
+                if not out.isOpened():
+                    raise RuntimeError(f"Could not open video writer. Try installing ffmpeg: sudo apt install ffmpeg")
+                output_path = output_path_avi
+                print(f"   ℹ️  Output changed to: {output_path}")
         
         print(f"   📊 {t('annotation_video_info').format(width=width, height=height, fps=f'{fps:.1f}', output_fps=f'{output_fps:.1f}', frames=total_frames)}")
+        
+        # Reuse the detections of a previous analyze_video() pass
+        use_track = track is not None and track.complete
+        if use_track:
+            sample_rate = track.sample_rate
+            analyzed_frames = set(track.analyzed_frames)
+            print(f"   ♻️  {t('track_reused')}")
         print(f"   🔍 {t('annotation_processing').format(n=sample_rate)}")
 
 
         
         # Processing variables
-        current_frame = 0
         frames_processed = 0
         total_birds_detected = 0
         
@@ -959,301 +1873,250 @@ class VideoAnalyzer:
         last_detections = []
         last_birds_count = 0
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-                
-            current_frame += 1
-            annotated_frame = frame.copy()
+        # Every frame is written, so every frame is decoded here
+        try:
+            for decoded in source.iter_frames():
+                frame = decoded.image
+                current_frame = decoded.index + 1
+                annotated_frame = frame.copy()
+            
+                # Process frame if matches sample rate
+                if use_track:
+                    process_frame = current_frame in analyzed_frames
+                else:
+                    process_frame = current_frame % sample_rate == 0
             
-            # Process frame if matches sample rate
-            if current_frame % sample_rate == 0:
-                frames_processed += 1
+                if process_frame:
+                    frames_processed += 1
                 
-                # YOLO inference
-                results = self.model(frame, verbose=False)
+                    if use_track:
+                        frame_boxes = track.boxes_at(current_frame)
+                    else:
+                        # YOLO inference + species identification
+                        frame_boxes = self._detect_frame_boxes(frame)
                 
-                # Clear and rebuild detection cache
-                last_detections = []
-                birds_in_frame = 0
-                bird_bboxes = []  # Collect all bounding boxes for batch processing
-                bird_boxes_info = []  # Store YOLO box info
+                    birds_in_frame = len(frame_boxes)
+                    total_birds_detected += birds_in_frame
                 
-                for result in results:
-                    boxes = result.boxes
-                    for box in boxes:
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        
-                        if cls == self.target_class and conf >= self.threshold:
-                            birds_in_frame += 1
-                            total_birds_detected += 1
-                            
-                            # Get bounding box coordinates
-                            xyxy = box.xyxy[0].cpu().numpy()
-                            x1, y1, x2, y2 = int(xyxy[0]), int(xyxy[1]), int(xyxy[2]), int(xyxy[3])
-                            
-                            # Store box info for batch processing
-                            bird_bboxes.append((x1, y1, x2, y2))
-                            bird_boxes_info.append({
-                                'bbox': (x1, y1, x2, y2),
-                                'conf': conf
-                            })
-                
-                # Batch process all bird crops at once (GPU-efficient)
-                if bird_bboxes and self.identify_species and self.species_classifier:
-                    try:
-                        batch_predictions = self.species_classifier.classify_crops_batch(
-                            frame, bird_bboxes, top_k=1
-                        )
-                        
-                        for idx, (predictions, box_info) in enumerate(zip(batch_predictions, bird_boxes_info)):
-                            species_label = None
-                            skip_detection = False
-                            
-                            if predictions:
-                                species_info = predictions[0]
-                                
-                                # Use multilingual name if requested
-                                if multilingual:
-                                    # Use full Unicode format with emojis if PIL available
-                                    bird_name = BirdSpeciesClassifier.get_multilingual_name(
-                                        species_info['label'].upper(), 
-                                        show_flags=PIL_AVAILABLE,
-                                        opencv_compatible=not PIL_AVAILABLE
-                                    )
-                                else:
-                                    bird_name = BirdSpeciesClassifier.format_species_name(
-                                        species_info['label'], translate=True
-                                    )
-                                
-                                if show_confidence:
-                                    species_label = f"{bird_name} {species_info['score']:.0%}"
-                                else:
-                                    species_label = bird_name
-                            else:
-                                # No species passed threshold - skip this detection entirely
-                                skip_detection = True
-                            
-                            # Fallback if species_label is still None
-                            if species_label is None and not skip_detection:
-                                # No species classification enabled - show as generic bird
-                                if show_confidence:
-                                    species_label = f"Bird {box_info['conf']:.0%}"
-                                else:
-                                    species_label = "Bird"
-                            
-                            # Store detection for reuse (only if not skipped)
-                            if not skip_detection and species_label is not None:
-                                last_detections.append({
-                                    'bbox': box_info['bbox'],
-                                    'label': species_label
-                                })
-                    except Exception as e:
-                        # On error, fall back to generic bird labels
-                        for box_info in bird_boxes_info:
-                            if show_confidence:
-                                species_label = f"Bird {box_info['conf']:.0%}"
-                            else:
-                                species_label = "Bird"
-                            last_detections.append({
-                                'bbox': box_info['bbox'],
-                                'label': species_label
-                            })
-                elif bird_boxes_info:
-                    # No species identification - show generic bird labels
-                    for box_info in bird_boxes_info:
-                        if show_confidence:
-                            species_label = f"Bird {box_info['conf']:.0%}"
-                        else:
-                            species_label = "Bird"
-                        last_detections.append({
-                            'bbox': box_info['bbox'],
-                            'label': species_label
-                        })
+                    # Rebuild detection cache
+                    last_detections = self._label_boxes(frame_boxes, show_confidence, multilingual)
                 
-                last_birds_count = birds_in_frame
+                    last_birds_count = birds_in_frame
             
-            # Draw all cached detections (even on non-processed frames)
-            for detection in last_detections:
-                x1, y1, x2, y2 = detection['bbox']
-                label = detection['label']
+                # Draw all cached detections (even on non-processed frames)
+                for detection in last_detections:
+                    x1, y1, x2, y2 = detection['bbox']
+                    label = detection['label']
                 
-                # Draw bounding box
-                cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), box_color, 2)
+                    # Draw bounding box
+                    cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), box_color, 2)
                 
-                # Use PIL for Unicode text if available, otherwise fallback to cv2
-                if PIL_AVAILABLE and multilingual:
-                    # Extract bird name and confidence
-                    if '%' in label:
-                        bird_part, conf_part = label.rsplit(' ', 1)
-                    else:
-                        bird_part = label
-                        conf_part = ""
+                    # Use PIL for Unicode text if available, otherwise fallback to cv2
+                    if PIL_AVAILABLE and multilingual:
+                        # Extract bird name and confidence
+                        if '%' in label:
+                            bird_part, conf_part = label.rsplit(' ', 1)
+                        else:
+                            bird_part = label
+                            conf_part = ""
                     
-                    # Get individual translations
-                    try:
-                        species_display = bird_part  # Already just the German name, no emojis
-                        from .species_classifier import GERMAN_TO_ENGLISH, BIRD_NAME_TRANSLATIONS, ENGLISH_NAMES
-                        species_key = GERMAN_TO_ENGLISH.get(species_display.lower())
+                        # Get individual translations
+                        try:
+                            species_display = bird_part  # Already just the German name, no emojis
+                            from .species_classifier import GERMAN_TO_ENGLISH, BIRD_NAME_TRANSLATIONS, ENGLISH_NAMES
+                            species_key = GERMAN_TO_ENGLISH.get(species_display.lower())
                         
-                        if species_key:
-                            # Get translations (use proper English names from dictionary)
-                            en_name = ENGLISH_NAMES.get(species_key, ' '.join(word.capitalize() for word in species_key.split()))
-                            de_name = BIRD_NAME_TRANSLATIONS.get('de', {}).get(species_key, en_name)
-                            ja_name = BIRD_NAME_TRANSLATIONS.get('ja', {}).get(species_key, en_name)
+                            if species_key:
+                                # Get translations (use proper English names from dictionary)
+                                en_name = ENGLISH_NAMES.get(species_key, ' '.join(word.capitalize() for word in species_key.split()))
+                                de_name = BIRD_NAME_TRANSLATIONS.get('de', {}).get(species_key, en_name)
+                                ja_name = BIRD_NAME_TRANSLATIONS.get('ja', {}).get(species_key, en_name)
                             
-                            # Multiline format with flag icons (hybrid rendering: PNG files if available, pixel fallback)
-                            # Line 1: 🇬🇧 English name
-                            # Line 2: 🇩🇪 German name
-                            # Line 3: 🇯🇵 Japanese name
-                            # Line 4: Confidence
-                            lines = [
-                                (en_name, 'gb'),  # Text + country code (loads PNG if available)
-                                (de_name, 'de'),
-                                (ja_name, 'jp'),
-                                (conf_part, None)  # No icon for confidence
-                            ]
-                        else:
+                                # Multiline format with flag icons (hybrid rendering: PNG files if available, pixel fallback)
+                                # Line 1: 🇬🇧 English name
+                                # Line 2: 🇩🇪 German name
+                                # Line 3: 🇯🇵 Japanese name
+                                # Line 4: Confidence
+                                lines = [
+                                    (en_name, 'gb'),  # Text + country code (loads PNG if available)
+                                    (de_name, 'de'),
+                                    (ja_name, 'jp'),
+                                    (conf_part, None)  # No icon for confidence
+                                ]
+                            else:
+                                lines = [(label, None)]
+                        except:
                             lines = [(label, None)]
-                    except:
-                        lines = [(label, None)]
                     
-                    # Draw multiline with configurable font size
-                    line_height = int(font_size * 1.4)  # Dynamic line height based on font size
-                    total_height = len(lines) * line_height + 12  # Less padding
+                        # Draw multiline with configurable font size
+                        line_height = int(font_size * 1.4)  # Dynamic line height based on font size
+                        total_height = len(lines) * line_height + 12  # Less padding
                     
-                    # Calculate position - place box to the RIGHT of the bounding box
-                    box_x_start = x2 + 10  # 10px gap to the right of bird box
-                    box_y_start = y1
+                        # Calculate position - place box to the RIGHT of the bounding box
+                        box_x_start = x2 + 10  # 10px gap to the right of bird box
+                        box_y_start = y1
                     
-                    # Dynamic width based on font size
-                    box_width = int(font_size * 16)
-                    box_y_end = box_y_start + total_height
+                        # Dynamic width based on font size
+                        box_width = int(font_size * 16)
+                        box_y_end = box_y_start + total_height
                     
-                    # Semi-transparent white background using PIL for better control
-                    # Create overlay with alpha channel
-                    overlay = annotated_frame.copy()
-                    cv2.rectangle(
-                        overlay,
-                        (box_x_start, box_y_start),
-                        (box_x_start + box_width, box_y_end),
-                        (255, 255, 255),  # White background
-                        -1
-                    )
-                    # Blend with original (0.7 = 70% opaque, 30% transparent)
-                    cv2.addWeighted(overlay, 0.7, annotated_frame, 0.3, 0, annotated_frame)
+                        # Semi-transparent white background using PIL for better control
+                        # Create overlay with alpha channel
+                        overlay = annotated_frame.copy()
+                        cv2.rectangle(
+                            overlay,
+                            (box_x_start, box_y_start),
+                            (box_x_start + box_width, box_y_end),
+                            (255, 255, 255),  # White background
+                            -1
+                        )
+                        # Blend with original (0.7 = 70% opaque, 30% transparent)
+                        cv2.addWeighted(overlay, 0.7, annotated_frame, 0.3, 0, annotated_frame)
                     
-                    # Draw each line with black text and emoji icons
-                    for i, line_data in enumerate(lines):
-                        # Unpack line text and emoji
-                        if isinstance(line_data, tuple):
-                            line_text, emoji = line_data
-                        else:
-                            line_text, emoji = line_data, None
+                        # Draw each line with black text and emoji icons
+                        for i, line_data in enumerate(lines):
+                            # Unpack line text and emoji
+                            if isinstance(line_data, tuple):
+                                line_text, emoji = line_data
+                            else:
+                                line_text, emoji = line_data, None
                         
-                        # Slightly larger font for confidence percentage
-                        current_font_size = font_size if i < len(lines) - 1 else int(font_size * 1.1)
-                        annotated_frame = put_unicode_text(
-                            annotated_frame,
-                            line_text,
-                            (box_x_start + 8, box_y_start + 8 + i * line_height),
-                            font_size=current_font_size,
-                            color=(0, 0, 0),  # Black text
-                            bg_color=None,  # Background already drawn with transparency
-                            emoji_prefix=emoji,  # Add emoji/flag icon
-                            flag_dir=flag_dir  # Pass flag directory for hybrid rendering
+                            # Slightly larger font for confidence percentage
+                            current_font_size = font_size if i < len(lines) - 1 else int(font_size * 1.1)
+                            annotated_frame = put_unicode_text(
+                                annotated_frame,
+                                line_text,
+                                (box_x_start + 8, box_y_start + 8 + i * line_height),
+                                font_size=current_font_size,
+                                color=(0, 0, 0),  # Black text
+                                bg_color=None,  # Background already drawn with transparency
+                                emoji_prefix=emoji,  # Add emoji/flag icon
+                                flag_dir=flag_dir  # Pass flag directory for hybrid rendering
+                            )
+                    else:
+                        # Fallback to OpenCV text (ASCII only)
+                        (text_width, text_height), baseline = cv2.getTextSize(
+                            label, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 3
                         )
-                else:
-                    # Fallback to OpenCV text (ASCII only)
-                    (text_width, text_height), baseline = cv2.getTextSize(
-                        label, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 3
-                    )
                     
-                    # Background rectangle
-                    cv2.rectangle(
-                        annotated_frame,
-                        (x1, y1 - text_height - 15),
-                        (x1 + text_width + 15, y1),
-                        box_color,
-                        -1
-                    )
+                        # Background rectangle
+                        cv2.rectangle(
+                            annotated_frame,
+                            (x1, y1 - text_height - 15),
+                            (x1 + text_width + 15, y1),
+                            box_color,
+                            -1
+                        )
                     
-                    # Text
-                    cv2.putText(
-                        annotated_frame,
-                        label,
-                        (x1 + 7, y1 - 7),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.9,
-                        text_color,
-                        3
-                    )
+                        # Text
+                        cv2.putText(
+                            annotated_frame,
+                            label,
+                            (x1 + 7, y1 - 7),
+                            cv2.FONT_HERSHEY_SIMPLEX,
+                            0.9,
+                            text_color,
+                            3
+                        )
             
-            # Add frame info overlay
-            if show_timestamp:
-                timestamp = current_frame / fps if fps > 0 else 0
-                timestamp_str = str(timedelta(seconds=int(timestamp)))
-                info_text = f"Frame: {current_frame}/{total_frames} | Time: {timestamp_str}"
+                # Add frame info overlay
+                if show_timestamp:
+                    if decoded.timestamp is not None:
+                        timestamp = decoded.timestamp
+                    else:
+                        timestamp = current_frame / fps if fps > 0 else 0
+                    timestamp_str = str(timedelta(seconds=int(timestamp)))
+                    info_text = f"Frame: {current_frame}/{total_frames} | Time: {timestamp_str}"
                 
-                if last_birds_count > 0:
-                    info_text += f" | Birds: {last_birds_count}"
+                    if last_birds_count > 0:
+                        info_text += f" | Birds: {last_birds_count}"
                 
-                # Use PIL with same font size as species labels
-                if PIL_AVAILABLE:
-                    # Calculate scale factor from font_size to cv2 scale
-                    cv2_scale = font_size / 30.0  # Approximate conversion
+                    # Use PIL with same font size as species labels
+                    if PIL_AVAILABLE:
+                        # Calculate scale factor from font_size to cv2 scale
+                        cv2_scale = font_size / 30.0  # Approximate conversion
                     
-                    # Use put_unicode_text for consistent styling
-                    annotated_frame = put_unicode_text(
-                        annotated_frame,
-                        info_text,
-                        (17, height - 17 - font_size),
-                        font_size=font_size,
-                        color=(255, 255, 255),
-                        bg_color=(0, 0, 0)
-                    )
-                else:
-                    # Fallback to OpenCV (original behavior)
-                    (info_width, info_height), _ = cv2.getTextSize(
-                        info_text, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 3
-                    )
-                    cv2.rectangle(
-                        annotated_frame,
-                        (10, height - info_height - 25),
-                        (info_width + 25, height - 10),
-                        (0, 0, 0),
-                        -1
-                    )
+                        # Use put_unicode_text for consistent styling
+                        annotated_frame = put_unicode_text(
+                            annotated_frame,
+                            info_text,
+                            (17, height - 17 - font_size),
+                            font_size=font_size,
+                            color=(255, 255, 255),
+                            bg_color=(0, 0, 0)
+                        )
+                    else:
+                        # Fallback to OpenCV (original behavior)
+                        (info_width, info_height), _ = cv2.getTextSize(
+                            info_text, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 3
+                        )
+                        cv2.rectangle(
+                            annotated_frame,
+                            (10, height - info_height - 25),
+                            (info_width + 25, height - 10),
+                            (0, 0, 0),
+                            -1
+                        )
                     
-                    cv2.putText(
-                        annotated_frame,
-                        info_text,
-                        (17, height - 17),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.9,
-                        (255, 255, 255),
-                        3
-                    )
+                        cv2.putText(
+                            annotated_frame,
+                            info_text,
+                            (17, height - 17),
+                            cv2.FONT_HERSHEY_SIMPLEX,
+                            0.9,
+                            (255, 255, 255),
+                            3
+                        )
             
-            # Write frame to output
-            out.write(annotated_frame)
+                # Write frame to output
+                out.write(annotated_frame)
             
-            # Progress indicator
-            if current_frame % 100 == 0:
-                progress = (current_frame / total_frames) * 100
-                print(f"   Progress: {progress:.1f}% ({current_frame}/{total_frames})", end='\r')
+                # Progress indicator
+                if current_frame % 100 == 0:
+                    progress = (current_frame / total_frames) * 100
+                    print(f"   Progress: {progress:.1f}% ({current_frame}/{total_frames})", end='\r')
+        except BaseException:
+            # Never leave an encoder process or a truncated video behind
+            source.release()
+            if use_ffmpeg:
+                out.abort()
+            else:
+                out.release()
+                Path(output_path).unlink(missing_ok=True)
+            raise
         
         # Cleanup
-        cap.release()
+        source.release()
         out.release()
         
         print(f"\n{t('annotation_complete')}")
         print(f"{t('annotation_frames_processed').format(processed=frames_processed, total=total_frames)}")
         print(f"{t('annotation_birds_detected').format(count=total_birds_detected)}")
         
-        # Try to merge audio from original video using ffmpeg
+        if not use_ffmpeg:
+            # cv2.VideoWriter output has no audio - merge it in a second pass
+            self._merge_audio(video_path, output_path)
+        
+        return {
+            'input_video': str(video_path),
+            'output_video': str(output_path),
+            'total_frames': total_frames,
+            'frames_processed': frames_processed,
+            'birds_detected': total_birds_detected,
+            'fps': fps
+        }
+    
+    def _merge_audio(self, video_path, output_path):
+        """
+        Copy the audio track of the original video into an annotated video
+        
+        Used for cv2.VideoWriter output; the ffmpeg writer muxes audio while
+        encoding. Keeps the video without audio if ffmpeg is unavailable or fails.
+        
+        Args:
+            video_path: Path to original video
+            output_path: Path to annotated video (replaced in place)
+        """
         try:
             # Check if ffmpeg is available
             subprocess.run(['ffmpeg', '-version'], 
@@ -1312,79 +2175,158 @@ class VideoAnalyzer:
         except Exception as e:
             # Any other error - keep video without audio
             print(f"   ⚠️  Could not merge audio: {e}")
-        
-        return {
-            'input_video': str(video_path),
-            'output_video': str(output_path),
-            'total_frames': total_frames,
-            'frames_processed': frames_processed,
-            'birds_detected': total_birds_detected,
-            'fps': fps
-        }
     
-    def create_summary_video(self, video_path, output_path, sample_rate=5, 
-                            skip_empty_seconds=3.0, min_activity_duration=2.0):
+    def _detect_frame_boxes(self, frame):
         """
-        Create summary video by skipping segments without bird activity
+        Detect birds in a single frame and identify their species
         
         Args:
-            video_path: Path to input video
-            output_path: Path to output summary video
-            sample_rate: Frames to skip between detections (higher = faster but less accurate)
-            skip_empty_seconds: Minimum duration of bird-free segment to skip (default: 3.0)
-            min_activity_duration: Minimum duration of bird activity to keep (default: 2.0)
+            frame: BGR frame
             
         Returns:
-            dict with summary statistics
+            List of box dicts in DetectionTrack format
+            ({'bbox', 'conf', 'species'})
         """
-        video_path = Path(video_path)
-        output_path = Path(output_path)
+        frame_boxes = []
+        for result in self.model(frame, verbose=False):
+            bird_xyxy, bird_conf = self._filter_birds(result.boxes)
+            frame_boxes.extend(
+                {'bbox': tuple(bbox), 'conf': conf, 'species': None}
+                for bbox, conf in zip(bird_xyxy.tolist(), bird_conf.tolist())
+            )
+        
+        # Batch process all bird crops at once (GPU-efficient)
+        if frame_boxes and self.identify_species and self.species_classifier:
+            try:
+                batch_predictions = self.species_classifier.classify_crops_batch(
+                    frame, [box_info['bbox'] for box_info in frame_boxes], top_k=1
+                )
+                for box_info, predictions in zip(frame_boxes, batch_predictions):
+                    box_info['species'] = list(predictions)
+            except Exception:
+                # On error, fall back to generic bird labels
+                for box_info in frame_boxes:
+                    box_info['species'] = None
+        
+        return frame_boxes
+    
+    def _label_boxes(self, frame_boxes, show_confidence=True, multilingual=False):
+        """
+        Build the labels drawn by annotate_video() for one frame
         
-        print(f"\n{t('summary_analyzing')} {video_path.name}...")
+        Boxes whose species classification ran without a result above the
+        species threshold are skipped; unclassified boxes get a generic label.
+        
+        Args:
+            frame_boxes: List of box dicts in DetectionTrack format
+            show_confidence: Append confidence scores to the labels
+            multilingual: Use multilingual species names
+            
+        Returns:
+            List of {'bbox', 'label'} dicts
+        """
+        detections = []
+        for box_info in frame_boxes:
+            predictions = box_info['species']
+            
+            if predictions is None:
+                # No species classification - show as generic bird
+                if show_confidence:
+                    species_label = f"Bird {box_info['conf']:.0%}"
+                else:
+                    species_label = "Bird"
+            elif predictions:
+                species_info = predictions[0]
+                
+                # Use multilingual name if requested
+                if multilingual:
+                    # Use full Unicode format with emojis if PIL available
+                    bird_name = BirdSpeciesClassifier.get_multilingual_name(
+                        species_info['label'].upper(), 
+                        show_flags=PIL_AVAILABLE,
+                        opencv_compatible=not PIL_AVAILABLE
+                    )
+                else:
+                    bird_name = BirdSpeciesClassifier.format_species_name(
+                        species_info['label'], translate=True
+                    )
+                
+                if show_confidence:
+                    species_label = f"{bird_name} {species_info['score']:.0%}"
+                else:
+                    species_label = bird_name
+            else:
+                # No species passed threshold - skip this detection entirely
+                continue
+            
+            detections.append({
+                'bbox': box_info['bbox'],
+                'label': species_label
+            })
+        return detections
+    
+    def _detect_summary_frames(self, video_path, sample_rate, decoder=DEFAULT_DECODER):
+        """
+        Run detection for create_summary_video() without a DetectionTrack
         
+        Args:
+            video_path: Path to input video
+            sample_rate: Analyze every Nth frame
+            decoder: Frame reader backend
+            
+        Returns:
+            (fps, total_frames, bird_frames) with 0-based bird frame numbers
+        """
         # Open video
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
+        try:
+            source = open_frame_source(video_path, decoder)
+        except RuntimeError:
             raise ValueError(f"Could not open video: {video_path}")
         
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        total_duration = total_frames / fps
+        fps = source.fps
+        total_frames = source.total_frames
         
         # Analyze video to find bird activity segments
         print(f"   📊 Analyzing {total_frames} frames at {fps:.1f} FPS...")
         
         bird_frames = set()  # Frame numbers with bird detections
-        frame_number = 0
         
-        while frame_number < total_frames:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = cap.read()
-            if not ret:
-                break
+        # Sequential decode: skipped frames are grabbed, not seeked to
+        for sampled in source.iter_sampled(sample_rate, start=0):
+            frame = sampled.image
+            frame_number = sampled.index
             
-            # Run detection
+            # Run detection; same bird definition (class and threshold) as
+            # analyze_video(), so the summary does not depend on a track
             results = self.model(frame, verbose=False)
-            
-            # Check if any birds detected
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None and len(boxes) > 0:
-                    # Bird detected in this frame
-                    bird_frames.add(frame_number)
-                    break
-            
-            frame_number += sample_rate
+            if any(len(self._filter_birds(result.boxes)[1]) for result in results):
+                bird_frames.add(frame_number)
             
             # Progress indicator
-            if frame_number % (sample_rate * 100) == 0:
-                progress = (frame_number / total_frames) * 100
+            if (frame_number + sample_rate) % (sample_rate * 100) == 0:
+                progress = ((frame_number + sample_rate) / total_frames) * 100
                 print(f"   ⏳ Progress: {progress:.1f}%", end='\r')
         
-        cap.release()
+        source.release()
         print(f"   ✅ Analysis complete - {len(bird_frames)} frames with birds detected")
         
-        # Convert frame numbers to time segments
+        return fps, total_frames, bird_frames
+    
+    @staticmethod
+    def _find_activity_segments(bird_frames, fps, total_frames, skip_empty_seconds=3.0, min_activity_duration=2.0):
+        """
+        Group bird frames into the time segments kept by create_summary_video()
+        
+        Args:
+            bird_frames: Iterable of 0-based frame numbers with bird detections
+            fps: Video frame rate
+            total_frames: Total number of frames in the video
+            skip_empty_seconds: Minimum duration of bird-free gap that splits segments
+            min_activity_duration: Minimum duration of a kept segment
+            
+        Returns:
+            List of (start_time, end_time) tuples in seconds
+        """
         skip_empty_frames = int(skip_empty_seconds * fps)
         min_activity_frames = int(min_activity_duration * fps)
         
@@ -1418,6 +2360,56 @@ class VideoAnalyzer:
             if segment_duration >= min_activity_duration:
                 segments.append((current_segment_start / fps, segment_end / fps))
         
+        return segments
+    
+    def create_summary_video(self, video_path, output_path, sample_rate=5, 
+                            skip_empty_seconds=3.0, min_activity_duration=2.0, track=None,
+                            single_pass=True, decoder=DEFAULT_DECODER):
+        """
+        Create summary video by skipping segments without bird activity
+        
+        Args:
+            video_path: Path to input video
+            output_path: Path to output summary video
+            sample_rate: Frames to skip between detections (higher = faster but less accurate)
+            skip_empty_seconds: Minimum duration of bird-free segment to skip (default: 3.0)
+            min_activity_duration: Minimum duration of bird activity to keep (default: 2.0)
+            track: Completed DetectionTrack from analyze_video(). If given, bird
+                   frames are taken from the track and no detection is run
+            single_pass: Cut all segments with one ffmpeg process (concat demuxer
+                         with inpoint/outpoint, no temp files). False extracts
+                         every segment to a temp file and concatenates them
+                         afterwards; also used as fallback (default: True)
+            decoder: Frame reader backend of the detection pass, "opencv"
+                     or "pyav" (default: "opencv")
+            
+        Returns:
+            dict with summary statistics
+        """
+        video_path = Path(video_path)
+        output_path = Path(output_path)
+        
+        print(f"\n{t('summary_analyzing')} {video_path.name}...")
+        
+        if track is not None and track.complete:
+            # Reuse the detections of a previous analyze_video() pass
+            print(f"   ♻️  {t('track_reused')}")
+            fps = track.fps
+            total_frames = track.total_frames
+            total_duration = total_frames / fps
+            
+            # Track frame numbers are 1-based, segment math uses 0-based positions
+            bird_frames = {frame_num - 1 for frame_num in track.bird_frames()}
+            print(f"   ✅ Analysis complete - {len(bird_frames)} frames with birds detected")
+        else:
+            fps, total_frames, bird_frames = self._detect_summary_frames(video_path, sample_rate, decoder)
+            total_duration = total_frames / fps
+        
+        # Convert frame numbers to time segments
+        segments = self._find_activity_segments(
+            bird_frames, fps, total_frames, skip_empty_seconds, min_activity_duration
+        )
+        
         if not segments:
             print(f"   ⚠️  No bird activity segments found - video would be empty")
             return {
@@ -1437,16 +2429,122 @@ class VideoAnalyzer:
         print(f"   ⏱️  Summary duration: {timedelta(seconds=int(summary_duration))}")
         print(f"   📉 Compression: {(1 - summary_duration/total_duration) * 100:.1f}% shorter")
         
-        # Create ffmpeg concat file
-        concat_file = output_path.parent / f"{output_path.stem}_concat.txt"
-        
         try:
             print(f"\n{t('summary_creating')} {output_path.name}...")
             
-            # Create temporary segment files
-            temp_dir = Path(tempfile.mkdtemp())
-            segment_files = []
+            if single_pass:
+                result = self._render_summary_single_pass(video_path, output_path, segments)
+                if result.returncode != 0:
+                    # e.g. ffmpeg builds without concat demuxer inpoint/outpoint support
+                    print(f"   ⚠️  {t('summary_single_pass_failed')}")
+                    result = self._render_summary_segments(video_path, output_path, segments)
+            else:
+                result = self._render_summary_segments(video_path, output_path, segments)
+            
+            if result.returncode == 0 and output_path.exists():
+                print(f"   {t('summary_complete')}")
+                print(f"   📁 {output_path}")
+                
+                return {
+                    'input_video': str(video_path),
+                    'output_video': str(output_path),
+                    'original_duration': total_duration,
+                    'summary_duration': summary_duration,
+                    'segments_kept': len(segments),
+                    'segments_skipped': total_duration - summary_duration,
+                    'compression_ratio': 1 - (summary_duration / total_duration)
+                }
+            else:
+                print(f"   ⚠️  ffmpeg concatenation failed")
+                print(f"   Error: {result.stderr}")
+                return None
+                
+        except subprocess.TimeoutExpired:
+            print(f"   ⚠️  ffmpeg timeout - video too long")
+            return None
+        except FileNotFoundError:
+            print(f"   ⚠️  ffmpeg not found - please install: sudo apt install ffmpeg")
+            return None
+        except Exception as e:
+            print(f"   ⚠️  Error creating summary: {e}")
+            return None
+    
+    @staticmethod
+    def _build_concat_script(video_path, segments):
+        """
+        Build an ffconcat script that cuts all segments from the source video
+        
+        Each segment references the source file with inpoint/outpoint, so the
+        concat demuxer reads the kept ranges directly without temp files.
+        
+        Args:
+            video_path: Path to input video
+            segments: List of (start_time, end_time) tuples in seconds
+            
+        Returns:
+            Script text for ffmpeg's concat demuxer
+        """
+        # Explicit file: URL - the script is read from stdin, so relative
+        # resolution would otherwise prefix paths with "pipe:".
+        # Quoted ffconcat strings cannot contain ' - close, escape, reopen
+        quoted_url = ("file:" + str(Path(video_path).resolve())).replace("'", "'\\''")
+        
+        lines = ["ffconcat version 1.0"]
+        for start, end in segments:
+            lines.append(f"file '{quoted_url}'")
+            lines.append(f"inpoint {start:.6f}")
+            lines.append(f"outpoint {end:.6f}")
+        return "\n".join(lines) + "\n"
+    
+    def _render_summary_single_pass(self, video_path, output_path, segments):
+        """
+        Render the summary with one ffmpeg process (concat demuxer, stream copy)
+        
+        The concat script is passed on stdin, so no intermediate segment
+        files or lists are written.
+        
+        Args:
+            video_path: Path to input video
+            output_path: Path to output summary video
+            segments: List of (start_time, end_time) tuples in seconds
+            
+        Returns:
+            subprocess.CompletedProcess of the ffmpeg run
+        """
+        cmd = [
+            'ffmpeg', '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-protocol_whitelist', 'file,pipe',
+            '-i', 'pipe:0',
+            '-c', 'copy',  # Copy streams without re-encoding
+            '-avoid_negative_ts', 'make_zero',
+            str(output_path)
+        ]
+        return subprocess.run(
+            cmd, input=self._build_concat_script(video_path, segments),
+            capture_output=True, text=True, timeout=300
+        )
+    
+    def _render_summary_segments(self, video_path, output_path, segments):
+        """
+        Render the summary by extracting every segment to a temp file and
+        concatenating them in a second ffmpeg pass
+        
+        Args:
+            video_path: Path to input video
+            output_path: Path to output summary video
+            segments: List of (start_time, end_time) tuples in seconds
             
+        Returns:
+            subprocess.CompletedProcess of the concat run
+        """
+        # Create ffmpeg concat file
+        concat_file = output_path.parent / f"{output_path.stem}_concat.txt"
+        temp_dir = Path(tempfile.mkdtemp())
+        segment_files = []
+        
+        try:
             for idx, (start, end) in enumerate(segments):
                 segment_path = temp_dir / f"segment_{idx:04d}.mp4"
                 segment_files.append(segment_path)
@@ -1482,46 +2580,10 @@ class VideoAnalyzer:
                 str(output_path)
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            
-            if result.returncode == 0 and output_path.exists():
-                print(f"   {t('summary_complete')}")
-                print(f"   📁 {output_path}")
-                
-                # Cleanup
-                concat_file.unlink(missing_ok=True)
-                for seg_file in segment_files:
-                    seg_file.unlink(missing_ok=True)
-                temp_dir.rmdir()
-                
-                return {
-                    'input_video': str(video_path),
-                    'output_video': str(output_path),
-                    'original_duration': total_duration,
-                    'summary_duration': summary_duration,
-                    'segments_kept': len(segments),
-                    'segments_skipped': total_duration - summary_duration,
-                    'compression_ratio': 1 - (summary_duration / total_duration)
-                }
-            else:
-                print(f"   ⚠️  ffmpeg concatenation failed")
-                print(f"   Error: {result.stderr}")
-                return None
-                
-        except subprocess.TimeoutExpired:
-            print(f"   ⚠️  ffmpeg timeout - video too long")
-            return None
-        except FileNotFoundError:
-            print(f"   ⚠️  ffmpeg not found - please install: sudo apt install ffmpeg")
-            return None
-        except Exception as e:
-            print(f"   ⚠️  Error creating summary: {e}")
-            return None
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=300)
         finally:
             # Cleanup temp files
-            if concat_file.exists():
-                concat_file.unlink()
-            if 'temp_dir' in locals():
-                for seg_file in segment_files:
-                    seg_file.unlink(missing_ok=True)
-                temp_dir.rmdir()
+            concat_file.unlink(missing_ok=True)
+            for seg_file in segment_files:
+                seg_file.unlink(missing_ok=True)
+            temp_dir.rmdir()
@@ -0,0 +1,175 @@
+"""
+Persistent analysis cache for vogel-video-analyzer.
+
+Stores ``VideoAnalyzer.analyze_video`` statistics in a SQLite database so that
+re-running the analyzer on an unchanged archive returns results instantly.
+
+Entries are keyed by
+  * a cheap file fingerprint (size, modification time and a SHA-256 of the
+    first and last MiB of the file), and
+  * every parameter that influences the result (model, thresholds, sample
+    rate, species settings) plus the package version.
+
+Any change to the video or to the analysis settings therefore produces a
+cache miss; stale entries are simply never read again.
+
+Default location: ``$XDG_CACHE_HOME/vogel-video-analyzer/analysis.db``
+(``~/.cache/vogel-video-analyzer/analysis.db``).
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from . import __version__
+
+CACHE_FILE_NAME = "analysis.db"
+
+# Number of bytes hashed at the start and at the end of each video
+PARTIAL_HASH_BYTES = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    key         TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    params      TEXT NOT NULL,
+    stats       TEXT NOT NULL,
+    created     REAL NOT NULL
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "vogel-video-analyzer"
+
+
+def file_fingerprint(path) -> str:
+    """
+    Compute a cheap content fingerprint of a file.
+
+    Hashing only the head and tail keeps the cost constant for multi-GB
+    recordings while still catching re-encoded or truncated files; size and
+    mtime catch everything else.
+
+    Args:
+        path: File path.
+
+    Returns:
+        Hex string identifying the file contents.
+    """
+    path = Path(path)
+    stat = path.stat()
+    digest = hashlib.sha256()
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    with open(path, "rb") as f:
+        digest.update(f.read(PARTIAL_HASH_BYTES))
+        if stat.st_size > 2 * PARTIAL_HASH_BYTES:
+            f.seek(-PARTIAL_HASH_BYTES, os.SEEK_END)
+            digest.update(f.read(PARTIAL_HASH_BYTES))
+
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """SQLite-backed store of analysis statistics keyed by video and parameters."""
+
+    def __init__(self, cache_dir=None):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            cache_dir: Directory for the database file.  Defaults to
+                       ``default_cache_dir()``.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.db_path = self.cache_dir / CACHE_FILE_NAME
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # A short-lived connection per operation keeps the cache safe to use
+        # from several threads and --workers processes at once.
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            with conn:  # commit on success, rollback on error
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(fingerprint: str, params: Dict) -> str:
+        """Combine a file fingerprint and analysis parameters into a cache key."""
+        payload = json.dumps(
+            {"fingerprint": fingerprint, "params": params, "version": __version__},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, video_path, params: Dict) -> Optional[Dict]:
+        """
+        Look up cached statistics.
+
+        Args:
+            video_path: Path to the video file.
+            params:     Analysis parameters (JSON-serialisable dict).
+
+        Returns:
+            The stored statistics dict (with ``video_file``/``video_path``
+            updated to the given path) or None on a miss.
+        """
+        video_path = Path(video_path)
+        key = self.make_key(file_fingerprint(video_path), params)
+        with self._connect() as conn:
+            row = conn.execute("SELECT stats FROM analysis WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        stats = json.loads(row[0])
+        # Identical content may have been moved or copied since it was cached
+        stats["video_file"] = video_path.name
+        stats["video_path"] = str(video_path)
+        return stats
+
+    def put(self, video_path, params: Dict, stats: Dict) -> None:
+        """
+        Store statistics for a video.
+
+        Args:
+            video_path: Path to the video file.
+            params:     Analysis parameters used to produce ``stats``.
+            stats:      Statistics dict returned by ``analyze_video``.
+        """
+        fingerprint = file_fingerprint(video_path)
+        key = self.make_key(fingerprint, params)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis (key, fingerprint, params, stats, created) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    fingerprint,
+                    json.dumps(params, sort_keys=True),
+                    json.dumps(stats, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+
+    def clear(self) -> int:
+        """
+        Remove all entries.
+
+        Returns:
+            Number of deleted entries.
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM analysis").rowcount
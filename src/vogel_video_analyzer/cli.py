@@ -3,14 +3,27 @@ Command-line interface for vogel-video-analyzer
 """
 
 import argparse
+import contextlib
+import io
 import json
+import multiprocessing
+import os
 import sys
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import cv2
+
 from . import __version__
-from .analyzer import VideoAnalyzer
+from .analyzer import (VideoAnalyzer, DEFAULT_SPECIES_BATCH_SIZE, DEFAULT_TRIAGE_CONFIDENCE,
+                       DEFAULT_TRIAGE_INTERVAL)
+from .detection_track import DetectionTrack
+from .tracker import DEFAULT_CROPS_PER_TRACK
+from .motion import DEFAULT_MOTION_THRESHOLD
+from .sampling import DEFAULT_FINE_SAMPLE_RATE, DEFAULT_RELAX_AFTER
+from .video_io import DEFAULT_CRF, DEFAULT_PRESET, X264_PRESETS, DECODERS, DEFAULT_DECODER
 from .i18n import init_i18n, t
 
 
@@ -30,15 +43,27 @@ Examples:
   # All MP4s in directory
   vogel-analyze ~/Videos/Birds/*/*.mp4
   
+  # All MP4s in directory, 4 videos in parallel
+  vogel-analyze --workers 4 ~/Videos/Birds/*/*.mp4
+  
   # Custom threshold and model
   vogel-analyze --threshold 0.3 --model yolo26n.pt video.mp4
   
   # Faster analysis (every 5th frame)
   vogel-analyze --sample-rate 5 video.mp4
   
+  # Batched inference (GPU / many-core CPU)
+  vogel-analyze --batch-size 16 video.mp4
+  
+  # Overlap decoding and inference in background threads
+  vogel-analyze --pipeline --batch-size 8 video.mp4
+  
   # Save report as JSON
   vogel-analyze --output report.json video.mp4
   
+  # Nightly rescan: skip unchanged videos via the analysis cache
+  vogel-analyze --cache --delete-file ~/Videos/Birds/*/*.mp4
+  
   # Delete only video files with 0% bird content
   vogel-analyze --delete-file --sample-rate 5 *.mp4
   
@@ -56,17 +81,77 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
     parser.add_argument('--model', default='yolo26n.pt', help='YOLO model (default: yolo26n.pt)')
     parser.add_argument('--threshold', type=float, default=0.3, help='Confidence threshold (default: 0.3)')
     parser.add_argument('--sample-rate', type=int, default=5, help='Analyze every Nth frame (default: 5)')
+    parser.add_argument('--adaptive-sampling', action='store_true',
+                        help='Use --sample-rate as a coarse stride and switch to --fine-sample-rate while birds are in view, '
+                             'analyzing the skipped frames before each new detection')
+    parser.add_argument('--fine-sample-rate', type=int, default=DEFAULT_FINE_SAMPLE_RATE, metavar='N',
+                        help=f'Stride while birds are in view (default: {DEFAULT_FINE_SAMPLE_RATE}, requires --adaptive-sampling)')
+    parser.add_argument('--relax-after', type=int, default=DEFAULT_RELAX_AFTER, metavar='N',
+                        help=f'Empty samples before returning to the coarse stride (default: {DEFAULT_RELAX_AFTER}, requires --adaptive-sampling)')
+    parser.add_argument('--batch-size', type=int, default=1, metavar='N',
+                        help='Number of sampled frames per YOLO inference call (default: 1). '
+                             'Values of 8-32 improve throughput on multi-core CPUs and CUDA GPUs')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Analyze N videos in parallel, each in its own process with its own '
+                             'model (default: 1). Applies to standard analysis of multiple videos')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Overlap video decoding, YOLO inference and species classification '
+                             'in separate threads connected by bounded queues')
     parser.add_argument('--identify-species', action='store_true', help='Identify bird species (requires: pip install vogel-video-analyzer[species])')
     parser.add_argument('--species-model', default='chriamue/bird-species-classifier', 
                         help='Species classification model: Hugging Face model ID or local path (default: chriamue/bird-species-classifier)')
     parser.add_argument('--species-threshold', type=float, default=0.3,
                         help='Minimum confidence threshold for species classification (default: 0.3)')
+    parser.add_argument('--species-engine', choices=['transformers', 'onnx'], default='transformers',
+                        help='Species classifier backend: transformers (PyTorch) or onnx (exported once, cached, run with onnxruntime; default: transformers)')
+    parser.add_argument('--species-fast-preprocess', action='store_true',
+                        help='Resize and normalize species crops with OpenCV/NumPy instead of the Hugging Face image '
+                             'processor - faster, but scores can differ slightly (the onnx engine always uses it)')
+    parser.add_argument('--species-batch-size', type=int, default=DEFAULT_SPECIES_BATCH_SIZE, metavar='N',
+                        help=f'Number of bird crops, collected across sampled frames, per species classifier call (default: {DEFAULT_SPECIES_BATCH_SIZE})')
+    parser.add_argument('--track-birds', action='store_true',
+                        help='Track birds across sampled frames and report visits; with --identify-species only the best crops of each visit are classified')
+    parser.add_argument('--crops-per-track', type=int, default=DEFAULT_CROPS_PER_TRACK, metavar='N',
+                        help=f'Crops per tracked visit sent to the species classifier (default: {DEFAULT_CROPS_PER_TRACK})')
+    parser.add_argument('--motion-gate', action='store_true',
+                        help='Skip YOLO on sampled frames without motion since the last detector frame and reuse its result')
+    parser.add_argument('--motion-threshold', type=float, default=DEFAULT_MOTION_THRESHOLD * 100, metavar='PERCENT',
+                        help=f'Percentage of changed pixels that counts as motion (default: {DEFAULT_MOTION_THRESHOLD * 100:g}, requires --motion-gate)')
+    parser.add_argument('--detect-width', type=int, default=None, metavar='PIXELS',
+                        help='Decode frames for detection at this width when the video is wider (e.g. 1280 for 4K footage; '
+                             'ffmpeg scaling when installed). Species crops still come from full-resolution frames')
+    parser.add_argument('--decoder', choices=DECODERS, default=DEFAULT_DECODER,
+                        help='Frame reader: opencv (cv2.VideoCapture) or pyav (threaded FFmpeg decoding, real frame '
+                             'timestamps for variable-frame-rate files; requires: pip install vogel-video-analyzer[pyav]) '
+                             f'(default: {DEFAULT_DECODER})')
+    parser.add_argument('--decode-threads', type=int, default=0, metavar='N',
+                        help='Decoder threads (default: 0 = decoder default)')
+    parser.add_argument('--keyframes-only', action='store_true',
+                        help='Analyze keyframes only, at least --sample-rate frames apart - a quick scan of long '
+                             'recordings (requires --decoder pyav)')
+    parser.add_argument('--triage', action='store_true',
+                        help='Only decide "bird or no bird": scan keyframes (--decoder pyav) or frames --triage-interval '
+                             'seconds apart (--decoder opencv) first, stop at the first confident detection and run '
+                             'the full analysis only for inconclusive files - fast cleanup of large archives')
+    parser.add_argument('--triage-confidence', type=float, default=DEFAULT_TRIAGE_CONFIDENCE, metavar='CONF',
+                        help=f'Detection confidence that decides a triage scan (default: {DEFAULT_TRIAGE_CONFIDENCE}, requires --triage)')
+    parser.add_argument('--triage-interval', type=float, default=DEFAULT_TRIAGE_INTERVAL, metavar='SECONDS',
+                        help=f'Minimum seconds between frames checked by the triage scan (default: {DEFAULT_TRIAGE_INTERVAL:g}, requires --triage)')
+    parser.add_argument('--stop-at-first-bird', action='store_true',
+                        help='Stop the analysis of a video at the first sampled frame with a bird (partial statistics)')
+    parser.add_argument('--min-bird-percentage', type=float, default=None, metavar='PERCENT',
+                        help='Stop the analysis of a video as soon as it is certain whether its bird percentage '
+                             'reaches PERCENT (partial statistics; fixed sample rate only)')
     parser.add_argument('--multilingual', action='store_true', 
                         help='Show bird names in all available languages with flag emojis (🇬🇧 🇩🇪 🇯🇵)')
     parser.add_argument('--annotate-video', action='store_true',
                         help='Create annotated video with bounding boxes and species labels, saves as <original>_annotated.mp4 in the same directory')
     parser.add_argument('--annotate-output', metavar='PATH',
                         help='Custom output path for annotated video (requires --annotate-video)')
+    parser.add_argument('--annotate-preset', choices=X264_PRESETS, default=DEFAULT_PRESET,
+                        help=f'x264 preset for annotated videos encoded with ffmpeg (default: {DEFAULT_PRESET}, requires --annotate-video)')
+    parser.add_argument('--annotate-crf', type=int, default=DEFAULT_CRF, metavar='N',
+                        help=f'x264 quality for annotated videos, lower is better (default: {DEFAULT_CRF}, requires --annotate-video)')
     parser.add_argument('--font-size', type=int, default=20,
                         help='Font size for species labels in annotated video (default: 20)')
     parser.add_argument('--flag-dir', metavar='PATH',
@@ -79,6 +164,13 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
                         help='Skip segments without birds longer than N seconds (default: 3.0, requires --create-summary)')
     parser.add_argument('--min-activity-duration', type=float, default=2.0,
                         help='Minimum duration for bird activity segments in seconds (default: 2.0, requires --create-summary)')
+    parser.add_argument('--summary-per-segment', action='store_true',
+                        help='Extract each summary segment to a temp file and concatenate afterwards instead of cutting all segments in one ffmpeg pass (requires --create-summary)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse stored results for unchanged videos analyzed with identical '
+                             'settings (SQLite cache in ~/.cache/vogel-video-analyzer)')
+    parser.add_argument('--cache-dir', metavar='PATH',
+                        help='Directory for the analysis cache (implies --cache)')
     parser.add_argument('--output', '-o', help='Save report as JSON')
     parser.add_argument('--html-report', metavar='PATH',
                         help='Generate interactive HTML report with charts and thumbnails (v0.5.0+)')
@@ -86,12 +178,16 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
                         help='Maximum number of thumbnails in HTML report (default: 50)')
     parser.add_argument('--delete-file', action='store_true', help='Delete video files with 0%% bird content')
     parser.add_argument('--delete-folder', action='store_true', help='Delete parent folders with 0%% bird content')
+    parser.add_argument('--delete-triaged', action='store_true',
+                        help='Let --delete-file/--delete-folder also delete videos found empty by the --triage scan '
+                             'alone (short visits between the checked frames are missed)')
     parser.add_argument('--delete', action='store_true', help='(Deprecated) Use --delete-file or --delete-folder instead')
     parser.add_argument('--log', action='store_true', help='Save console output to log file')
     parser.add_argument('--language', choices=['en', 'de', 'ja'], help='Set output language (default: auto-detect from system)')
-    parser.add_argument('--engine', choices=['auto', 'hailo'], default='auto',
+    parser.add_argument('--engine', choices=['auto', 'hailo', 'onnx'], default='auto',
                         help='Inference backend: "auto" uses ultralytics/CPU/GPU (default), '
-                             '"hailo" uses Raspberry Pi AI HAT+ (Hailo-8 NPU)')
+                             '"hailo" uses Raspberry Pi AI HAT+ (Hailo-8 NPU), '
+                             '"onnx" runs the --model .onnx export with ONNX Runtime (no torch)')
     parser.add_argument('--hef-model', metavar='PATH',
                         help='Path to HEF model file for Hailo NPU (required with --engine hailo). '
                              'Download from https://github.com/hailo-ai/hailo_model_zoo')
@@ -166,7 +262,20 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
             print(f"❌ {t('species_dependencies_missing')}", file=sys.stderr)
             print(f"   pip install vogel-video-analyzer[species]", file=sys.stderr)
             return 1
-    
+
+    # Check decoder options
+    if args.keyframes_only and args.decoder != 'pyav':
+        print(f"❌ {t('keyframes_only_requires_pyav')}", file=sys.stderr)
+        return 1
+    if args.min_bird_percentage is not None and (args.adaptive_sampling or args.keyframes_only):
+        print(f"❌ {t('early_exit_bound_fixed_rate')}", file=sys.stderr)
+        return 1
+    if args.decoder == 'pyav':
+        from .video_io import PYAV_AVAILABLE
+        if not PYAV_AVAILABLE:
+            print(f"❌ {t('pyav_not_installed')}", file=sys.stderr)
+            return 1
+
     try:
         # Handle --export-onnx before initialising the analyzer
         if args.export_onnx:
@@ -174,82 +283,91 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
             export_to_onnx(args.export_onnx, output_path=args.export_onnx_output)
             return 0
 
-        # Initialize analyzer
-        analyzer = VideoAnalyzer(
+        # Persistent result cache (shared by all --workers processes)
+        cache = None
+        if args.cache or args.cache_dir:
+            from .cache import AnalysisCache
+            cache = AnalysisCache(args.cache_dir)
+        
+        analyzer_kwargs = dict(
             model_path=args.model,
             threshold=args.threshold,
             identify_species=args.identify_species,
             species_model=args.species_model,
             species_threshold=args.species_threshold,
+            species_engine=args.species_engine,
+            species_fast_preprocess=args.species_fast_preprocess,
             engine=args.engine,
             hef_model=args.hef_model,
             hailo_num_classes=args.hailo_num_classes,
+            cache=cache,
         )
+        analyze_kwargs = dict(
+            sample_rate=args.sample_rate,
+            batch_size=args.batch_size,
+            pipeline=args.pipeline,
+            species_batch_size=args.species_batch_size,
+            track_birds=args.track_birds,
+            crops_per_track=args.crops_per_track,
+            motion_gate=args.motion_gate,
+            motion_threshold=args.motion_threshold / 100,
+            adaptive_sampling=args.adaptive_sampling,
+            fine_sample_rate=args.fine_sample_rate,
+            relax_after=args.relax_after,
+            detect_width=args.detect_width,
+            decoder=args.decoder,
+            decode_threads=args.decode_threads,
+            keyframes_only=args.keyframes_only,
+            triage=args.triage,
+            triage_confidence=args.triage_confidence,
+            triage_interval=args.triage_interval,
+        )
+        if args.triage and (args.annotate_video or args.create_summary or args.html_report):
+            print(f"⚠️  {t('triage_ignored')}")
+        if args.annotate_video or args.create_summary:
+            if args.stop_at_first_bird or args.min_bird_percentage is not None:
+                print(f"⚠️  {t('early_exit_ignored')}")
+        else:
+            analyze_kwargs.update(stop_at_first_bird=args.stop_at_first_bird,
+                                  min_bird_percentage=args.min_bird_percentage)
+        
+        # --annotate-video / --create-summary use the analysis pass only for
+        # their outputs: no report, summary or deletion unless results were
+        # requested (--html-report, --output)
+        render_outputs = args.annotate_video or args.create_summary
+        collect_stats = not render_outputs or bool(args.html_report or args.output)
         
         # Analyze videos
         all_stats = []
-        for video_path in args.videos:
-            try:
-                # Create annotated video if requested
-                if args.annotate_video:
-                    # Determine output path
-                    if args.annotate_output:
-                        # Use custom output path (only for single video)
-                        if len(args.videos) > 1:
-                            print(f"\n⚠️  {t('annotation_multiple_custom_path')}: {video_path}")
-                            print(f"    {t('annotation_using_auto_path')}")
-                            video_path_obj = Path(video_path)
-                            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                            output_path = video_path_obj.parent / f"{video_path_obj.stem}_annotated_{timestamp}{video_path_obj.suffix}"
-                        else:
-                            output_path = args.annotate_output
-                    else:
-                        # Auto-generate output filename with timestamp in same directory
-                        video_path_obj = Path(video_path)
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                        output_path = video_path_obj.parent / f"{video_path_obj.stem}_annotated_{timestamp}{video_path_obj.suffix}"
-                    
-                    annotation_stats = analyzer.annotate_video(
-                        video_path, 
-                        str(output_path), 
-                        sample_rate=args.sample_rate,
-                        multilingual=args.multilingual,
-                        font_size=args.font_size,
-                        flag_dir=args.flag_dir  # Pass flag directory for hybrid rendering
-                    )
-                elif args.create_summary:
-                    # Create summary video (skip empty segments)
-                    # Determine output path
-                    if args.summary_output:
-                        # Use custom output path (only for single video)
-                        if len(args.videos) > 1:
-                            print(f"\n⚠️  {t('summary_multiple_custom_path')}: {video_path}")
-                            print(f"    {t('summary_using_auto_path')}")
-                            video_path_obj = Path(video_path)
-                            output_path = video_path_obj.parent / f"{video_path_obj.stem}_summary{video_path_obj.suffix}"
-                        else:
-                            output_path = args.summary_output
-                    else:
-                        # Auto-generate output filename in same directory
-                        video_path_obj = Path(video_path)
-                        output_path = video_path_obj.parent / f"{video_path_obj.stem}_summary{video_path_obj.suffix}"
-                    
-                    summary_stats = analyzer.create_summary_video(
-                        video_path,
-                        str(output_path),
-                        sample_rate=args.sample_rate,
-                        skip_empty_seconds=args.skip_empty_seconds,
-                        min_activity_duration=args.min_activity_duration
-                    )
-                else:
-                    # Standard analysis
-                    stats = analyzer.analyze_video(video_path, sample_rate=args.sample_rate)
-                    analyzer.print_report(stats)
-                    all_stats.append(stats)
-            except Exception as e:
-                print(f"❌ {t('error_analyzing')} {video_path}: {e}", file=sys.stderr)
-                continue
+        tracks = {}  # video_path -> DetectionTrack (thumbnails for --html-report)
+        use_workers = (
+            args.workers > 1
+            and len(args.videos) > 1
+            and not (args.annotate_video or args.create_summary)
+        )
+        if use_workers and args.engine == 'hailo':
+            # A Hailo device is opened exclusively by one process
+            print(f"⚠️  {t('workers_hailo_single')}")
+            use_workers = False
         
+        if use_workers:
+            all_stats, tracks = _analyze_videos_parallel(args, analyzer_kwargs, analyze_kwargs, collect_stats,
+                                                         analyzer_class=VideoAnalyzer)
+        else:
+            # Initialize analyzer
+            analyzer = VideoAnalyzer(**analyzer_kwargs)
+            
+            for video_path in args.videos:
+                try:
+                    stats, track = _process_video(analyzer, video_path, args, analyze_kwargs, collect_stats)
+                except Exception as e:
+                    print(f"❌ {t('error_analyzing')} {video_path}: {e}", file=sys.stderr)
+                    continue
+                if collect_stats:
+                    all_stats.append(stats)
+                if args.html_report:
+                    tracks[stats['video_path']] = track
+
         # Summary for multiple videos
         if len(all_stats) > 1:
             _print_summary(all_stats)
@@ -260,10 +378,12 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
             print(f"   {t('delete_deprecated_hint')}\n", file=sys.stderr)
             args.delete_folder = True
         
-        if args.delete_file and all_stats:
-            _delete_empty_video_files(all_stats)
+        if render_outputs and (args.delete_file or args.delete_folder):
+            print(f"⚠️  {t('delete_skipped_render_outputs')}")
+        elif args.delete_file and all_stats:
+            _delete_empty_video_files(all_stats, args.delete_triaged)
         elif args.delete_folder and all_stats:
-            _delete_empty_video_folders(all_stats)
+            _delete_empty_video_folders(all_stats, args.delete_triaged)
         
         # JSON output
         if args.output:
@@ -271,7 +391,7 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
         
         # HTML report generation
         if args.html_report and all_stats:
-            _generate_html_report(all_stats, args.html_report, args.max_thumbnails)
+            _generate_html_report(all_stats, args.html_report, args.max_thumbnails, tracks)
         
         return 0
         
@@ -289,6 +409,197 @@ For more information: https://github.com/kamera-linux/vogel-video-analyzer
             log_file.close()
 
 
+def _process_video(analyzer, video_path, args, analyze_kwargs, report=True):
+    """
+    Analyze one video and create the outputs requested on the command line
+    
+    Shared by the sequential loop and the --workers processes.
+    
+    Args:
+        analyzer: VideoAnalyzer
+        video_path: Path to the video
+        args: Parsed command line arguments
+        analyze_kwargs: Keyword arguments for analyze_video()
+        report: Print the analysis report
+    
+    Returns:
+        (stats, track) tuple; track is the DetectionTrack of the pass or None
+    """
+    # One detection pass feeds the report and every requested output
+    track = None
+    if args.annotate_video or args.create_summary or args.html_report:
+        track = DetectionTrack(max_thumbnails=args.max_thumbnails if args.html_report else 0)
+    
+    stats = analyzer.analyze_video(video_path, track=track, **analyze_kwargs)
+    if report:
+        analyzer.print_report(stats)
+    
+    # Create annotated video if requested
+    if args.annotate_video:
+        # Determine output path
+        if args.annotate_output:
+            # Use custom output path (only for single video)
+            if len(args.videos) > 1:
+                print(f"\n⚠️  {t('annotation_multiple_custom_path')}: {video_path}")
+                print(f"    {t('annotation_using_auto_path')}")
+                video_path_obj = Path(video_path)
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                output_path = video_path_obj.parent / f"{video_path_obj.stem}_annotated_{timestamp}{video_path_obj.suffix}"
+            else:
+                output_path = args.annotate_output
+        else:
+            # Auto-generate output filename with timestamp in same directory
+            video_path_obj = Path(video_path)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            output_path = video_path_obj.parent / f"{video_path_obj.stem}_annotated_{timestamp}{video_path_obj.suffix}"
+    
+        annotation_stats = analyzer.annotate_video(
+            video_path, 
+            str(output_path), 
+            sample_rate=args.sample_rate,
+            multilingual=args.multilingual,
+            font_size=args.font_size,
+            flag_dir=args.flag_dir,  # Pass flag directory for hybrid rendering
+            track=track,
+            preset=args.annotate_preset,
+            crf=args.annotate_crf,
+            decoder=args.decoder,
+            decode_threads=args.decode_threads
+        )
+    
+    # Create summary video (skip empty segments) if requested
+    if args.create_summary:
+        # Determine output path
+        if args.summary_output:
+            # Use custom output path (only for single video)
+            if len(args.videos) > 1:
+                print(f"\n⚠️  {t('summary_multiple_custom_path')}: {video_path}")
+                print(f"    {t('summary_using_auto_path')}")
+                video_path_obj = Path(video_path)
+                output_path = video_path_obj.parent / f"{video_path_obj.stem}_summary{video_path_obj.suffix}"
+            else:
+                output_path = args.summary_output
+        else:
+            # Auto-generate output filename in same directory
+            video_path_obj = Path(video_path)
+            output_path = video_path_obj.parent / f"{video_path_obj.stem}_summary{video_path_obj.suffix}"
+    
+        summary_stats = analyzer.create_summary_video(
+            video_path,
+            str(output_path),
+            sample_rate=args.sample_rate,
+            skip_empty_seconds=args.skip_empty_seconds,
+            min_activity_duration=args.min_activity_duration,
+            track=track,
+            single_pass=not args.summary_per_segment,
+            decoder=args.decoder
+        )
+    
+    return stats, track
+
+
+# Analyzer instance of a --workers process (one loaded model per process)
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_kwargs, language, num_threads, analyzer_class=VideoAnalyzer):
+    """Process pool initializer: load the model once per worker process"""
+    global _worker_analyzer
+    init_i18n(language)
+    
+    # Split CPU threads between workers instead of oversubscribing every core
+    cv2.setNumThreads(num_threads)
+    try:
+        import torch
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+    
+    # The loading messages would repeat once per worker; they are only shown
+    # (on stderr) when loading fails
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            _worker_analyzer = analyzer_class(**analyzer_kwargs)
+    except Exception:
+        sys.stderr.write(output.getvalue())
+        raise
+
+
+def _analyze_in_worker(video_path, args, analyze_kwargs, report=True):
+    """
+    Analyze one video in a worker process
+    
+    Console output is captured and returned so the parent can print each
+    report in one piece (and include it in --log files).
+    
+    Args:
+        video_path: Path to the video
+        args: Parsed command line arguments
+        analyze_kwargs: Keyword arguments for analyze_video()
+        report: Print the analysis report
+    
+    Returns:
+        (stats, track, captured_output) tuple
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        stats, track = _process_video(_worker_analyzer, video_path, args, analyze_kwargs, report)
+    return stats, track, output.getvalue()
+
+
+def _analyze_videos_parallel(args, analyzer_kwargs, analyze_kwargs, report=True,
+                             analyzer_class=VideoAnalyzer):
+    """
+    Analyze args.videos in a pool of args.workers processes, each holding its own model
+    
+    Reports are printed as soon as a video finishes; the returned list keeps
+    the command-line order of the videos.
+    
+    Args:
+        args: Parsed command line arguments
+        analyzer_kwargs: Keyword arguments for the VideoAnalyzer of each worker
+        analyze_kwargs: Keyword arguments for analyze_video()
+        report: Print the analysis reports
+        analyzer_class: Analyzer class instantiated in the workers
+    
+    Returns:
+        (all_stats, tracks) tuple: statistics dicts of successfully analyzed
+        videos and a dict mapping video paths to their DetectionTrack
+        (only filled with --html-report)
+    """
+    videos = args.videos
+    workers = min(args.workers, len(videos))
+    num_threads = max(1, (os.cpu_count() or 1) // workers)
+    print(f"🧵 {t('workers_starting').format(workers=workers, videos=len(videos))}")
+    
+    results = {}
+    tracks = {}
+    # 'spawn' avoids forking a process that already initialized CUDA/OpenCV threads
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker,
+                             initargs=(analyzer_kwargs, args.language, num_threads, analyzer_class)) as executor:
+        futures = {
+            executor.submit(_analyze_in_worker, video_path, args, analyze_kwargs, report): index
+            for index, video_path in enumerate(videos)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                stats, track, output = future.result()
+            except Exception as e:
+                print(f"❌ {t('error_analyzing')} {videos[index]}: {e}", file=sys.stderr)
+                continue
+            # Drop progress lines overwritten with '\r' on a terminal
+            print('\n'.join(line.rsplit('\r', 1)[-1] for line in output.rstrip('\n').split('\n')))
+            results[index] = stats
+            if track is not None:
+                tracks[stats['video_path']] = track
+    
+    return [results[index] for index in sorted(results)], tracks
+
+
 def _print_summary(all_stats):
     """Print summary for multiple videos"""
     total_videos = len(all_stats)
@@ -327,9 +638,38 @@ def _delete_empty_videos(all_stats):
     _delete_empty_video_folders(all_stats)
 
 
-def _delete_empty_video_files(all_stats):
+def _select_empty_videos(all_stats, delete_triaged=False):
+    """
+    Select the videos with 0% bird content for deletion
+    
+    Videos whose analysis stopped early (--min-bird-percentage) are always
+    kept, since birds can appear after the last analyzed frame. Videos found
+    empty by the triage scan alone are kept unless delete_triaged is set.
+    A warning is printed for each kept video.
+    
+    Args:
+        all_stats: Statistics of the analyzed videos
+        delete_triaged: Also select videos decided by the triage scan
+        
+    Returns:
+        List of statistics of the videos to delete
+    """
+    videos_to_delete = []
+    for stats in all_stats:
+        if stats['bird_percentage'] != 0.0:
+            continue
+        if stats.get('early_terminated'):
+            print(f"⚠️  {t('delete_kept_early_exit').format(video=stats['video_file'])}")
+        elif not delete_triaged and stats.get('triage', {}).get('result') == 'empty':
+            print(f"⚠️  {t('delete_kept_triaged').format(video=stats['video_file'])}")
+        else:
+            videos_to_delete.append(stats)
+    return videos_to_delete
+
+
+def _delete_empty_video_files(all_stats, delete_triaged=False):
     """Delete video files with 0% bird content"""
-    videos_to_delete = [s for s in all_stats if s['bird_percentage'] == 0.0]
+    videos_to_delete = _select_empty_videos(all_stats, delete_triaged)
     
     if videos_to_delete:
         print("\n" + "=" * 70)
@@ -353,9 +693,9 @@ def _delete_empty_video_files(all_stats):
         print(f"\n✅ {t('no_empty_files')}")
 
 
-def _delete_empty_video_folders(all_stats):
+def _delete_empty_video_folders(all_stats, delete_triaged=False):
     """Delete parent folders with 0% bird content"""
-    videos_to_delete = [s for s in all_stats if s['bird_percentage'] == 0.0]
+    videos_to_delete = _select_empty_videos(all_stats, delete_triaged)
     
     if videos_to_delete:
         print("\n" + "=" * 70)
@@ -397,7 +737,7 @@ def _save_json_output(all_stats, output_path):
     print(f"\n💾 {t('report_saved')} {output_path}")
 
 
-def _generate_html_report(all_stats, output_path, max_thumbnails):
+def _generate_html_report(all_stats, output_path, max_thumbnails, tracks=None):
     """Generate interactive HTML report"""
     try:
         from .reporter import HTMLReporter
@@ -412,7 +752,7 @@ def _generate_html_report(all_stats, output_path, max_thumbnails):
         video_path = stats['video_path']
         
         print(f"\n📊 {t('html_generating')}")
-        reporter = HTMLReporter(stats, video_path)
+        reporter = HTMLReporter(stats, video_path, track=(tracks or {}).get(video_path))
         reporter.generate_report(output_path, max_thumbnails=max_thumbnails)
         print(f"✅ {t('html_success')} {output_path}")
         
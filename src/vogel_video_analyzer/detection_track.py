@@ -0,0 +1,164 @@
+"""
+Per-video detection track shared between analysis outputs.
+
+``VideoAnalyzer.analyze_video`` fills a ``DetectionTrack`` while it runs, so
+annotated videos, summary videos and HTML reports can be produced from the
+same detection pass instead of running YOLO (and the species classifier)
+again for every output:
+
+    track = DetectionTrack()
+    stats = analyzer.analyze_video("video.mp4", track=track)
+    analyzer.annotate_video("video.mp4", "annotated.mp4", track=track)
+    analyzer.create_summary_video("video.mp4", "summary.mp4", track=track)
+    HTMLReporter(stats, "video.mp4", track=track).generate_report("report.html")
+
+Frame numbers follow ``stats['detections']`` (1-based).
+"""
+
+import base64
+import heapq
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+# Default number of thumbnails kept for HTML reports
+DEFAULT_MAX_THUMBNAILS = 50
+THUMBNAIL_WIDTH = 300
+THUMBNAIL_JPEG_QUALITY = 85
+
+
+def thumbnail_image(frame: np.ndarray, width: int = THUMBNAIL_WIDTH) -> np.ndarray:
+    """
+    Downscale a frame to thumbnail width (frames already narrower are copied).
+
+    Lets callers keep a small copy of a frame until its thumbnail score is
+    known instead of holding on to the full-resolution frame.
+    """
+    h, w = frame.shape[:2]
+    if w > width:
+        scale = width / w
+        return cv2.resize(frame, (width, int(h * scale)))
+    return frame.copy()
+
+
+def encode_thumbnail(frame: np.ndarray, width: int = THUMBNAIL_WIDTH) -> str:
+    """
+    Downscale a frame and encode it as base64 JPEG for HTML embedding.
+
+    Args:
+        frame: BGR frame.
+        width: Maximum thumbnail width in pixels.
+
+    Returns:
+        Base64-encoded JPEG string.
+    """
+    h, w = frame.shape[:2]
+    if w > width:
+        frame = thumbnail_image(frame, width)
+    _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, THUMBNAIL_JPEG_QUALITY])
+    return base64.b64encode(buffer).decode('utf-8')
+
+
+class DetectionTrack:
+    """
+    Detections of every analyzed frame of one video.
+
+    Each bird box is stored as a dict::
+
+        {'bbox': (x1, y1, x2, y2), 'conf': 0.87, 'species': [...] or None}
+
+    ``species`` is None when no classification ran for the box and a
+    (possibly empty) list of ``{'label', 'score'}`` predictions otherwise;
+    an empty list means no species passed the species threshold.
+    """
+
+    def __init__(self, max_thumbnails: int = DEFAULT_MAX_THUMBNAILS):
+        """
+        Create an empty track.
+
+        Args:
+            max_thumbnails: Number of best-scoring frames kept as thumbnails
+                            for the HTML report (0 disables thumbnails).
+        """
+        self.max_thumbnails = max_thumbnails
+
+        # Video metadata, set by begin()
+        self.video_path = None
+        self.fps = 0.0
+        self.total_frames = 0
+        self.width = 0
+        self.height = 0
+        self.sample_rate = 1
+
+        self.analyzed_frames: List[int] = []
+        self.boxes: Dict[int, List[Dict]] = {}
+        self.complete = False
+
+        # Min-heap of (score, frame_number, base64 JPEG)
+        self._thumbnails = []
+
+    def begin(self, video_path, fps, total_frames, width, height, sample_rate):
+        """Reset the track for a new analysis pass."""
+        self.video_path = str(video_path)
+        self.fps = fps
+        self.total_frames = total_frames
+        self.width = width
+        self.height = height
+        self.sample_rate = sample_rate
+        self.analyzed_frames = []
+        self.boxes = {}
+        self.complete = False
+        self._thumbnails = []
+
+    def add_frame(self, frame_number: int, boxes: List[Dict]) -> None:
+        """
+        Record an analyzed frame.
+
+        Args:
+            frame_number: 1-based frame number.
+            boxes:        Bird boxes of the frame (may be empty).
+        """
+        self.analyzed_frames.append(frame_number)
+        if boxes:
+            self.boxes[frame_number] = boxes
+
+    def offer_thumbnail(self, frame_number: int, score: float, frame: np.ndarray) -> None:
+        """
+        Keep ``frame`` as a report thumbnail if it is among the best scores.
+
+        Only frames that make it into the top ``max_thumbnails`` are encoded;
+        a frame already kept is not added again.
+        """
+        if self.max_thumbnails <= 0:
+            return
+        if any(number == frame_number for _, number, _ in self._thumbnails):
+            return
+        if len(self._thumbnails) >= self.max_thumbnails and score <= self._thumbnails[0][0]:
+            return
+        entry = (score, frame_number, encode_thumbnail(frame))
+        if len(self._thumbnails) < self.max_thumbnails:
+            heapq.heappush(self._thumbnails, entry)
+        else:
+            heapq.heapreplace(self._thumbnails, entry)
+
+    def finish(self) -> None:
+        """Mark the pass as complete; consumers ignore incomplete tracks."""
+        self.complete = True
+
+    # ── Consumer helpers ─────────────────────────────────────────────────────
+
+    def boxes_at(self, frame_number: int) -> List[Dict]:
+        """Bird boxes of an analyzed frame (empty list if none)."""
+        return self.boxes.get(frame_number, [])
+
+    def bird_frames(self) -> List[int]:
+        """Sorted 1-based frame numbers with at least one bird."""
+        return sorted(self.boxes)
+
+    def thumbnail(self, frame_number: int) -> Optional[str]:
+        """Base64 JPEG of a frame if it was kept as thumbnail."""
+        for _, number, image in self._thumbnails:
+            if number == frame_number:
+                return image
+        return None
@@ -0,0 +1,281 @@
+"""
+Engine-independent helpers for YOLO detectors that do not run through
+ultralytics (Hailo NPU, ONNX Runtime).
+
+  * Ultralytics-compatible result objects (``_MockResult`` / ``_MockBoxes``),
+    so VideoAnalyzer handles every engine's output the same way
+  * Letterbox preprocessing as used by ultralytics (aspect-preserving resize,
+    grey padding) and the matching box back-projection
+  * Vectorized NumPy non-maximum suppression
+"""
+
+import cv2
+import numpy as np
+
+# Padding value of ultralytics' letterbox
+LETTERBOX_COLOR = 114
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Ultralytics-compatible result objects
+# ──────────────────────────────────────────────────────────────────────────────
+
+class _TensorLike:
+    """
+    Numpy-backed stub with .cpu().numpy() interface to match ultralytics tensors.
+    Supports indexing so box.cls[0] and box.xyxy[0] work as expected.
+    """
+
+    def __init__(self, data):
+        self._data = np.asarray(data, dtype=np.float32)
+
+    def __getitem__(self, idx):
+        return _TensorLike(self._data[idx])
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._data
+
+    def __float__(self):
+        return float(self._data.flat[0])
+
+    def __int__(self):
+        return int(self._data.flat[0])
+
+    def __repr__(self):
+        return f"_TensorLike({self._data})"
+
+
+class _MockBox:
+    """
+    Single detection box that mimics the ultralytics Boxes element API:
+      box.cls[0]            -> class id
+      box.conf[0]           -> confidence
+      box.xyxy[0].cpu().numpy() -> [x1, y1, x2, y2] in pixel coordinates
+    """
+
+    def __init__(self, x1: float, y1: float, x2: float, y2: float,
+                 conf: float, cls_id: int):
+        self.cls = _TensorLike([float(cls_id)])
+        self.conf = _TensorLike([float(conf)])
+        self.xyxy = _TensorLike([[float(x1), float(y1), float(x2), float(y2)]])
+
+
+class _MockBoxes:
+    """
+    Detection boxes of one frame mimicking ultralytics Boxes.
+
+    Backed by one (N, 6) float32 array [x1, y1, x2, y2, conf, cls], like
+    ultralytics:
+      boxes.data            -> (N, 6) array
+      boxes.xyxy / .conf / .cls
+    Per-box _MockBox views are only created when the boxes are iterated.
+    """
+
+    def __init__(self, boxes):
+        """
+        Args:
+            boxes: (N, 6) array-like of [x1, y1, x2, y2, conf, cls] rows, or
+                   a list of _MockBox objects
+        """
+        if isinstance(boxes, (list, tuple)) and boxes and isinstance(boxes[0], _MockBox):
+            boxes = [
+                [*box.xyxy.numpy()[0], box.conf.numpy()[0], box.cls.numpy()[0]]
+                for box in boxes
+            ]
+        self._data = _TensorLike(np.asarray(boxes, dtype=np.float32).reshape(-1, 6))
+
+    def __iter__(self):
+        return (_MockBox(*row) for row in self._data.numpy().tolist())
+
+    def __len__(self):
+        return len(self._data.numpy())
+
+    @property
+    def data(self) -> _TensorLike:
+        return self._data
+
+    @property
+    def xyxy(self) -> _TensorLike:
+        return self.data[:, :4]
+
+    @property
+    def conf(self) -> _TensorLike:
+        return self.data[:, 4]
+
+    @property
+    def cls(self) -> _TensorLike:
+        return self.data[:, 5]
+
+
+class _MockResult:
+    """Detection result mimicking ultralytics Results with a .boxes attribute."""
+
+    def __init__(self, boxes):
+        self.boxes = _MockBoxes(boxes)
+
+
+def make_result(xyxy, conf, cls) -> _MockResult:
+    """
+    Build an ultralytics-style result from detection arrays.
+
+    Args:
+        xyxy: (N, 4) pixel coordinates
+        conf: (N,) confidences
+        cls:  (N,) class ids
+
+    Returns:
+        _MockResult
+    """
+    xyxy = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4)
+    data = np.empty((len(xyxy), 6), dtype=np.float32)
+    data[:, :4] = xyxy
+    data[:, 4] = conf
+    data[:, 5] = cls
+    return _MockResult(data)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Letterbox preprocessing
+# ──────────────────────────────────────────────────────────────────────────────
+
+def letterbox(frame: np.ndarray, size, color: int = LETTERBOX_COLOR, out: np.ndarray = None):
+    """
+    Resize a frame into (height, width) keeping its aspect ratio, padding
+    the remaining border evenly with ``color``.
+
+    Args:
+        frame: (H, W, 3) uint8 image
+        size:  Target (height, width)
+        color: Padding value
+        out:   Optional preallocated (height, width, 3) uint8 array (e.g. one
+               slot of a reused batch buffer).  The frame is resized straight
+               into it and only the padding strips are filled.
+
+    Returns:
+        (image, scale, (pad_x, pad_y)) - the letterboxed image (``out`` when
+        given), the resize factor and the left/top padding in pixels
+    """
+    target_h, target_w = size
+    frame_h, frame_w = frame.shape[:2]
+    scale = min(target_h / frame_h, target_w / frame_w)
+    new_w, new_h = int(round(frame_w * scale)), int(round(frame_h * scale))
+    pad_x = (target_w - new_w) // 2
+    pad_y = (target_h - new_h) // 2
+
+    if out is None:
+        image = np.full((target_h, target_w, frame.shape[2]), color, dtype=np.uint8)
+    else:
+        image = out
+        image[:pad_y] = color
+        image[pad_y + new_h:] = color
+        image[pad_y:pad_y + new_h, :pad_x] = color
+        image[pad_y:pad_y + new_h, pad_x + new_w:] = color
+
+    inner = image[pad_y:pad_y + new_h, pad_x:pad_x + new_w]
+    if (new_w, new_h) != (frame_w, frame_h):
+        resized = cv2.resize(frame, (new_w, new_h), dst=inner, interpolation=cv2.INTER_LINEAR)
+        if resized is not inner:
+            inner[...] = resized
+    else:
+        inner[...] = frame
+    return image, scale, (pad_x, pad_y)
+
+
+def scale_boxes(xyxy: np.ndarray, scale: float, pad, frame_shape) -> np.ndarray:
+    """
+    Map boxes from letterboxed input coordinates back to the original frame.
+
+    Args:
+        xyxy: (N, 4) boxes in model input pixels
+        scale: Resize factor returned by letterbox()
+        pad: (pad_x, pad_y) returned by letterbox()
+        frame_shape: Shape of the original frame
+
+    Returns:
+        (N, 4) float32 boxes clipped to the frame
+    """
+    pad_x, pad_y = pad
+    boxes = (np.asarray(xyxy, dtype=np.float32) - [pad_x, pad_y, pad_x, pad_y]) / scale
+    frame_h, frame_w = frame_shape[:2]
+    np.clip(boxes[:, 0::2], 0, frame_w, out=boxes[:, 0::2])
+    np.clip(boxes[:, 1::2], 0, frame_h, out=boxes[:, 1::2])
+    return boxes
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Non-maximum suppression
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _pairwise_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(N, M) IoU of two float32 xyxy box arrays."""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return intersection / np.maximum(area_a[:, None] + area_b[None, :] - intersection, 1e-9)
+
+
+# Boxes resolved together per step of nms()
+NMS_BLOCK_SIZE = 256
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    Greedy non-maximum suppression.
+
+    Boxes are visited in blocks of NMS_BLOCK_SIZE in score order: the greedy
+    pass inside a block works on a precomputed block IoU matrix, then the
+    block's kept boxes suppress all later boxes in one vectorized step.
+    The result is identical to box-by-box greedy NMS.
+
+    Args:
+        boxes: (N, 4) x1, y1, x2, y2
+        scores: (N,) confidences
+        iou_threshold: Overlap above which the weaker box is suppressed
+
+    Returns:
+        Indices of the kept boxes, best score first
+    """
+    order = np.argsort(-np.asarray(scores), kind='stable')
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)[order]
+    keep = np.ones(len(order), dtype=bool)
+
+    for start in range(0, len(order), NMS_BLOCK_SIZE):
+        stop = min(start + NMS_BLOCK_SIZE, len(order))
+        alive = keep[start:stop]  # view – updated in place
+        if not alive.any():
+            continue
+
+        block = boxes[start:stop]
+        overlaps = _pairwise_iou(block, block) > iou_threshold
+        for i in range(len(block)):
+            if alive[i]:
+                alive[i + 1:] &= ~overlaps[i, i + 1:]
+
+        later = np.flatnonzero(keep[stop:]) + stop
+        if len(later):
+            suppressed = (_pairwise_iou(block[alive], boxes[later]) > iou_threshold).any(axis=0)
+            keep[later[suppressed]] = False
+
+    return order[keep]
+
+
+def batched_nms(boxes: np.ndarray, scores: np.ndarray, classes: np.ndarray,
+                iou_threshold: float) -> np.ndarray:
+    """
+    Per-class NMS (boxes of different classes never suppress each other).
+
+    Boxes are shifted by a class-dependent offset so a single nms() call
+    handles all classes, like ultralytics' non_max_suppression.
+    """
+    boxes = np.asarray(boxes, dtype=np.float32)
+    if boxes.size == 0:
+        return np.empty(0, dtype=np.int64)
+    offset = np.asarray(classes, dtype=np.float32)[:, None] * (float(boxes.max()) + 1.0)
+    return nms(boxes + offset, scores, iou_threshold)
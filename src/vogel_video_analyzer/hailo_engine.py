@@ -56,10 +56,18 @@ Usage:
   from vogel_video_analyzer.hailo_engine import HailoDetector, HAILO_AVAILABLE
 """
 
-import numpy as np
-import cv2
+import contextlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import numpy as np
 from .i18n import t
+# Result adapters live in detection_utils (shared with the ONNX engine);
+# re-exported here for existing imports
+from .detection_utils import _TensorLike, _MockBox, _MockBoxes, _MockResult
+from .detection_utils import letterbox, scale_boxes, nms
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Optional HailoRT import
@@ -154,73 +162,6 @@ except ImportError:
     HAILO_AVAILABLE = False
 
 
-# ──────────────────────────────────────────────────────────────────────────────
-# Ultralytics-compatible mock objects
-# ──────────────────────────────────────────────────────────────────────────────
-
-class _TensorLike:
-    """
-    Numpy-backed stub with .cpu().numpy() interface to match ultralytics tensors.
-    Supports indexing so box.cls[0] and box.xyxy[0] work as expected.
-    """
-
-    def __init__(self, data):
-        self._data = np.asarray(data, dtype=np.float32)
-
-    def __getitem__(self, idx):
-        return _TensorLike(self._data[idx])
-
-    def cpu(self):
-        return self
-
-    def numpy(self):
-        return self._data
-
-    def __float__(self):
-        return float(self._data.flat[0])
-
-    def __int__(self):
-        return int(self._data.flat[0])
-
-    def __repr__(self):
-        return f"_TensorLike({self._data})"
-
-
-class _MockBox:
-    """
-    Single detection box that mimics the ultralytics Boxes element API:
-      box.cls[0]            -> class id
-      box.conf[0]           -> confidence
-      box.xyxy[0].cpu().numpy() -> [x1, y1, x2, y2] in pixel coordinates
-    """
-
-    def __init__(self, x1: float, y1: float, x2: float, y2: float,
-                 conf: float, cls_id: int):
-        self.cls = _TensorLike([float(cls_id)])
-        self.conf = _TensorLike([float(conf)])
-        self.xyxy = _TensorLike([[float(x1), float(y1), float(x2), float(y2)]])
-
-
-class _MockBoxes:
-    """Collection of _MockBox objects mimicking ultralytics Boxes."""
-
-    def __init__(self, boxes: list):
-        self._boxes = boxes
-
-    def __iter__(self):
-        return iter(self._boxes)
-
-    def __len__(self):
-        return len(self._boxes)
-
-
-class _MockResult:
-    """Detection result mimicking ultralytics Results with a .boxes attribute."""
-
-    def __init__(self, boxes: list):
-        self.boxes = _MockBoxes(boxes)
-
-
 # ──────────────────────────────────────────────────────────────────────────────
 # Main Hailo detector class
 # ──────────────────────────────────────────────────────────────────────────────
@@ -231,8 +172,21 @@ class HailoDetector:
 
     The detector emulates the ultralytics YOLO callable interface:
         results = detector(frame, verbose=False)
+        results = detector([frame1, frame2], verbose=False)   # one result per frame
     so it can be used as a drop-in replacement for ``self.model`` in VideoAnalyzer.
 
+    Frames are letterboxed (aspect ratio kept, grey padding) into reused
+    input buffers; boxes are mapped back to the original frame.
+
+    The network group is activated and the vstreams are opened once for the
+    detector's lifetime (``close()`` or a ``with`` block releases them).
+    ``submit()``/``collect()`` pipeline the work: the frames are preprocessed
+    in the calling thread while the previous batch is still on the NPU.
+
+        detector.submit(frames_a)
+        detector.submit(frames_b)          # preprocessed during inference of a
+        results_a = detector.collect()
+
     Two output modes are supported automatically:
       * NMS-integrated HEF  – single output tensor (N, 6): x1,y1,x2,y2,conf,cls
         (coordinates normalised 0-1)
@@ -245,7 +199,16 @@ class HailoDetector:
     # Standard COCO resolution used by most Hailo-compiled YOLO models
     DEFAULT_INPUT_SIZE = (640, 640)  # (height, width)
 
-    def __init__(self, hef_path: str, input_size=None, num_classes: int = 80):
+    # VideoAnalyzer passes whole frame batches to __call__
+    supports_batch = True
+
+    # Raw feature-map decoding (strides 8/16/32, class-agnostic NMS)
+    STRIDES = (8, 16, 32)
+    IOU_THRESH = 0.45
+    CONF_THRESH = 0.01
+
+    def __init__(self, hef_path: str, input_size=None, num_classes: int = 80,
+                 target_classes=None):
         """
         Initialise the Hailo inference engine.
 
@@ -255,6 +218,9 @@ class HailoDetector:
                          from the HEF when None.
             num_classes: Number of output classes.  80 for standard COCO;
                          adjust when using a custom-trained model.
+            target_classes: Class ids to keep (e.g. [14] for COCO bird).
+                         Other detections are dropped while decoding.
+                         None keeps every class.
 
         Raises:
             RuntimeError:    hailo_platform is not installed.
@@ -268,6 +234,9 @@ class HailoDetector:
             raise FileNotFoundError(t('hailo_hef_not_found').format(name=hef_path))
 
         self.num_classes = num_classes
+        self.target_classes = None if target_classes is None else np.asarray(target_classes, dtype=np.float32)
+        self._grids = {}
+        self._free_buffers = {}
 
         # ── Load the compiled model ──────────────────────────────────────────
         self._hef = HEF(str(self.hef_path))
@@ -310,46 +279,150 @@ class HailoDetector:
             f"   \u26a1 {t('hailo_engine_info').format(model=self.hef_path.name, w=self._input_w, h=self._input_h, mode=mode)}"
         )
 
+        # ── Activate once and keep the vstreams open ─────────────────────────
+        self._resources = contextlib.ExitStack()
+        try:
+            self._resources.enter_context(
+                self._network_group.activate(self._network_group_params)
+            )
+            self._pipeline = self._resources.enter_context(
+                InferVStreams(self._network_group, self._input_params, self._output_params)
+            )
+        except Exception:
+            self._resources.close()
+            raise
+
+        # A single worker owns the vstreams; sync calls and submit() share it
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='vogel-hailo')
+        self._pending = deque()
+        self._closed = False
+
     # ── Public interface ─────────────────────────────────────────────────────
 
-    def __call__(self, frame: np.ndarray, verbose: bool = False, **kwargs):
+    def __call__(self, frames, verbose: bool = False, **kwargs):
         """
-        Run inference on a single BGR frame.
+        Run inference on one BGR frame or a list of frames.
 
         Args:
-            frame:   numpy array (H, W, 3) in BGR format (OpenCV default).
+            frames:  numpy array (H, W, 3) in BGR format (OpenCV default), or
+                     a list of such frames (any sizes) inferred as one batch.
             verbose: ignored – present only for API compatibility.
 
         Returns:
-            List[_MockResult] – one element, mimicking ultralytics output.
+            List[_MockResult] – one element per frame, mimicking ultralytics output.
         """
-        frame_h, frame_w = frame.shape[:2]
-
-        # Preprocess: resize + keep as uint8 (HailoRT expects uint8 NHWC)
-        resized = cv2.resize(frame, (self._input_w, self._input_h))
-        input_arr = resized[np.newaxis]  # (1, H, W, 3)
-
-        input_data = {self._input_name: input_arr}
-
-        # Run on Hailo NPU
-        with self._network_group.activate(self._network_group_params):
-            with InferVStreams(
-                self._network_group,
-                self._input_params,
-                self._output_params,
-            ) as pipeline:
-                output_data = pipeline.infer(input_data)
-
-        # Post-process
-        if self._has_nms_output:
-            detections = self._parse_nms_output(output_data, frame_w, frame_h)
-        else:
-            detections = self._parse_multi_output(output_data, frame_w, frame_h)
+        return self._submit_job(frames).result()
+
+    def submit(self, frames):
+        """
+        Queue one frame or a list of frames for asynchronous inference.
 
-        return [_MockResult(detections)]
+        Preprocessing runs in the calling thread; inference and decoding run
+        on the detector's worker thread, so the caller can decode and
+        preprocess the next frames meanwhile.
+
+        Args:
+            frames: BGR frame or list of BGR frames
+
+        Returns:
+            concurrent.futures.Future resolving to List[_MockResult]
+        """
+        future = self._submit_job(frames)
+        self._pending.append(future)
+        return future
+
+    def collect(self):
+        """
+        Wait for the oldest submitted batch and return its results.
+
+        Returns:
+            List[_MockResult] – one element per frame of that batch
+
+        Raises:
+            IndexError: Nothing was submitted.
+        """
+        if not self._pending:
+            raise IndexError("no pending Hailo inference")
+        return self._pending.popleft().result()
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted batches not collected yet."""
+        return len(self._pending)
+
+    def close(self):
+        """Close the vstreams, deactivate the network group and release the device."""
+        if getattr(self, '_closed', True):
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        self._pending.clear()
+        try:
+            self._resources.close()
+        finally:
+            self._pipeline = None
+            if hasattr(self, "_device"):
+                del self._device
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     # ── Private helpers ──────────────────────────────────────────────────────
 
+    def _submit_job(self, frames):
+        """Preprocess in the calling thread and queue inference on the worker."""
+        if self._closed:
+            raise RuntimeError("HailoDetector is closed")
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = [frames]
+        batch, geometry = self._preprocess(frames)
+        return self._executor.submit(self._infer, batch, geometry)
+
+    def _preprocess(self, frames):
+        """
+        Letterbox frames into a reused uint8 NHWC batch buffer (HailoRT
+        expects uint8 NHWC).
+
+        Returns:
+            (batch, geometry) tuple: (B, H, W, 3) buffer and one
+            (scale, pad, frame_shape) tuple per frame for the inverse mapping
+        """
+        batch = self._acquire_buffer(len(frames))
+        geometry = []
+        for index, frame in enumerate(frames):
+            _, scale, pad = letterbox(frame, (self._input_h, self._input_w), out=batch[index])
+            geometry.append((scale, pad, frame.shape))
+        return batch, geometry
+
+    def _acquire_buffer(self, batch_size: int) -> np.ndarray:
+        """Take a free input buffer for batch_size frames (allocated on first use)."""
+        free = self._free_buffers.setdefault(batch_size, [])
+        try:
+            return free.pop()
+        except IndexError:
+            return np.empty((batch_size, self._input_h, self._input_w, 3), dtype=np.uint8)
+
+    def _infer(self, batch: np.ndarray, geometry) -> list:
+        """Run one batch through the open vstreams and decode every frame."""
+        try:
+            output_data = self._pipeline.infer({self._input_name: batch})
+        finally:
+            # infer() has consumed the input; the buffer can take the next batch
+            self._free_buffers[len(batch)].append(batch)
+
+        results = []
+        for index, (scale, pad, frame_shape) in enumerate(geometry):
+            frame_output = {name: output[index] for name, output in output_data.items()}
+            if self._has_nms_output:
+                detections = self._parse_nms_output(frame_output, scale, pad, frame_shape)
+            else:
+                detections = self._parse_multi_output(frame_output, scale, pad, frame_shape)
+            results.append(_MockResult(detections))
+        return results
+
     def _detect_nms_output(self, output_infos) -> bool:
         """
         Heuristic: a single output whose last dimension is 6 indicates
@@ -361,128 +434,129 @@ class HailoDetector:
                 return True
         return False
 
-    def _parse_nms_output(self, output_data: dict,
-                          orig_w: int, orig_h: int) -> list:
+    def _to_frame(self, boxes: np.ndarray, scale: float, pad, frame_shape) -> np.ndarray:
+        """Map input-pixel boxes back through the letterbox, clipped to whole frame pixels."""
+        return np.floor(scale_boxes(boxes, scale, pad, frame_shape))
+
+    def _parse_nms_output(self, output_data: dict, scale: float, pad,
+                          frame_shape) -> np.ndarray:
         """
         Parse NMS-integrated output (shape: (1, N, 6) or (N, 6)).
-        Coordinates are normalised to [0, 1].
+        Coordinates are normalised to [0, 1] of the letterboxed input.
+
+        Args:
+            output_data: Output tensors of one frame
+            scale, pad:  Letterbox geometry returned by letterbox()
+            frame_shape: Shape of the original frame
+
+        Returns:
+            (M, 6) float32 array [x1, y1, x2, y2, conf, cls] in whole frame
+            pixels, limited to target_classes when set
         """
-        raw = output_data[self._output_names[0]]
-        if raw.ndim == 3:
-            raw = raw[0]  # remove batch dim → (N, 6)
-
-        detections = []
-        for det in raw:
-            x1_n, y1_n, x2_n, y2_n, conf, cls_id = det
-            if conf <= 0.0:
-                continue
-            x1 = int(np.clip(x1_n * orig_w, 0, orig_w))
-            y1 = int(np.clip(y1_n * orig_h, 0, orig_h))
-            x2 = int(np.clip(x2_n * orig_w, 0, orig_w))
-            y2 = int(np.clip(y2_n * orig_h, 0, orig_h))
-            detections.append(_MockBox(x1, y1, x2, y2, float(conf), int(cls_id)))
+        raw = np.asarray(output_data[self._output_names[0]], dtype=np.float32).reshape(-1, 6)
+
+        keep = raw[:, 4] > 0.0
+        if self.target_classes is not None:
+            keep &= np.isin(raw[:, 5], self.target_classes)
+        detections = raw[keep]
 
+        # Normalised → input pixels → original frame pixels
+        input_size = np.array([self._input_w, self._input_h] * 2, dtype=np.float32)
+        detections[:, :4] = self._to_frame(detections[:, :4] * input_size, scale, pad, frame_shape)
         return detections
 
-    def _parse_multi_output(self, output_data: dict,
-                             orig_w: int, orig_h: int) -> list:
+    def _parse_multi_output(self, output_data: dict, scale: float, pad,
+                            frame_shape) -> np.ndarray:
         """
         Decode raw YOLOv8 anchor-free multi-scale outputs (3 tensors at
         strides 8, 16, 32) and apply NMS.
 
         Each tensor has shape (1, H, W, 4 + num_classes) where the first
         4 channels are the box regression (cx, cy, w, h in grid units).
+        Only the target_classes columns are scored when set; the score
+        threshold is applied to the logits, so boxes and sigmoid are only
+        computed for the surviving cells.
 
         Note: For best Hailo performance prefer an NMS-integrated HEF.
+
+        Args:
+            output_data: Output tensors of one frame
+            scale, pad:  Letterbox geometry returned by letterbox()
+            frame_shape: Shape of the original frame
+
+        Returns:
+            (M, 6) float32 array [x1, y1, x2, y2, conf, cls] in whole frame pixels
         """
-        STRIDES = [8, 16, 32]
-        IOU_THRESH = 0.45
-        CONF_THRESH = 0.01
+        # sigmoid(x) > CONF_THRESH  ⇔  x > logit(CONF_THRESH)
+        logit_thresh = np.log(self.CONF_THRESH / (1.0 - self.CONF_THRESH))
+        columns = None if self.target_classes is None else self.target_classes.astype(np.intp)
 
         all_boxes: list = []
-        all_scores: list = []
+        all_logits: list = []
         all_classes: list = []
 
-        for name, stride in zip(sorted(self._output_names), STRIDES):
+        for name, stride in zip(sorted(self._output_names), self.STRIDES):
             if name not in output_data:
                 continue
-            pred = output_data[name]
+            pred = np.asarray(output_data[name])
             if pred.ndim == 4:
                 pred = pred[0]  # remove batch dim → (H, W, C)
 
-            grid_h, grid_w = pred.shape[:2]
-
-            box_pred = pred[..., :4]       # cx, cy, w, h – grid-unit
-            cls_pred = pred[..., 4:]       # raw class logits
-
-            cls_scores = 1.0 / (1.0 + np.exp(-cls_pred))  # sigmoid
-            cls_ids = np.argmax(cls_scores, axis=-1)
-            cls_confs = np.max(cls_scores, axis=-1)
+            grid_h, grid_w, channels = pred.shape
+            pred = pred.reshape(-1, channels)
 
-            xs = np.arange(grid_w, dtype=np.float32)
-            ys = np.arange(grid_h, dtype=np.float32)
-            grid_x, grid_y = np.meshgrid(xs, ys)
+            if columns is None:
+                logits = pred[:, 4:]
+            else:
+                present = columns[columns < channels - 4]
+                if not len(present):
+                    continue
+                logits = pred[:, 4 + present]
+            cls_ids = np.argmax(logits, axis=1)
+            best_logits = logits[np.arange(len(cls_ids)), cls_ids]
 
-            # Anchor-free decode
-            cx = (grid_x + box_pred[..., 0]) * stride
-            cy = (grid_y + box_pred[..., 1]) * stride
-            w = np.exp(np.clip(box_pred[..., 2], -10, 10)) * stride
-            h = np.exp(np.clip(box_pred[..., 3], -10, 10)) * stride
-
-            # Normalise to [0, 1]
-            x1 = (cx - w / 2) / self._input_w
-            y1 = (cy - h / 2) / self._input_h
-            x2 = (cx + w / 2) / self._input_w
-            y2 = (cy + h / 2) / self._input_h
-
-            mask = cls_confs > CONF_THRESH
+            mask = best_logits > logit_thresh
             if not np.any(mask):
                 continue
 
-            all_boxes.append(np.stack([x1[mask], y1[mask], x2[mask], y2[mask]], axis=-1))
-            all_scores.append(cls_confs[mask])
-            all_classes.append(cls_ids[mask])
+            # Anchor-free decode of the surviving cells – grid units → input pixels
+            box_pred = pred[mask, :4]
+            grid = self._grid(grid_h, grid_w)[mask]
+            centers = (grid + box_pred[:, :2]) * stride
+            half_sizes = np.exp(np.clip(box_pred[:, 2:4], -10, 10)) * (stride / 2)
+
+            all_boxes.append(np.concatenate([centers - half_sizes, centers + half_sizes], axis=1))
+            all_logits.append(best_logits[mask])
+            all_classes.append(cls_ids[mask] if columns is None else present[cls_ids[mask]])
 
         if not all_boxes:
-            return []
+            return np.empty((0, 6), dtype=np.float32)
 
-        boxes_norm = np.concatenate(all_boxes)
-        scores = np.concatenate(all_scores)
+        # NMS in input pixels (IoU is unchanged by the uniform letterbox scale)
+        boxes = np.concatenate(all_boxes).astype(np.float32)
+        scores = 1.0 / (1.0 + np.exp(-np.concatenate(all_logits)))  # sigmoid
         classes = np.concatenate(all_classes)
 
-        # Scale to original frame pixels for NMS
-        boxes_px = boxes_norm * np.array([orig_w, orig_h, orig_w, orig_h],
-                                          dtype=np.float32)
-        # cv2.dnn.NMSBoxes expects [x, y, w, h]
-        boxes_xywh = [
-            [float(b[0]), float(b[1]),
-             float(b[2] - b[0]), float(b[3] - b[1])]
-            for b in boxes_px
-        ]
-
-        indices = cv2.dnn.NMSBoxes(
-            boxes_xywh, scores.tolist(), CONF_THRESH, IOU_THRESH
-        )
-        if len(indices) == 0:
-            return []
-
-        indices = [int(i) for i in np.array(indices).flatten()]
-        detections = []
-        for idx in indices:
-            x1 = int(np.clip(boxes_px[idx, 0], 0, orig_w))
-            y1 = int(np.clip(boxes_px[idx, 1], 0, orig_h))
-            x2 = int(np.clip(boxes_px[idx, 2], 0, orig_w))
-            y2 = int(np.clip(boxes_px[idx, 3], 0, orig_h))
-            detections.append(
-                _MockBox(x1, y1, x2, y2, float(scores[idx]), int(classes[idx]))
-            )
+        keep = nms(boxes, scores, self.IOU_THRESH)
 
+        detections = np.empty((len(keep), 6), dtype=np.float32)
+        detections[:, :4] = self._to_frame(boxes[keep], scale, pad, frame_shape)
+        detections[:, 4] = scores[keep]
+        detections[:, 5] = classes[keep]
         return detections
 
+    def _grid(self, grid_h: int, grid_w: int) -> np.ndarray:
+        """(grid_h * grid_w, 2) array of cell (x, y) offsets, cached per feature-map size."""
+        grid = self._grids.get((grid_h, grid_w))
+        if grid is None:
+            grid_y, grid_x = np.mgrid[0:grid_h, 0:grid_w].astype(np.float32)
+            grid = np.stack([grid_x.ravel(), grid_y.ravel()], axis=1)
+            self._grids[(grid_h, grid_w)] = grid
+        return grid
+
     def __del__(self):
         """Release Hailo device resources."""
         try:
-            if hasattr(self, "_device"):
-                del self._device
+            self.close()
         except Exception:
             pass
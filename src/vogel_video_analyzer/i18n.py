@@ -167,6 +167,92 @@ TRANSLATIONS = {
         'hailo_export_zoo_link': 'Hailo Model Zoo (pre-compiled HEFs): https://github.com/hailo-ai/hailo_model_zoo',
         'hailo_onnx_not_installed': 'ultralytics is required for ONNX export.\nInstall with: pip install \'ultralytics>=8.4.14\'',
         'hailo_model_not_found': 'Model not found: {path}',
+
+        # Parallel analysis (--workers)
+        'workers_starting': 'Analyzing {videos} videos with {workers} worker processes...',
+        'workers_hailo_single': '--workers is not supported with --engine hailo (the NPU is used by one process); analyzing sequentially',
+
+        # Analysis cache (--cache)
+        'cache_hit': 'Unchanged since last analysis, using cached result',
+        'cache_read_failed': 'Could not read analysis cache:',
+        'cache_write_failed': 'Could not write analysis cache:',
+
+        # Detection track
+        'track_reused': 'Reusing detections from the analysis pass',
+
+        # Summary rendering
+        'summary_single_pass_failed': 'Single-pass rendering failed, falling back to per-segment extraction',
+
+        # Annotation writer
+        'annotation_ffmpeg_writer': 'Encoding H.264 with ffmpeg (preset {preset}, CRF {crf}), audio muxed in the same pass',
+
+        # Bird tracking (visits)
+        'report_bird_visits': 'Bird Visits:',
+        'species_visits': '{visits} visits',
+
+        # Species classifier ONNX engine
+        'species_onnx_exporting': 'Exporting species model {model} to ONNX (one-time)...',
+        'species_onnx_exported': 'ONNX model saved: {path}',
+        'species_onnx_cached': 'Using cached ONNX model: {path}',
+        'species_onnx_unsupported_processor': 'Image processor of {model} has no fixed input size - ONNX export not supported',
+        'species_onnx_export_missing': 'ONNX export requires transformers and torch: pip install vogel-video-analyzer[species]',
+        'species_onnx_runtime_missing': 'ONNX engine requires onnxruntime: pip install vogel-video-analyzer[species-onnx]',
+
+        # ONNX Runtime detector engine
+        'onnx_engine_info': 'ONNX Runtime │ {model} │ input {w}×{h} │ {provider}',
+        'onnx_not_installed': 'onnxruntime is not installed. Install with: pip install onnxruntime',
+        'onnx_model_not_found': 'ONNX model not found: {path} (create it with: vogel-analyze --export-onnx model.pt)',
+
+        # Motion gating
+        'motion_gate_info': 'Motion gate: YOLO only runs when at least {threshold:.2f}% of the image changed',
+        'report_frames_gated': 'Frames without motion (YOLO skipped):',
+
+        # Adaptive sampling
+        'adaptive_sampling_info': 'Adaptive sampling: every {coarse}. frame, every {fine}. frame while birds are in view (back after {n} empty samples)',
+        'report_adaptive_sampling': 'Adaptive sampling: every {coarse}./{fine}. frame, {n} frames backfilled',
+
+        # Downscaled detection
+        'detect_width_info': 'Detection at {width}x{height} ({decoder}), species crops at full resolution',
+        'report_detect_resolution': 'Detection resolution:',
+
+        # Frame reader backends
+        'pyav_not_installed': 'PyAV is not installed. Install with: pip install av',
+        'keyframes_only_requires_pyav': 'Keyframe-only decoding requires the PyAV decoder (--decoder pyav)',
+        'decoder_info': 'Decoder: {decoder}',
+        'decoder_keyframes_only': 'keyframes only',
+
+        # Triage scan
+        'triage_scan': 'Triage: checking {frames} at least {seconds:g}s apart',
+        'triage_keyframes': 'keyframes',
+        'triage_frames': 'frames',
+        'triage_bird': 'Triage: confident bird detection after {n} frames - scan stopped',
+        'triage_empty': 'Triage: no detection in {n} frames',
+        'triage_escalate': 'Triage inconclusive - running the full analysis',
+        'triage_ignored': '--triage is ignored with --annotate-video, --create-summary and --html-report (they need the full analysis)',
+        'report_triage': 'Triage:',
+        'report_triage_bird': 'bird found ({n} frames checked)',
+        'report_triage_empty': 'no bird ({n} frames checked)',
+        'report_triage_escalated': 'inconclusive after {n} frames, fully analyzed',
+
+        # Early exit
+        'early_exit_bound_fixed_rate': '--min-bird-percentage requires a fixed sample rate (not with --adaptive-sampling or --keyframes-only)',
+        'early_exit_first_bird': 'Stopped early: first bird at frame {frame}',
+        'early_exit_above_bound': 'Stopped early at frame {frame}: bird percentage reaches {percent:g}%',
+        'early_exit_below_bound': 'Stopped early at frame {frame}: bird percentage stays below {percent:g}%',
+        'early_exit_ignored': 'Early exit is ignored with --annotate-video and --create-summary (they need the whole video)',
+        'report_early_exit': 'Early exit:',
+        'report_early_exit_first_bird': 'first bird at frame {frame}',
+        'report_early_exit_above_bound': 'bird percentage bound reached at frame {frame}',
+        'report_early_exit_below_bound': 'bird percentage bound out of reach at frame {frame}',
+
+        # Deletion with rendered outputs
+        'delete_skipped_render_outputs': '--delete-file/--delete-folder are ignored with --annotate-video and --create-summary',
+
+        # Deletion of triage verdicts
+        'delete_kept_triaged': 'Kept {video}: no bird in the triage scan only (delete with --delete-triaged)',
+
+        # Deletion of early-exit results
+        'delete_kept_early_exit': 'Kept {video}: analysis stopped early, later frames were not checked',
     },
 
     'de': {
@@ -327,6 +413,92 @@ TRANSLATIONS = {
         'hailo_export_zoo_link': 'Hailo Model Zoo (vorcompilierte HEFs): https://github.com/hailo-ai/hailo_model_zoo',
         'hailo_onnx_not_installed': 'ultralytics wird für den ONNX-Export benötigt.\nInstallieren mit: pip install \'ultralytics>=8.4.14\'',
         'hailo_model_not_found': 'Modell nicht gefunden: {path}',
+
+        # Parallel analysis (--workers)
+        'workers_starting': 'Analysiere {videos} Videos mit {workers} Worker-Prozessen...',
+        'workers_hailo_single': '--workers wird mit --engine hailo nicht unterstützt (die NPU wird von einem Prozess belegt); Analyse erfolgt nacheinander',
+
+        # Analysis cache (--cache)
+        'cache_hit': 'Seit der letzten Analyse unverändert, verwende gespeichertes Ergebnis',
+        'cache_read_failed': 'Analyse-Cache konnte nicht gelesen werden:',
+        'cache_write_failed': 'Analyse-Cache konnte nicht geschrieben werden:',
+
+        # Detection track
+        'track_reused': 'Verwende Erkennungen aus dem Analysedurchlauf',
+
+        # Summary rendering
+        'summary_single_pass_failed': 'Rendering in einem Durchlauf fehlgeschlagen, verwende Extraktion pro Segment',
+
+        # Annotation writer
+        'annotation_ffmpeg_writer': 'Kodiere H.264 mit ffmpeg (Preset {preset}, CRF {crf}), Audio wird im selben Durchlauf eingebunden',
+
+        # Bird tracking (visits)
+        'report_bird_visits': 'Vogelbesuche:',
+        'species_visits': '{visits} Besuche',
+
+        # Species classifier ONNX engine
+        'species_onnx_exporting': 'Exportiere Artenmodell {model} nach ONNX (einmalig)...',
+        'species_onnx_exported': 'ONNX-Modell gespeichert: {path}',
+        'species_onnx_cached': 'Verwende zwischengespeichertes ONNX-Modell: {path}',
+        'species_onnx_unsupported_processor': 'Bildprozessor von {model} hat keine feste Eingabegröße - ONNX-Export nicht unterstützt',
+        'species_onnx_export_missing': 'ONNX-Export benötigt transformers und torch: pip install vogel-video-analyzer[species]',
+        'species_onnx_runtime_missing': 'ONNX-Engine benötigt onnxruntime: pip install vogel-video-analyzer[species-onnx]',
+
+        # ONNX Runtime detector engine
+        'onnx_engine_info': 'ONNX Runtime │ {model} │ Eingabe {w}×{h} │ {provider}',
+        'onnx_not_installed': 'onnxruntime ist nicht installiert. Installation: pip install onnxruntime',
+        'onnx_model_not_found': 'ONNX-Modell nicht gefunden: {path} (erstellen mit: vogel-analyze --export-onnx model.pt)',
+
+        # Motion gating
+        'motion_gate_info': 'Bewegungsfilter: YOLO läuft nur, wenn sich mindestens {threshold:.2f}% des Bildes geändert haben',
+        'report_frames_gated': 'Frames ohne Bewegung (YOLO übersprungen):',
+
+        # Adaptive sampling
+        'adaptive_sampling_info': 'Adaptive Abtastung: jeder {coarse}. Frame, jeder {fine}. Frame solange Vögel sichtbar sind (zurück nach {n} leeren Samples)',
+        'report_adaptive_sampling': 'Adaptive Abtastung: jeder {coarse}./{fine}. Frame, {n} Frames nachträglich analysiert',
+
+        # Downscaled detection
+        'detect_width_info': 'Erkennung mit {width}x{height} ({decoder}), Arten-Ausschnitte in voller Auflösung',
+        'report_detect_resolution': 'Erkennungsauflösung:',
+
+        # Frame reader backends
+        'pyav_not_installed': 'PyAV ist nicht installiert. Installieren mit: pip install av',
+        'keyframes_only_requires_pyav': 'Nur-Keyframe-Dekodierung erfordert den PyAV-Decoder (--decoder pyav)',
+        'decoder_info': 'Decoder: {decoder}',
+        'decoder_keyframes_only': 'nur Keyframes',
+
+        # Triage scan
+        'triage_scan': 'Triage: prüfe {frames} im Abstand von mindestens {seconds:g}s',
+        'triage_keyframes': 'Keyframes',
+        'triage_frames': 'Frames',
+        'triage_bird': 'Triage: sichere Vogelerkennung nach {n} Frames - Suche beendet',
+        'triage_empty': 'Triage: keine Erkennung in {n} Frames',
+        'triage_escalate': 'Triage nicht eindeutig - vollständige Analyse wird ausgeführt',
+        'triage_ignored': '--triage wird mit --annotate-video, --create-summary und --html-report ignoriert (diese benötigen die vollständige Analyse)',
+        'report_triage': 'Triage:',
+        'report_triage_bird': 'Vogel gefunden ({n} Frames geprüft)',
+        'report_triage_empty': 'kein Vogel ({n} Frames geprüft)',
+        'report_triage_escalated': 'nach {n} Frames nicht eindeutig, vollständig analysiert',
+
+        # Early exit
+        'early_exit_bound_fixed_rate': '--min-bird-percentage erfordert eine feste Abtastrate (nicht mit --adaptive-sampling oder --keyframes-only)',
+        'early_exit_first_bird': 'Vorzeitig beendet: erster Vogel in Frame {frame}',
+        'early_exit_above_bound': 'Vorzeitig beendet bei Frame {frame}: Vogelanteil erreicht {percent:g}%',
+        'early_exit_below_bound': 'Vorzeitig beendet bei Frame {frame}: Vogelanteil bleibt unter {percent:g}%',
+        'early_exit_ignored': 'Vorzeitiges Beenden wird mit --annotate-video und --create-summary ignoriert (diese benötigen das ganze Video)',
+        'report_early_exit': 'Vorzeitig beendet:',
+        'report_early_exit_first_bird': 'erster Vogel in Frame {frame}',
+        'report_early_exit_above_bound': 'Vogelanteil-Grenze bei Frame {frame} erreicht',
+        'report_early_exit_below_bound': 'Vogelanteil-Grenze ab Frame {frame} unerreichbar',
+
+        # Deletion with rendered outputs
+        'delete_skipped_render_outputs': '--delete-file/--delete-folder werden mit --annotate-video und --create-summary ignoriert',
+
+        # Deletion of triage verdicts
+        'delete_kept_triaged': '{video} behalten: kein Vogel nur im Triage-Scan (löschen mit --delete-triaged)',
+
+        # Deletion of early-exit results
+        'delete_kept_early_exit': '{video} behalten: Analyse vorzeitig beendet, spätere Frames wurden nicht geprüft',
     },
     'ja': {
         # Loading and initialization
@@ -486,6 +658,92 @@ TRANSLATIONS = {
         'hailo_export_zoo_link': 'Hailo Model Zoo（プレコンパイルHEF）: https://github.com/hailo-ai/hailo_model_zoo',
         'hailo_onnx_not_installed': 'ONNXエクスポートにはultralytics が必要です。\nインストール：pip install \'ultralytics>=8.4.14\'',
         'hailo_model_not_found': 'モデルが見つかりません：{path}',
+
+        # Parallel analysis (--workers)
+        'workers_starting': '{workers}個のワーカープロセスで{videos}本の動画を解析しています...',
+        'workers_hailo_single': '--workers は --engine hailo では使用できません（NPUは1プロセスのみ使用可能）。順次解析します',
+
+        # Analysis cache (--cache)
+        'cache_hit': '前回の解析から変更がないため、キャッシュされた結果を使用します',
+        'cache_read_failed': '解析キャッシュを読み込めませんでした：',
+        'cache_write_failed': '解析キャッシュを書き込めませんでした：',
+
+        # Detection track
+        'track_reused': '解析パスの検出結果を再利用',
+
+        # Summary rendering
+        'summary_single_pass_failed': '単一パスのレンダリングに失敗しました。セグメントごとの抽出に切り替えます',
+
+        # Annotation writer
+        'annotation_ffmpeg_writer': 'ffmpegでH.264エンコード（プリセット {preset}、CRF {crf}）、音声は同じパスで多重化',
+
+        # Bird tracking (visits)
+        'report_bird_visits': '鳥の訪問数：',
+        'species_visits': '{visits}回の訪問',
+
+        # Species classifier ONNX engine
+        'species_onnx_exporting': '種分類モデル {model} をONNXにエクスポート中（初回のみ）...',
+        'species_onnx_exported': 'ONNXモデルを保存しました：{path}',
+        'species_onnx_cached': 'キャッシュ済みONNXモデルを使用：{path}',
+        'species_onnx_unsupported_processor': '{model} の画像プロセッサに固定入力サイズがないため、ONNXエクスポートはサポートされていません',
+        'species_onnx_export_missing': 'ONNXエクスポートにはtransformersとtorchが必要です：pip install vogel-video-analyzer[species]',
+        'species_onnx_runtime_missing': 'ONNXエンジンにはonnxruntimeが必要です：pip install vogel-video-analyzer[species-onnx]',
+
+        # ONNX Runtime detector engine
+        'onnx_engine_info': 'ONNX Runtime │ {model} │ 入力 {w}×{h} │ {provider}',
+        'onnx_not_installed': 'onnxruntimeがインストールされていません。インストール：pip install onnxruntime',
+        'onnx_model_not_found': 'ONNXモデルが見つかりません：{path}（作成方法：vogel-analyze --export-onnx model.pt）',
+
+        # Motion gating
+        'motion_gate_info': 'モーションゲート：画像の{threshold:.2f}%以上が変化した場合のみYOLOを実行します',
+        'report_frames_gated': '動きのないフレーム（YOLOをスキップ）：',
+
+        # Adaptive sampling
+        'adaptive_sampling_info': '適応サンプリング：{coarse}フレームごと、鳥がいる間は{fine}フレームごと（空のサンプル{n}回で戻る）',
+        'report_adaptive_sampling': '適応サンプリング：{coarse}/{fine}フレームごと、{n}フレームを遡って分析',
+
+        # Downscaled detection
+        'detect_width_info': '{width}x{height}で検出（{decoder}）、種の切り抜きはフル解像度',
+        'report_detect_resolution': '検出解像度：',
+
+        # Frame reader backends
+        'pyav_not_installed': 'PyAVがインストールされていません。インストール：pip install av',
+        'keyframes_only_requires_pyav': 'キーフレームのみのデコードにはPyAVデコーダーが必要です（--decoder pyav）',
+        'decoder_info': 'デコーダー：{decoder}',
+        'decoder_keyframes_only': 'キーフレームのみ',
+
+        # Triage scan
+        'triage_scan': 'トリアージ：{frames}を{seconds:g}秒以上の間隔で確認',
+        'triage_keyframes': 'キーフレーム',
+        'triage_frames': 'フレーム',
+        'triage_bird': 'トリアージ：{n}フレームで確実な鳥の検出 - スキャン終了',
+        'triage_empty': 'トリアージ：{n}フレームで検出なし',
+        'triage_escalate': 'トリアージで判定できません - 完全な解析を実行します',
+        'triage_ignored': '--triage は --annotate-video、--create-summary、--html-report と併用すると無視されます（完全な解析が必要です）',
+        'report_triage': 'トリアージ：',
+        'report_triage_bird': '鳥を検出（{n}フレームを確認）',
+        'report_triage_empty': '鳥なし（{n}フレームを確認）',
+        'report_triage_escalated': '{n}フレームで判定できず、完全に解析',
+
+        # Early exit
+        'early_exit_bound_fixed_rate': '--min-bird-percentage には固定サンプリングレートが必要です（--adaptive-sampling や --keyframes-only とは併用不可）',
+        'early_exit_first_bird': '早期終了：フレーム{frame}で最初の鳥',
+        'early_exit_above_bound': 'フレーム{frame}で早期終了：鳥の割合が{percent:g}%に達します',
+        'early_exit_below_bound': 'フレーム{frame}で早期終了：鳥の割合は{percent:g}%未満です',
+        'early_exit_ignored': '早期終了は --annotate-video と --create-summary では無視されます（動画全体が必要です）',
+        'report_early_exit': '早期終了：',
+        'report_early_exit_first_bird': 'フレーム{frame}で最初の鳥',
+        'report_early_exit_above_bound': 'フレーム{frame}で鳥の割合の基準に到達',
+        'report_early_exit_below_bound': 'フレーム{frame}で鳥の割合の基準に到達不可',
+
+        # Deletion with rendered outputs
+        'delete_skipped_render_outputs': '--delete-file/--delete-folder は --annotate-video と --create-summary では無視されます',
+
+        # Deletion of triage verdicts
+        'delete_kept_triaged': '{video} を保持: トリアージスキャンのみで鳥なし（削除するには --delete-triaged）',
+
+        # Deletion of early-exit results
+        'delete_kept_early_exit': '{video} を保持: 解析が早期終了したため、後続のフレームは確認されていません',
     }
 }
 
@@ -0,0 +1,93 @@
+"""
+Cheap motion pre-filter for sampled frames.
+
+Feeder cameras record long stretches of an unchanged scene. With
+``analyze_video(motion_gate=True)`` every sampled frame is first compared
+with the last frame the detector actually saw, on a small blurred grayscale
+copy. If (almost) no pixel changed, YOLO is skipped and the previous
+detection result is carried forward:
+
+    gate = MotionGate()
+    if gate.check(frame):
+        result = detector(frame)      # scene changed (or first frame)
+    else:
+        ...                           # reuse the previous result
+"""
+
+from typing import Optional
+
+import cv2
+import numpy as np
+
+# Width of the downscaled grayscale copy used for differencing
+DEFAULT_MOTION_WIDTH = 320
+# Per-pixel grey level difference that counts as a change (0-255)
+DEFAULT_PIXEL_THRESHOLD = 25
+# Fraction of changed pixels that counts as motion (0.0005 ≈ a 30×30 px
+# bird in a 1920×1080 frame)
+DEFAULT_MOTION_THRESHOLD = 0.0005
+# The detector runs at least once per this many seconds, even without motion
+DEFAULT_MOTION_REFRESH_SECONDS = 10.0
+
+
+class MotionGate:
+    """
+    Frame differencing against the last detector frame.
+
+    The reference frame is only replaced when motion is found, so slow
+    changes (a bird creeping in, shadows) accumulate until they pass the
+    threshold instead of being lost between consecutive samples.
+    """
+
+    def __init__(self, motion_threshold: float = DEFAULT_MOTION_THRESHOLD,
+                 pixel_threshold: int = DEFAULT_PIXEL_THRESHOLD,
+                 width: int = DEFAULT_MOTION_WIDTH, max_gated: Optional[int] = None):
+        """
+        Args:
+            motion_threshold: Fraction of changed pixels (0-1) that counts as motion
+            pixel_threshold: Grey level difference of a changed pixel
+            width: Width of the downscaled comparison image
+            max_gated: Force a detector run after this many consecutive gated
+                       frames (None: never)
+        """
+        self.motion_threshold = motion_threshold
+        self.pixel_threshold = pixel_threshold
+        self.width = width
+        self.max_gated = max_gated
+        self.frames_gated = 0
+        self._reference = None
+        self._consecutive = 0
+
+    def _prepare(self, image: np.ndarray) -> np.ndarray:
+        """Downscaled, blurred grayscale copy of a BGR frame."""
+        height, width = image.shape[:2]
+        if width > self.width:
+            size = (self.width, max(1, round(height * self.width / width)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def check(self, image: np.ndarray) -> bool:
+        """
+        Decide whether the detector has to run on a frame.
+
+        Args:
+            image: BGR frame
+
+        Returns:
+            True if the scene changed since the last detector frame (the
+            frame becomes the new reference), False if the frame is gated
+        """
+        small = self._prepare(image)
+        if (self._reference is not None and self._reference.shape == small.shape
+                and (self.max_gated is None or self._consecutive < self.max_gated)):
+            diff = cv2.absdiff(small, self._reference)
+            changed = np.count_nonzero(diff > self.pixel_threshold) / diff.size
+            if changed < self.motion_threshold:
+                self._consecutive += 1
+                self.frames_gated += 1
+                return False
+
+        self._reference = small
+        self._consecutive = 0
+        return True
@@ -0,0 +1,172 @@
+"""
+ONNX Runtime inference engine for YOLO models
+
+A lightweight CPU backend for edge boxes: runs an exported YOLO ONNX model
+with onnxruntime, letterbox preprocessing and NumPy NMS, without importing
+torch or ultralytics. Returns ultralytics-compatible result objects so the
+existing VideoAnalyzer pipeline works without changes (same interface as
+HailoDetector).
+
+The OpenVINO execution provider (``pip install onnxruntime-openvino``) is
+used automatically when installed, which speeds up inference on Intel CPUs.
+
+Export a model once (any machine with ultralytics):
+
+  vogel-analyze --export-onnx yolo26n.pt
+
+Then:
+
+  vogel-analyze --engine onnx --model yolo26n.onnx video.mp4
+
+Usage:
+  from vogel_video_analyzer.onnx_engine import OnnxDetector, ONNXRUNTIME_AVAILABLE
+"""
+
+import ast
+from pathlib import Path
+
+import numpy as np
+
+from .detection_utils import letterbox, scale_boxes, batched_nms, make_result
+from .i18n import t
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# Execution providers in order of preference (only installed ones are used)
+PREFERRED_PROVIDERS = (
+    "OpenVINOExecutionProvider",
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+)
+
+# Same defaults as ultralytics prediction
+DEFAULT_CONF_THRESHOLD = 0.25
+DEFAULT_IOU_THRESHOLD = 0.7
+DEFAULT_MAX_DETECTIONS = 300
+
+
+class OnnxDetector:
+    """
+    YOLO object detector running on ONNX Runtime.
+
+    The detector emulates the ultralytics YOLO callable interface:
+        results = detector(frame, verbose=False)
+    so it can be used as a drop-in replacement for ``self.model`` in VideoAnalyzer.
+
+    Two output layouts are supported automatically:
+      * End-to-end export – (1, N, 6): x1,y1,x2,y2,conf,cls in input pixels
+      * Raw head output   – (1, 4 + num_classes, anchors): cx,cy,w,h plus
+        class scores in input pixels; NMS applied in NumPy.
+    """
+
+    def __init__(self, onnx_path: str, conf_threshold: float = DEFAULT_CONF_THRESHOLD,
+                 iou_threshold: float = DEFAULT_IOU_THRESHOLD, max_det: int = DEFAULT_MAX_DETECTIONS,
+                 providers=None):
+        """
+        Initialise the ONNX Runtime inference engine.
+
+        Args:
+            onnx_path:      Path to the exported YOLO .onnx file.
+            conf_threshold: Minimum confidence kept before NMS (default 0.25,
+                            like ultralytics).
+            iou_threshold:  NMS IoU threshold (default 0.7, like ultralytics).
+            max_det:        Maximum detections per frame.
+            providers:      onnxruntime execution providers.  Defaults to the
+                            installed ones of PREFERRED_PROVIDERS.
+
+        Raises:
+            RuntimeError:      onnxruntime is not installed.
+            FileNotFoundError: ONNX file does not exist.
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise RuntimeError(t('onnx_not_installed'))
+
+        self.onnx_path = Path(onnx_path)
+        if not self.onnx_path.exists():
+            raise FileNotFoundError(t('onnx_model_not_found').format(path=onnx_path))
+
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+        self.max_det = max_det
+
+        if providers is None:
+            available = onnxruntime.get_available_providers()
+            providers = [p for p in PREFERRED_PROVIDERS if p in available] or available
+        self._session = onnxruntime.InferenceSession(str(self.onnx_path), providers=providers)
+
+        # ── Resolve input shape (NCHW) ───────────────────────────────────────
+        model_input = self._session.get_inputs()[0]
+        self._input_name = model_input.name
+        shape = model_input.shape
+        metadata = self._session.get_modelmeta().custom_metadata_map
+        if isinstance(shape[2], int) and isinstance(shape[3], int):
+            self._input_h, self._input_w = int(shape[2]), int(shape[3])
+        else:
+            # Dynamic export: use the image size recorded by ultralytics
+            imgsz = ast.literal_eval(metadata.get('imgsz', '[640, 640]'))
+            self._input_h, self._input_w = int(imgsz[0]), int(imgsz[1])
+
+        self.names = ast.literal_eval(metadata['names']) if 'names' in metadata else {}
+
+        print(
+            f"   ⚡ {t('onnx_engine_info').format(model=self.onnx_path.name, w=self._input_w, h=self._input_h, provider=self._session.get_providers()[0])}"
+        )
+
+    # ── Public interface ─────────────────────────────────────────────────────
+
+    def __call__(self, frame: np.ndarray, verbose: bool = False, **kwargs):
+        """
+        Run inference on a single BGR frame.
+
+        Args:
+            frame:   numpy array (H, W, 3) in BGR format (OpenCV default).
+            verbose: ignored – present only for API compatibility.
+
+        Returns:
+            List[_MockResult] – one element, mimicking ultralytics output.
+        """
+        image, scale, pad = letterbox(frame, (self._input_h, self._input_w))
+
+        # BGR HWC uint8 → RGB NCHW float32 [0, 1]
+        blob = image[np.newaxis, :, :, ::-1].transpose(0, 3, 1, 2).astype(np.float32)
+        blob *= 1.0 / 255.0
+
+        output = self._session.run(None, {self._input_name: blob})[0]
+        xyxy, conf, cls = self._postprocess(output[0])
+        xyxy = scale_boxes(xyxy, scale, pad, frame.shape)
+
+        return [make_result(xyxy, conf, cls)]
+
+    # ── Private helpers ──────────────────────────────────────────────────────
+
+    def _postprocess(self, output: np.ndarray):
+        """
+        Decode one image's model output into (xyxy, conf, cls) arrays in
+        input pixel coordinates.
+        """
+        if output.ndim == 2 and output.shape[-1] == 6:
+            # End-to-end model: NMS already applied
+            keep = output[:, 4] >= self.conf_threshold
+            output = output[keep][:self.max_det]
+            return output[:, :4], output[:, 4], output[:, 5].astype(int)
+
+        # Raw head: (4 + nc, anchors) → (anchors, 4 + nc)
+        predictions = output.T
+        class_scores = predictions[:, 4:]
+        cls = class_scores.argmax(axis=1)
+        conf = class_scores[np.arange(len(cls)), cls]
+
+        keep = conf >= self.conf_threshold
+        boxes, conf, cls = predictions[keep, :4], conf[keep], cls[keep]
+
+        # cx, cy, w, h → x1, y1, x2, y2
+        xyxy = np.empty_like(boxes)
+        xyxy[:, :2] = boxes[:, :2] - boxes[:, 2:] / 2
+        xyxy[:, 2:] = boxes[:, :2] + boxes[:, 2:] / 2
+
+        indices = batched_nms(xyxy, conf, cls, self.iou_threshold)[:self.max_det]
+        return xyxy[indices], conf[indices], cls[indices]
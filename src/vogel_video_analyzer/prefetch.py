@@ -0,0 +1,124 @@
+"""
+Background prefetching for the analysis pipeline.
+
+``PrefetchIterator`` runs an iterator in a worker thread and hands its items
+over a bounded queue.  Chaining two of them gives the pipelined analysis mode:
+
+    decoder thread ──queue──▶ inference thread ──queue──▶ caller
+                                                          (species + stats)
+
+The bounded queues provide backpressure: a fast decoder blocks once the queue
+is full instead of buffering the whole video in memory.  OpenCV decoding and
+PyTorch inference release the GIL, so the stages overlap on multi-core hosts.
+"""
+
+import queue
+import threading
+
+# Default number of items buffered between two pipeline stages
+DEFAULT_QUEUE_SIZE = 8
+
+# Poll interval (seconds) used so that close() can interrupt blocked stages
+_POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+class _Failure:
+    """Wraps an exception raised in the worker thread."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+class PrefetchIterator:
+    """
+    Iterate over ``iterable`` in a background thread.
+
+    Exceptions raised by the source iterator are re-raised in the consuming
+    thread.  Call ``close()`` (or use as a context manager) when stopping
+    early so the worker thread exits.
+    """
+
+    def __init__(self, iterable, maxsize: int = DEFAULT_QUEUE_SIZE, name: str = None):
+        """
+        Start prefetching.
+
+        Args:
+            iterable: Source iterable; it is consumed exclusively by the worker thread.
+            maxsize:  Maximum number of buffered items (backpressure limit).
+            name:     Optional thread name (shown in debuggers / py-spy).
+        """
+        self._queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            target=self._run, args=(iterable,), name=name, daemon=True
+        )
+        self._thread.start()
+
+    # ── Worker side ──────────────────────────────────────────────────────────
+
+    def _run(self, iterable):
+        try:
+            for item in iterable:
+                if not self._put(item):
+                    return
+        except BaseException as exc:  # re-raised in the consumer
+            self._put(_Failure(exc))
+            return
+        self._put(_END)
+
+    def _put(self, item) -> bool:
+        """Blocking put that gives up once close() was called."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # ── Consumer side ────────────────────────────────────────────────────────
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+        while True:
+            if self._stop.is_set():
+                self._finished = True
+                raise StopIteration
+            try:
+                item = self._queue.get(timeout=_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                continue
+
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.exc
+        return item
+
+    def close(self, timeout: float = 5.0):
+        """Stop the worker thread and discard buffered items."""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout)
+        self._finished = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
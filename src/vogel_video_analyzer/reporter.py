@@ -9,11 +9,9 @@ This module creates interactive HTML reports with:
 """
 
 import json
-import base64
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import cv2
 import numpy as np
 import urllib.request
 import urllib.parse
@@ -21,6 +19,8 @@ import urllib.parse
 from . import __version__
 from .i18n import t, get_language
 from .species_classifier import BirdSpeciesClassifier
+from .detection_track import encode_thumbnail
+from .video_io import open_frame_source, DEFAULT_DECODER
 
 # Chart.js library will be embedded inline for HTMLPreview compatibility
 CHARTJS_CDN_URL = "https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"
@@ -31,17 +31,24 @@ _CHARTJS_CACHE = None
 class HTMLReporter:
     """Generate interactive HTML reports from video analysis results."""
     
-    def __init__(self, analysis_data: Dict, video_path: str):
+    def __init__(self, analysis_data: Dict, video_path: str, track=None, decoder: Optional[str] = None):
         """
         Initialize the HTML reporter.
         
         Args:
             analysis_data: Analysis results from analyzer.py
             video_path: Path to the analyzed video file
+            track: Optional DetectionTrack from the same analysis pass; its
+                   thumbnails are used instead of re-reading the video
+            decoder: Frame reader backend for thumbnails missing from the
+                     track (default: the decoder of the analysis)
         """
         self.data = analysis_data
         self.video_path = Path(video_path)
-        self.video_name = self.video_path.name        
+        self.video_name = self.video_path.name
+        self.track = track
+        self.decoder = decoder or analysis_data.get('decoder', DEFAULT_DECODER)
+    
     @staticmethod
     def _get_chartjs() -> str:
         """Get Chart.js library code (download once and cache)."""
@@ -254,7 +261,7 @@ class HTMLReporter:
             return []
         
         thumbnails = []
-        cap = cv2.VideoCapture(str(self.video_path))
+        source = None  # Opened only for frames missing from the track
         fps = self.data.get('fps', 30)
         
         try:
@@ -268,6 +275,7 @@ class HTMLReporter:
                 for species_info in species_list:
                     all_detections.append({
                         'frame': frame_num,
+                        'timestamp': detection.get('timestamp', frame_num / fps),
                         'species': species_info.get('species', 'Unknown'),
                         'confidence': species_info.get('confidence', 0)
                     })
@@ -284,39 +292,38 @@ class HTMLReporter:
                 # Translate species name to current language
                 translated_species = BirdSpeciesClassifier.translate_species_name(species_name)
                 
-                # Seek to frame
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-                ret, frame = cap.read()
-                
-                if not ret:
-                    continue
-                
-                # Resize for thumbnail (max 300px width)
-                h, w = frame.shape[:2]
-                if w > 300:
-                    scale = 300 / w
-                    frame = cv2.resize(frame, (300, int(h * scale)))
+                # Thumbnail captured during the analysis pass
+                img_base64 = self.track.thumbnail(frame_num) if self.track is not None else None
                 
-                # Convert to JPEG and base64
-                _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-                img_base64 = base64.b64encode(buffer).decode('utf-8')
+                if img_base64 is None:
+                    if source is None:
+                        source = open_frame_source(self.video_path, self.decoder)
+                    
+                    # Detection frame numbers are 1-based
+                    frame = source.read_at(frame_num - 1)
+                    
+                    if frame is None:
+                        continue
+                    
+                    # Resize (max 300px width), convert to JPEG and base64
+                    img_base64 = encode_thumbnail(frame)
                 
                 thumbnails.append({
                     'image': img_base64,
                     'species': translated_species,
                     'confidence': confidence * 100,
                     'frame': frame_num,
-                    'timestamp': self._frame_to_timestamp(frame_num, fps)
+                    'timestamp': self._format_timestamp(detection['timestamp'])
                 })
         
         finally:
-            cap.release()
+            if source is not None:
+                source.release()
         
         return thumbnails
     
-    def _frame_to_timestamp(self, frame_num: int, fps: float) -> str:
-        """Convert frame number to timestamp string."""
-        seconds = frame_num / fps
+    def _format_timestamp(self, seconds: float) -> str:
+        """Convert a time in seconds to a timestamp string."""
         mins = int(seconds // 60)
         secs = int(seconds % 60)
         return f"{mins:02d}:{secs:02d}"
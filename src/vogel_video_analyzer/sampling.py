@@ -0,0 +1,107 @@
+"""
+Adaptive frame sampling for analyze_video().
+
+A fixed ``--sample-rate`` trades missed short visits against inference on
+hours of empty scene. ``analyze_video(adaptive_sampling=True)`` samples with
+the coarse ``sample_rate`` while nothing happens, switches to a fine stride
+as soon as a bird is detected (backfilling the frames skipped since the
+previous coarse sample) and relaxes to the coarse stride after
+``relax_after`` consecutive empty samples:
+
+    sampler = AdaptiveSampler(coarse_step=15, fine_step=1, relax_after=30)
+    index = sampler.first_index
+    while index < total_frames:
+        has_birds = ...                       # detector on frame ``index``
+        backfill, index = sampler.update(index, has_birds)
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Stride while birds are in view
+DEFAULT_FINE_SAMPLE_RATE = 1
+# Consecutive empty fine samples before returning to the coarse stride
+DEFAULT_RELAX_AFTER = 30
+
+
+class AdaptiveSampler:
+    """Chooses the next frame to analyze from the detections so far."""
+
+    def __init__(self, coarse_step: int, fine_step: int = DEFAULT_FINE_SAMPLE_RATE,
+                 relax_after: int = DEFAULT_RELAX_AFTER):
+        """
+        Args:
+            coarse_step: Stride in frames while no bird is in view
+            fine_step: Stride in frames while birds are in view
+            relax_after: Consecutive empty fine samples before switching back
+                         to the coarse stride
+        """
+        self.coarse_step = max(1, int(coarse_step))
+        self.fine_step = max(1, min(int(fine_step), self.coarse_step))
+        self.relax_after = max(1, int(relax_after))
+        self.dense = False
+        self.frames_backfilled = 0
+        self._empty = 0
+        self._previous = -1
+
+    @property
+    def first_index(self) -> int:
+        """0-based index of the first sample (same as fixed-rate sampling)."""
+        return self.coarse_step - 1
+
+    def update(self, index: int, has_birds: bool) -> Tuple[range, int]:
+        """
+        Record the detection result of a scheduled sample.
+
+        Args:
+            index: 0-based frame index that was analyzed
+            has_birds: Whether the detector found a bird in it
+
+        Returns:
+            (backfill, next_index) tuple: the skipped earlier frames to
+            analyze before ``index`` (non-empty only when a bird appears
+            during coarse sampling) and the next frame to schedule
+        """
+        backfill = range(0)
+        if self.dense:
+            self._empty = 0 if has_birds else self._empty + 1
+            if self._empty >= self.relax_after:
+                self.dense = False
+        elif has_birds:
+            self.dense = True
+            self._empty = 0
+            backfill = range(self._previous + self.fine_step, index, self.fine_step)
+            self.frames_backfilled += len(backfill)
+
+        self._previous = index
+        return backfill, index + (self.fine_step if self.dense else self.coarse_step)
+
+
+def sample_weights(frame_numbers: Sequence[int], total_frames: int) -> np.ndarray:
+    """
+    Number of video frames each analyzed frame stands for.
+
+    Every sample represents the frames closer to it than to its neighbours,
+    so time-based ratios stay correct when the stride varies.
+
+    Args:
+        frame_numbers: Ascending frame numbers of the analyzed frames
+        total_frames: Number of frames in the video
+
+    Returns:
+        float array, one weight per analyzed frame (sums to total_frames)
+    """
+    frames = np.asarray(frame_numbers, dtype=np.float64)
+    if len(frames) == 0:
+        return frames
+    edges = np.concatenate([[0.0], (frames[1:] + frames[:-1]) / 2, [max(float(total_frames), frames[-1])]])
+    return np.diff(edges)
+
+
+def weighted_share(weights: np.ndarray, selected: List[bool]) -> float:
+    """Percentage of the total weight held by the selected samples."""
+    total = float(np.sum(weights))
+    if total <= 0:
+        return 0.0
+    return float(np.sum(weights[np.asarray(selected, dtype=bool)])) / total * 100
@@ -2,19 +2,34 @@
 Bird species classification module using Hugging Face transformers
 """
 
+import importlib.util
 import warnings
 from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
+import cv2
+import numpy as np
+
 try:
-    from transformers import pipeline
     from PIL import Image
-    import torch
-    SPECIES_AVAILABLE = True
+    PIL_AVAILABLE = True
 except ImportError:
-    SPECIES_AVAILABLE = False
+    PIL_AVAILABLE = False
+
+# transformers and torch are imported when a transformers engine is loaded,
+# so the ONNX engine starts without them
+TRANSFORMERS_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None for module in ('transformers', 'torch')
+)
 
 from .i18n import t
+from .species_onnx import ONNXRUNTIME_AVAILABLE, load_species_onnx
+
+SPECIES_AVAILABLE = PIL_AVAILABLE and (TRANSFORMERS_AVAILABLE or ONNXRUNTIME_AVAILABLE)
+
+# Species classifier engines
+SPECIES_ENGINES = ("transformers", "onnx")
+DEFAULT_SPECIES_ENGINE = "transformers"
 
 
 # Translation dictionary for common bird species
@@ -141,11 +156,21 @@ GERMAN_TO_ENGLISH = {
     v.lower(): k for k, v in BIRD_NAME_TRANSLATIONS['de'].items()
 }
 
+# PIL resample codes of image processor configs -> OpenCV interpolation
+# (used when a crop is enlarged; shrinking always uses INTER_AREA)
+_CV2_INTERPOLATION = {
+    0: cv2.INTER_NEAREST,
+    1: cv2.INTER_LANCZOS4,
+    2: cv2.INTER_LINEAR,
+    3: cv2.INTER_CUBIC,
+}
+
 
 class BirdSpeciesClassifier:
     """Classifies bird species using a pre-trained model from Hugging Face"""
     
-    def __init__(self, model_name: str = "chriamue/bird-species-classifier", confidence_threshold: float = 0.3):
+    def __init__(self, model_name: str = "chriamue/bird-species-classifier", confidence_threshold: float = 0.3,
+                 fast_preprocess: bool = False, engine: str = DEFAULT_SPECIES_ENGINE):
         """
         Initialize the species classifier
         
@@ -156,6 +181,16 @@ class BirdSpeciesClassifier:
                        - "dima806/bird_species_image_detection" (ViT-based, 86M params, larger but lower confidence)
                        - "prithivMLmods/Bird-Species-Classifier-526" (SigLIP2-based, 93M params, 526 species)
             confidence_threshold: Minimum confidence score (0.0-1.0), default 0.3
+            fast_preprocess: Resize and normalize crop batches with OpenCV/NumPy
+                             and call the model directly instead of going through
+                             the transformers pipeline (default: False). OpenCV
+                             resizes differently from the Hugging Face image
+                             processor, so scores (and close top-k ranks) can
+                             differ slightly; models whose image processor is
+                             not supported always use the pipeline.
+            engine: "transformers" (PyTorch pipeline, default) or "onnx"
+                    (model exported to ONNX once, cached and run with
+                    onnxruntime; always uses the fast preprocessing)
         
         Note:
             ⚠️  EXPERIMENTAL FEATURE: Species identification accuracy is currently limited,
@@ -166,20 +201,33 @@ class BirdSpeciesClassifier:
             For best results with European birds, consider training a custom model on
             European-specific datasets like iNaturalist Europe or NABU bird photos.
         """
-        if not SPECIES_AVAILABLE:
+        if engine not in SPECIES_ENGINES:
+            raise ValueError(f"Unknown species engine '{engine}' (choose from: {', '.join(SPECIES_ENGINES)})")
+        if not PIL_AVAILABLE or not (ONNXRUNTIME_AVAILABLE if engine == "onnx" else TRANSFORMERS_AVAILABLE):
             raise ImportError(
                 "Species identification requires additional dependencies. Install with:\n"
-                "pip install vogel-video-analyzer[species]"
+                f"pip install vogel-video-analyzer[{'species-onnx' if engine == 'onnx' else 'species'}]"
             )
         
         self.model_name = model_name
         self.confidence_threshold = confidence_threshold
+        self.fast_preprocess = fast_preprocess or engine == "onnx"
+        self.engine = engine
         self.classifier = None
+        self._preprocess_config = None
+        self._labels = None  # id2label and multi_label flag of the fast path
         self._load_model()
     
     def _load_model(self):
         """Load the Hugging Face model (from Hub or local path)"""
+        if self.engine == "onnx":
+            self._load_onnx_model()
+            return
+        
         try:
+            import torch
+            from transformers import pipeline
+            
             # Check if model_name is a local path
             model_path = Path(self.model_name)
             if model_path.exists() and model_path.is_dir():
@@ -206,6 +254,16 @@ class BirdSpeciesClassifier:
                 batch_size=8  # Process up to 8 images in parallel for efficiency
             )
             
+            if self.fast_preprocess:
+                self._preprocess_config = self._build_preprocess_config(self.classifier.image_processor)
+                # Unsupported processor: results come from the pipeline
+                self.fast_preprocess = self._preprocess_config is not None
+                config = self.classifier.model.config
+                self._labels = {
+                    'id2label': config.id2label,
+                    'multi_label': config.problem_type == "multi_label_classification" or config.num_labels == 1,
+                }
+            
             print(f"   ✅ {t('model_loaded_success')}")
             
         except Exception as e:
@@ -213,6 +271,22 @@ class BirdSpeciesClassifier:
             print(f"   {t('fallback_basic_detection')}")
             self.classifier = None
     
+    def _load_onnx_model(self):
+        """Load (and on first use export) the ONNX Runtime species model"""
+        print(f"🤖 {t('loading_species_model')} {self.model_name} (ONNX Runtime)")
+        try:
+            self.classifier = load_species_onnx(self.model_name)
+            self._preprocess_config = self.classifier.preprocess
+            self._labels = {
+                'id2label': self.classifier.id2label,
+                'multi_label': self.classifier.multi_label,
+            }
+            print(f"   ✅ {t('model_loaded_success')}")
+        except Exception as e:
+            print(f"   ❌ {t('model_load_error')} {e}")
+            print(f"   {t('fallback_basic_detection')}")
+            self.classifier = None
+    
     def classify_image(self, image, top_k: int = 3) -> List[Dict[str, any]]:
         """
         Classify bird species in an image
@@ -233,7 +307,10 @@ class BirdSpeciesClassifier:
                 image = Image.fromarray(image)
             
             # Get predictions
-            predictions = self.classifier(image, top_k=top_k)
+            if self._preprocess_config is not None:
+                predictions = self._classify_preprocessed([image], top_k)[0]
+            else:
+                predictions = self.classifier(image, top_k=top_k)
             
             # Filter by confidence threshold
             filtered = [
@@ -282,67 +359,231 @@ class BirdSpeciesClassifier:
             print(f"   ⚠️  Crop classification error: {e}")
             return []
     
-    def classify_crops_batch(self, frame, bboxes: List[Tuple[int, int, int, int]], top_k: int = 3) -> List[List[Dict[str, any]]]:
+    @staticmethod
+    def crop_image(frame, bbox: Tuple[int, int, int, int]):
         """
-        Classify multiple cropped regions from the same frame in a batch (efficient for GPU)
+        Cut a bounding box out of a frame as PIL Image
+        
+        The crop is copied, so the frame can be released while the crop
+        waits in a batch.
         
         Args:
             frame: Full video frame (numpy array)
-            bboxes: List of bounding boxes [(x1, y1, x2, y2), ...]
+            bbox: Bounding box (x1, y1, x2, y2), clipped to the frame
+            
+        Returns:
+            PIL Image or None if the box is empty
+        """
+        x1, y1, x2, y2 = bbox
+        
+        # Ensure coordinates are within frame
+        h, w = frame.shape[:2]
+        x1, y1 = max(0, int(x1)), max(0, int(y1))
+        x2, y2 = min(w, int(x2)), min(h, int(y2))
+        
+        # Crop the region
+        cropped = frame[y1:y2, x1:x2]
+        if cropped.size == 0:
+            return None
+        return Image.fromarray(cropped)
+    
+    def classify_crops(self, crops: List, top_k: int = 3) -> List[List[Dict[str, any]]]:
+        """
+        Classify a list of crops in one batch, e.g. collected from many frames
+        
+        Args:
+            crops: List of PIL Images (None entries are skipped)
             top_k: Return top K predictions per crop
             
         Returns:
-            List of prediction lists, one per bounding box
+            List of prediction lists, one per crop
         """
-        if self.classifier is None or not bboxes:
-            return [[] for _ in bboxes]
+        results = [[] for _ in crops]
+        valid_indices = [idx for idx, crop in enumerate(crops) if crop is not None]
+        if self.classifier is None or not valid_indices:
+            return results
         
         try:
-            # Crop all regions
-            crops = []
-            valid_indices = []
-            
-            h, w = frame.shape[:2]
-            for idx, bbox in enumerate(bboxes):
-                x1, y1, x2, y2 = bbox
-                
-                # Ensure coordinates are within frame
-                x1, y1 = max(0, int(x1)), max(0, int(y1))
-                x2, y2 = min(w, int(x2)), min(h, int(y2))
-                
-                # Crop the region
-                cropped = frame[y1:y2, x1:x2]
-                
-                if cropped.size > 0:
-                    # Convert to PIL Image
-                    crops.append(Image.fromarray(cropped))
-                    valid_indices.append(idx)
-            
-            if not crops:
-                return [[] for _ in bboxes]
-            
             # Batch classify all crops at once (GPU-efficient)
-            all_predictions = self.classifier(crops, top_k=top_k, batch_size=len(crops))
+            valid_crops = [crops[idx] for idx in valid_indices]
+            if self._preprocess_config is not None:
+                all_predictions = self._classify_preprocessed(valid_crops, top_k)
+            else:
+                all_predictions = self.classifier(valid_crops, top_k=top_k, batch_size=len(valid_crops))
             
-            # Organize results back to match input bboxes order
-            results = [[] for _ in bboxes]
-            for crop_idx, predictions in enumerate(all_predictions):
-                original_idx = valid_indices[crop_idx]
-                
+            # Organize results back to match input order
+            for original_idx, predictions in zip(valid_indices, all_predictions):
                 # Filter by confidence threshold
-                filtered = [
+                results[original_idx] = [
                     pred for pred in predictions 
                     if pred['score'] >= self.confidence_threshold
                 ]
-                results[original_idx] = filtered
             
             return results
             
         except Exception as e:
             print(f"   ⚠️  Batch classification error: {e}")
+            return [[] for _ in crops]
+    
+    @staticmethod
+    def _build_preprocess_config(image_processor) -> Optional[Dict[str, any]]:
+        """
+        Translate an image processor config into one resize + affine transform
+        
+        Supported: fixed height/width resize (optionally followed by a center
+        crop), rescale (with EfficientNet's rescale_offset), normalize and
+        EfficientNet's include_top. Everything else (e.g. shortest-edge
+        resizing, padding) returns None and keeps the pipeline.
+        
+        Args:
+            image_processor: Image processor of the loaded pipeline
+            
+        Returns:
+            Dict with 'size', 'crop', 'interpolation', 'scale', 'offset' or None
+        """
+        if image_processor is None or getattr(image_processor, 'do_pad', False):
+            return None
+        
+        def height_width(size):
+            if size is None:
+                return None
+            if isinstance(size, dict):
+                height, width = size.get('height'), size.get('width')
+            else:
+                height, width = getattr(size, 'height', None), getattr(size, 'width', None)
+            return (int(height), int(width)) if height and width else None
+        
+        if not getattr(image_processor, 'do_resize', False):
+            return None
+        size = height_width(getattr(image_processor, 'size', None))
+        if size is None:
+            return None
+        
+        crop = None
+        if getattr(image_processor, 'do_center_crop', False):
+            crop = height_width(getattr(image_processor, 'crop_size', None))
+            if crop is None or crop[0] > size[0] or crop[1] > size[1]:
+                return None
+        
+        resample = getattr(image_processor, 'resample', 2)
+        interpolation = _CV2_INTERPOLATION.get(resample if isinstance(resample, int) else 2, cv2.INTER_LINEAR)
+        
+        # Fold rescale / normalize / include_top into pixel * scale + offset
+        scale = np.ones(3, dtype=np.float64)
+        offset = np.zeros(3, dtype=np.float64)
+        if getattr(image_processor, 'do_rescale', False):
+            scale *= float(image_processor.rescale_factor)
+            if getattr(image_processor, 'rescale_offset', False):
+                offset -= 1.0
+        image_std = getattr(image_processor, 'image_std', None)
+        image_std = np.broadcast_to(np.asarray(1.0 if image_std is None else image_std, dtype=np.float64), 3)
+        if getattr(image_processor, 'do_normalize', False):
+            image_mean = np.broadcast_to(np.asarray(image_processor.image_mean, dtype=np.float64), 3)
+            scale = scale / image_std
+            offset = (offset - image_mean) / image_std
+        if getattr(image_processor, 'include_top', False):
+            scale = scale / image_std
+            offset = offset / image_std
+        
+        return {
+            'size': size,
+            'crop': crop,
+            'interpolation': interpolation,
+            'scale': scale.astype(np.float32),
+            'offset': offset.astype(np.float32),
+        }
+    
+    def _preprocess_crops(self, crops: List) -> np.ndarray:
+        """
+        Resize and normalize crops into one model input batch
+        
+        Args:
+            crops: List of RGB PIL Images or numpy arrays
+            
+        Returns:
+            float32 array of shape (N, 3, H, W)
+        """
+        config = self._preprocess_config
+        height, width = config['size']
+        resized = np.empty((len(crops), height, width, 3), dtype=np.uint8)
+        for index, crop in enumerate(crops):
+            image = np.asarray(crop.convert('RGB') if getattr(crop, 'mode', 'RGB') != 'RGB' else crop)
+            shrink = image.shape[0] >= height and image.shape[1] >= width
+            resized[index] = cv2.resize(image, (width, height),
+                                        interpolation=cv2.INTER_AREA if shrink else config['interpolation'])
+        
+        if config['crop'] is not None:
+            crop_height, crop_width = config['crop']
+            top = (height - crop_height) // 2
+            left = (width - crop_width) // 2
+            resized = resized[:, top:top + crop_height, left:left + crop_width]
+        
+        # NHWC -> NCHW on uint8, then rescale + normalize each channel plane
+        # of the whole batch in place (scalar ops, no per-pixel broadcasting)
+        pixels = np.ascontiguousarray(resized.transpose(0, 3, 1, 2)).astype(np.float32)
+        for channel in range(3):
+            plane = pixels[:, channel]
+            plane *= config['scale'][channel]
+            plane += config['offset'][channel]
+        return pixels
+    
+    def _classify_preprocessed(self, crops: List, top_k: int) -> List[List[Dict[str, any]]]:
+        """
+        Classify crops with the fast preprocessing path
+        
+        Feeds the batch straight into the model (PyTorch module of the
+        pipeline or ONNX Runtime session) and takes the top-k of the softmax
+        (or sigmoid, like the pipeline) on the logits.
+        
+        Args:
+            crops: List of PIL Images
+            top_k: Predictions per crop
+            
+        Returns:
+            Unfiltered prediction lists, one per crop
+        """
+        pixel_values = self._preprocess_crops(crops)
+        
+        if self.engine == "onnx":
+            logits = np.asarray(self.classifier(pixel_values), dtype=np.float32)
+        else:
+            import torch
+            model = self.classifier.model
+            inputs = torch.from_numpy(pixel_values).to(device=self.classifier.device, dtype=model.dtype)
+            with torch.inference_mode():
+                logits = model(pixel_values=inputs).logits.float().cpu().numpy()
+        
+        if self._labels['multi_label']:
+            scores = 1.0 / (1.0 + np.exp(-logits))
+        else:
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            scores = exp / exp.sum(axis=-1, keepdims=True)
+        
+        top_k = min(top_k, scores.shape[-1])
+        top_ids = np.argsort(-scores, axis=-1, kind='stable')[:, :top_k]
+        id2label = self._labels['id2label']
+        return [
+            [{'label': id2label[int(label_id)], 'score': float(row[label_id])} for label_id in row_ids]
+            for row, row_ids in zip(scores, top_ids)
+        ]
+    
+    def classify_crops_batch(self, frame, bboxes: List[Tuple[int, int, int, int]], top_k: int = 3) -> List[List[Dict[str, any]]]:
+        """
+        Classify multiple cropped regions from the same frame in a batch (efficient for GPU)
+        
+        Args:
+            frame: Full video frame (numpy array)
+            bboxes: List of bounding boxes [(x1, y1, x2, y2), ...]
+            top_k: Return top K predictions per crop
+            
+        Returns:
+            List of prediction lists, one per bounding box
+        """
+        if self.classifier is None or not bboxes:
             return [[] for _ in bboxes]
+        
+        return self.classify_crops([self.crop_image(frame, bbox) for bbox in bboxes], top_k=top_k)
 
-    
     @staticmethod
     def is_available() -> bool:
         """Check if species classification dependencies are installed"""
@@ -453,6 +694,52 @@ class BirdSpeciesClassifier:
         return formatted
 
 
+class SpeciesCropQueue:
+    """
+    Collects bird crops from many frames and classifies them in batches
+    
+    With one bird per frame (the common case) per-frame classification runs
+    the model at batch size 1. The queue fills a batch across frames and
+    hands each result to the callback registered with its crop, in order.
+    """
+    
+    def __init__(self, classifier: BirdSpeciesClassifier, batch_size: int = 16, top_k: int = 1):
+        """
+        Args:
+            classifier: BirdSpeciesClassifier used for the batches
+            batch_size: Number of crops collected before classifying
+            top_k: Predictions per crop passed to the callbacks
+        """
+        self.classifier = classifier
+        self.batch_size = max(1, int(batch_size))
+        self.top_k = top_k
+        self._pending = []
+    
+    def __len__(self):
+        return len(self._pending)
+    
+    def add(self, crop, callback) -> None:
+        """
+        Queue a crop; classifies the batch once it is full
+        
+        Args:
+            crop: PIL Image (or None for an empty box, which gets no predictions)
+            callback: Called with the filtered prediction list of the crop
+        """
+        self._pending.append((crop, callback))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Classify all queued crops and deliver their results"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        predictions = self.classifier.classify_crops([crop for crop, _ in pending], top_k=self.top_k)
+        for (_, callback), crop_predictions in zip(pending, predictions):
+            callback(crop_predictions)
+
+
 def aggregate_species_detections(detections: List[Dict[str, any]]) -> Dict[str, Dict[str, any]]:
     """
     Aggregate multiple species detections
@@ -0,0 +1,237 @@
+"""
+ONNX Runtime engine for the bird species classifier.
+
+The Hugging Face model (hub id or local directory) is exported to ONNX once
+and cached together with its labels and preprocessing parameters:
+
+    $XDG_CACHE_HOME/vogel-video-analyzer/species-onnx/<name>-<hash>/
+        model.onnx
+        vogel_species.json
+
+Later runs only need onnxruntime, NumPy, OpenCV and Pillow - neither torch
+nor transformers is imported for classification. The export itself requires
+the species extras (transformers + torch).
+"""
+
+import hashlib
+import json
+import os
+import re
+import warnings
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from .cache import default_cache_dir
+from .i18n import t
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+ONNX_DIR_NAME = "species-onnx"
+MODEL_FILE_NAME = "model.onnx"
+META_FILE_NAME = "vogel_species.json"
+META_FORMAT = 1
+DEFAULT_OPSET = 17
+
+
+def _source_mtime(model_name: str) -> Optional[int]:
+    """Newest modification time of a local model directory (None for hub ids)."""
+    model_dir = Path(model_name)
+    if not model_dir.is_dir():
+        return None
+    return max((f.stat().st_mtime_ns for f in model_dir.iterdir() if f.is_file()), default=0)
+
+
+def species_onnx_dir(model_name: str, cache_dir=None) -> Path:
+    """
+    Cache directory of the ONNX export of a species model.
+
+    Args:
+        model_name: Hugging Face model id or local model directory
+        cache_dir: Base cache directory (default: default_cache_dir())
+
+    Returns:
+        Path of the model's export directory
+    """
+    model_dir = Path(model_name)
+    source = str(model_dir.resolve()) if model_dir.is_dir() else model_name
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+    readable = re.sub(r'[^A-Za-z0-9._-]+', '_', model_dir.name or model_name)[:40]
+    base = Path(cache_dir) if cache_dir else default_cache_dir()
+    return base / ONNX_DIR_NAME / f"{readable}-{digest}"
+
+
+def export_species_onnx(model_name: str, output_dir, opset: int = DEFAULT_OPSET) -> Path:
+    """
+    Export a Hugging Face image classification model to ONNX.
+
+    Writes model.onnx (dynamic batch size, input ``pixel_values``, output
+    ``logits``) and vogel_species.json with the labels and the fast
+    preprocessing parameters of the model's image processor.
+
+    Args:
+        model_name: Hugging Face model id or local model directory
+        output_dir: Directory for the exported files
+        opset: ONNX opset version (default: 17)
+
+    Returns:
+        Path of the export directory
+
+    Raises:
+        ImportError: transformers or torch is not installed
+        ValueError: The model's image processor has no fixed input size
+    """
+    try:
+        import torch
+        from transformers import AutoImageProcessor, AutoModelForImageClassification
+    except ImportError:
+        raise ImportError(t('species_onnx_export_missing'))
+
+    from .species_classifier import BirdSpeciesClassifier
+
+    output_dir = Path(output_dir)
+    print(f"   📦 {t('species_onnx_exporting').format(model=model_name)}")
+
+    processor = AutoImageProcessor.from_pretrained(model_name)
+    preprocess = BirdSpeciesClassifier._build_preprocess_config(processor)
+    if preprocess is None:
+        raise ValueError(t('species_onnx_unsupported_processor').format(model=model_name))
+
+    model = AutoModelForImageClassification.from_pretrained(model_name).eval()
+
+    class LogitsOnly(torch.nn.Module):
+        """Return the logits tensor instead of a ModelOutput"""
+
+        def __init__(self, wrapped):
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, pixel_values):
+            return self.wrapped(pixel_values=pixel_values).logits
+
+    height, width = preprocess['crop'] or preprocess['size']
+    dummy = torch.zeros(1, 3, height, width)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    model_path = output_dir / MODEL_FILE_NAME
+    # Written under temporary names and renamed, so parallel workers
+    # exporting the same model never read a half-written file
+    temp_suffix = f".tmp-{os.getpid()}"
+    temp_model_path = output_dir / (MODEL_FILE_NAME + temp_suffix)
+    export_kwargs = dict(
+        input_names=['pixel_values'],
+        output_names=['logits'],
+        dynamic_axes={'pixel_values': {0: 'batch'}, 'logits': {0: 'batch'}},
+        opset_version=opset,
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        with torch.no_grad():
+            try:
+                # TorchScript exporter: handles the dynamic batch axis of HF models
+                torch.onnx.export(LogitsOnly(model), (dummy,), str(temp_model_path), dynamo=False, **export_kwargs)
+            except TypeError:
+                # torch < 2.5 has no dynamo switch
+                torch.onnx.export(LogitsOnly(model), (dummy,), str(temp_model_path), **export_kwargs)
+
+    config = model.config
+    meta = {
+        'format': META_FORMAT,
+        'source': model_name,
+        'source_mtime': _source_mtime(model_name),
+        'id2label': {str(k): v for k, v in config.id2label.items()},
+        'multi_label': config.problem_type == "multi_label_classification" or config.num_labels == 1,
+        'preprocess': {
+            'size': list(preprocess['size']),
+            'crop': list(preprocess['crop']) if preprocess['crop'] else None,
+            'interpolation': int(preprocess['interpolation']),
+            'scale': preprocess['scale'].tolist(),
+            'offset': preprocess['offset'].tolist(),
+        },
+    }
+    temp_meta_path = output_dir / (META_FILE_NAME + temp_suffix)
+    temp_meta_path.write_text(json.dumps(meta, indent=2), encoding='utf-8')
+    os.replace(temp_model_path, model_path)
+    os.replace(temp_meta_path, output_dir / META_FILE_NAME)
+
+    print(f"   ✅ {t('species_onnx_exported').format(path=model_path)}")
+    return output_dir
+
+
+class OnnxSpeciesModel:
+    """onnxruntime session of an exported species model plus its metadata."""
+
+    def __init__(self, model_dir):
+        """
+        Args:
+            model_dir: Export directory (see export_species_onnx)
+
+        Raises:
+            ImportError: onnxruntime is not installed
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ImportError(t('species_onnx_runtime_missing'))
+
+        model_dir = Path(model_dir)
+        meta = json.loads((model_dir / META_FILE_NAME).read_text(encoding='utf-8'))
+        self.model_dir = model_dir
+        self.id2label = {int(k): v for k, v in meta['id2label'].items()}
+        self.multi_label = bool(meta['multi_label'])
+
+        preprocess = meta['preprocess']
+        self.preprocess = {
+            'size': tuple(preprocess['size']),
+            'crop': tuple(preprocess['crop']) if preprocess['crop'] else None,
+            'interpolation': preprocess['interpolation'],
+            'scale': np.asarray(preprocess['scale'], dtype=np.float32),
+            'offset': np.asarray(preprocess['offset'], dtype=np.float32),
+        }
+
+        self.session = onnxruntime.InferenceSession(
+            str(model_dir / MODEL_FILE_NAME),
+            providers=onnxruntime.get_available_providers()
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, pixel_values: np.ndarray) -> np.ndarray:
+        """Run the model on a float32 NCHW batch and return the logits."""
+        return self.session.run(None, {self.input_name: pixel_values})[0]
+
+
+def load_species_onnx(model_name: str, cache_dir=None) -> OnnxSpeciesModel:
+    """
+    Load the cached ONNX export of a species model, exporting it if needed.
+
+    Local model directories are exported again when one of their files
+    changed; hub models are exported once (delete the cache directory to
+    refresh them).
+
+    Args:
+        model_name: Hugging Face model id or local model directory
+        cache_dir: Base cache directory (default: default_cache_dir())
+
+    Returns:
+        OnnxSpeciesModel
+    """
+    if not ONNXRUNTIME_AVAILABLE:
+        raise ImportError(t('species_onnx_runtime_missing'))
+
+    model_dir = species_onnx_dir(model_name, cache_dir)
+    meta_path = model_dir / META_FILE_NAME
+    meta: Dict = {}
+    if meta_path.exists() and (model_dir / MODEL_FILE_NAME).exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            meta = {}
+
+    if meta.get('format') != META_FORMAT or meta.get('source_mtime') != _source_mtime(model_name):
+        export_species_onnx(model_name, model_dir)
+    else:
+        print(f"   ⚡ {t('species_onnx_cached').format(path=model_dir / MODEL_FILE_NAME)}")
+
+    return OnnxSpeciesModel(model_dir)
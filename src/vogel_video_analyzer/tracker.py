@@ -0,0 +1,197 @@
+"""
+Lightweight IoU tracker for bird boxes across sampled frames.
+
+``VideoAnalyzer.analyze_video(track_birds=True)`` links the YOLO boxes of
+consecutive sampled frames into tracks (one track ≈ one visit of one bird).
+The species model then only classifies the best few crops of each track and
+the voted label is propagated to every box of the track, instead of
+classifying every bird in every sampled frame:
+
+    tracker = IoUTracker(iou_threshold=0.3, max_missed=12)
+    ids, finished = tracker.update(bboxes, frame_number)
+    ...
+    finished += tracker.finish()
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Minimum IoU between a track's last box and a new box to continue the track
+DEFAULT_IOU_THRESHOLD = 0.3
+# A track ends after this many seconds without a matching box
+DEFAULT_MAX_GAP_SECONDS = 2.0
+# Number of crops per track sent to the species classifier
+DEFAULT_CROPS_PER_TRACK = 3
+
+
+def iou_matrix(boxes_a, boxes_b) -> np.ndarray:
+    """
+    Pairwise intersection over union of two sets of boxes.
+
+    Args:
+        boxes_a: (N, 4) array-like of (x1, y1, x2, y2)
+        boxes_b: (M, 4) array-like of (x1, y1, x2, y2)
+
+    Returns:
+        (N, M) float array
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def vote_species(predictions: Sequence[Sequence[Dict]]) -> Optional[Dict]:
+    """
+    Combine the species predictions of several crops of one track.
+
+    Every crop votes for its top-1 label with its score; the label with the
+    highest score sum wins.
+
+    Args:
+        predictions: One (possibly empty) prediction list per classified crop
+
+    Returns:
+        {'label', 'score'} with the winner's mean score, or None if no crop
+        passed the species threshold
+    """
+    totals = {}
+    for crop_predictions in predictions:
+        if not crop_predictions:
+            continue
+        best = crop_predictions[0]
+        score_sum, votes = totals.get(best['label'], (0.0, 0))
+        totals[best['label']] = (score_sum + best['score'], votes + 1)
+
+    if not totals:
+        return None
+
+    label, (score_sum, votes) = max(totals.items(), key=lambda item: item[1][0])
+    return {'label': label, 'score': score_sum / votes}
+
+
+class BirdTrack:
+    """One tracked bird: its last box and the sampled frames it was seen in."""
+
+    def __init__(self, track_id: int, bbox, frame_number: int):
+        self.track_id = track_id
+        self.bbox = tuple(bbox)
+        self.first_frame = frame_number
+        self.last_frame = frame_number
+        self.hits = 1
+        self.missed = 0
+
+    def __repr__(self):
+        return (f"BirdTrack(id={self.track_id}, frames={self.first_frame}-{self.last_frame}, "
+                f"hits={self.hits})")
+
+
+class IoUTracker:
+    """
+    Greedy IoU tracker.
+
+    Boxes of a new frame are matched to the active tracks in order of
+    decreasing IoU; unmatched boxes start new tracks. A track that finds no
+    box for more than ``max_missed`` consecutive updates (or, with
+    ``max_gap_frames``, for more than that many frames) is finished.
+    """
+
+    def __init__(self, iou_threshold: float = DEFAULT_IOU_THRESHOLD, max_missed: int = 0,
+                 max_gap_frames: Optional[int] = None):
+        """
+        Args:
+            iou_threshold: Minimum IoU to continue a track
+            max_missed: Number of consecutive updates a track may go without
+                        a matching box before it is finished
+            max_gap_frames: If set, a track is finished once the frame number
+                            is more than this many frames past its last box
+                            instead (for a variable sampling stride)
+        """
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.max_gap_frames = max_gap_frames
+        self._active: List[BirdTrack] = []
+        self._next_id = 1
+
+    @property
+    def active(self) -> List[BirdTrack]:
+        """Tracks that are still open."""
+        return list(self._active)
+
+    def update(self, bboxes, frame_number: int) -> Tuple[List[int], List[BirdTrack]]:
+        """
+        Assign the boxes of one sampled frame to tracks.
+
+        Args:
+            bboxes: (N, 4) array-like of (x1, y1, x2, y2), may be empty
+            frame_number: Frame number of the boxes
+
+        Returns:
+            (track_ids, finished) tuple: the track id of every box (in input
+            order) and the tracks that ended with this update
+        """
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        track_ids = [None] * len(bboxes)
+        matched = set()
+        finished = []
+
+        if self.max_gap_frames is not None:
+            # Tracks past the gap end before matching: a late box starts a new track
+            finished = [bird for bird in self._active if frame_number - bird.last_frame > self.max_gap_frames]
+            self._active = [bird for bird in self._active if bird not in finished]
+
+        if self._active and len(bboxes):
+            ious = iou_matrix([t.bbox for t in self._active], bboxes)
+            # Greedy assignment, best overlaps first
+            order = np.argsort(-ious, axis=None, kind='stable')
+            for flat in order:
+                track_index, box_index = divmod(int(flat), len(bboxes))
+                if ious[track_index, box_index] < self.iou_threshold:
+                    break
+                if track_index in matched or track_ids[box_index] is not None:
+                    continue
+                bird = self._active[track_index]
+                bird.bbox = tuple(bboxes[box_index])
+                bird.last_frame = frame_number
+                bird.hits += 1
+                bird.missed = 0
+                matched.add(track_index)
+                track_ids[box_index] = bird.track_id
+
+        still_active = []
+        for track_index, bird in enumerate(self._active):
+            if track_index not in matched:
+                bird.missed += 1
+                if self.max_gap_frames is not None:
+                    expired = frame_number - bird.last_frame > self.max_gap_frames
+                else:
+                    expired = bird.missed > self.max_missed
+                if expired:
+                    finished.append(bird)
+                    continue
+            still_active.append(bird)
+
+        for box_index, track_id in enumerate(track_ids):
+            if track_id is None:
+                bird = BirdTrack(self._next_id, bboxes[box_index], frame_number)
+                self._next_id += 1
+                still_active.append(bird)
+                track_ids[box_index] = bird.track_id
+
+        self._active = still_active
+        return track_ids, finished
+
+    def finish(self) -> List[BirdTrack]:
+        """End all open tracks (end of video) and return them."""
+        finished, self._active = self._active, []
+        return finished
@@ -0,0 +1,759 @@
+"""
+Video input helpers shared by the analyzer, annotation and summary passes.
+
+``FrameSource`` wraps ``cv2.VideoCapture`` and only decodes the frames a pass
+actually needs:
+
+  * skipped frames are advanced with ``cap.grab()`` (demux + decode, but no
+    BGR conversion or copy into a NumPy array),
+  * sampled frames are fetched with ``cap.retrieve()``,
+  * for large strides the reader seeks instead, so the decoder jumps to the
+    nearest keyframe rather than walking through every frame in between.
+
+``PyAVFrameSource`` is an alternative reader on PyAV (FFmpeg's libraries)
+with threaded decoding, a keyframe-only mode and real presentation
+timestamps for variable-frame-rate files.  ``open_frame_source()`` picks the
+backend by name (``--decoder``).
+
+``ScaledFrameSource`` delivers the sampled frames at a reduced resolution
+(scaled inside an ffmpeg pipe when available) for the detection pass of
+high-resolution footage and reads full-resolution frames only on demand.
+
+``FFmpegVideoWriter`` is the output counterpart: it pipes raw BGR frames into
+an ffmpeg process that encodes H.264 and muxes the audio of the original
+video in the same pass.
+
+Usage:
+    with open_frame_source("video.mp4", decoder="pyav") as source:
+        for frame in source.iter_sampled(5, start=4):
+            results = model(frame.image)
+"""
+
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .i18n import t
+
+# Optional PyAV decoder (pip install vogel-video-analyzer[pyav])
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+# Strides at or above this value seek instead of grabbing every frame.
+# Typical camera footage uses a GOP of 30-250 frames; seeking below that
+# would re-decode the same GOP repeatedly and be slower than grab().
+DEFAULT_SEEK_THRESHOLD = 300
+
+# x264 defaults for annotated videos
+DEFAULT_PRESET = "medium"
+DEFAULT_CRF = 23
+X264_PRESETS = (
+    "ultrafast", "superfast", "veryfast", "faster", "fast",
+    "medium", "slow", "slower", "veryslow",
+)
+
+# Frame reader backends (see open_frame_source)
+DECODERS = ("opencv", "pyav")
+DEFAULT_DECODER = "opencv"
+
+
+class VideoFrame(NamedTuple):
+    """
+    A decoded frame together with its 0-based position in the video.
+
+    ``timestamp`` is the presentation time in seconds when the reader knows
+    it (PyAV), otherwise None and callers fall back to ``index / fps``.
+    """
+
+    index: int
+    image: np.ndarray
+    timestamp: Optional[float] = None
+
+
+def open_frame_source(video_path, decoder: str = DEFAULT_DECODER,
+                      seek_threshold: int = DEFAULT_SEEK_THRESHOLD,
+                      threads: int = 0, keyframes_only: bool = False):
+    """
+    Open a video with the selected frame reader backend.
+
+    Args:
+        video_path:     Path to the video file.
+        decoder:        "opencv" (``FrameSource``) or "pyav" (``PyAVFrameSource``).
+        seek_threshold: See ``FrameSource``.
+        threads:        Decoder threads (0: backend default).
+        keyframes_only: Decode keyframes only (PyAV only).
+
+    Returns:
+        FrameSource or PyAVFrameSource
+
+    Raises:
+        ValueError:   Unknown decoder, or keyframes_only with OpenCV.
+        ImportError:  decoder="pyav" but PyAV is not installed.
+        RuntimeError: The video cannot be opened.
+    """
+    if decoder == "pyav":
+        return PyAVFrameSource(video_path, seek_threshold, threads=threads, keyframes_only=keyframes_only)
+    if decoder != "opencv":
+        raise ValueError(f"Unknown decoder: {decoder!r} (expected one of {', '.join(DECODERS)})")
+    if keyframes_only:
+        raise ValueError(t('keyframes_only_requires_pyav'))
+    return FrameSource(video_path, seek_threshold, threads=threads)
+
+
+class FrameSource:
+    """
+    Sequential frame reader with cheap skipping of non-sampled frames.
+
+    Properties (``total_frames``, ``fps``, ``width``, ``height``) are read
+    once on open so callers do not need direct access to the capture.
+    """
+
+    def __init__(self, video_path, seek_threshold: int = DEFAULT_SEEK_THRESHOLD, threads: int = 0):
+        """
+        Open a video for reading.
+
+        Args:
+            video_path:     Path to the video file.
+            seek_threshold: Minimum stride (in frames) at which the reader
+                            seeks to the next sample instead of grabbing
+                            every frame in between.  0 disables seeking.
+            threads:        Decoder threads (0: OpenCV default).  Needs an
+                            OpenCV build with CAP_PROP_N_THREADS.
+
+        Raises:
+            RuntimeError: The video cannot be opened.
+        """
+        self.video_path = Path(video_path)
+        self.seek_threshold = seek_threshold
+
+        if threads > 0 and hasattr(cv2, "CAP_PROP_N_THREADS"):
+            self._cap = cv2.VideoCapture(str(self.video_path), cv2.CAP_ANY, [cv2.CAP_PROP_N_THREADS, int(threads)])
+        else:
+            self._cap = cv2.VideoCapture(str(self.video_path))
+        if not self._cap.isOpened():
+            raise RuntimeError(t('cannot_open_video').format(path=str(self.video_path)))
+
+        self.total_frames = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self.width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        # Index of the next frame the capture will return
+        self._position = 0
+
+    # ── Context manager ──────────────────────────────────────────────────────
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def release(self):
+        """Release the underlying capture."""
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    def iter_frames(self) -> Iterator[VideoFrame]:
+        """
+        Yield every remaining frame of the video in order.
+
+        Used by passes that need all frames (e.g. writing an annotated copy).
+        """
+        while True:
+            ret, image = self._cap.read()
+            if not ret:
+                break
+            index = self._position
+            self._position += 1
+            yield VideoFrame(index, image)
+
+    def iter_sampled(self, step: int, start: int = 0) -> Iterator[VideoFrame]:
+        """
+        Yield frames ``start, start + step, start + 2*step, ...``.
+
+        Frames in between are skipped with ``grab()`` (no retrieve) or, for
+        strides of at least ``seek_threshold``, by seeking.
+
+        Args:
+            step:  Stride between sampled frames (>= 1).
+            start: 0-based index of the first sampled frame.
+        """
+        step = max(1, int(step))
+        use_seek = self.seek_threshold > 0 and step >= self.seek_threshold
+        target = max(0, int(start))
+
+        while self.total_frames <= 0 or target < self.total_frames:
+            if not self._advance_to(target, use_seek):
+                break
+            ret, image = self._cap.retrieve()
+            self._position += 1
+            if not ret:
+                break
+            yield VideoFrame(target, image)
+            target += step
+
+    def read_at(self, index: int) -> Optional[np.ndarray]:
+        """
+        Return the frame at ``index`` (0-based) or None if it cannot be read.
+
+        Reads forward with ``grab()`` when the target is close to the current
+        position and seeks otherwise.
+        """
+        frame = self.read_frame(index)
+        return frame.image if frame is not None else None
+
+    def read_frame(self, index: int) -> Optional[VideoFrame]:
+        """Like ``read_at()``, but returns a ``VideoFrame``."""
+        use_seek = index < self._position or (
+            self.seek_threshold > 0 and index - self._position >= self.seek_threshold
+        )
+        if not self._advance_to(index, use_seek):
+            return None
+        ret, image = self._cap.retrieve()
+        self._position += 1
+        return VideoFrame(index, image) if ret else None
+
+    # ── Private helpers ──────────────────────────────────────────────────────
+
+    def _advance_to(self, index: int, use_seek: bool) -> bool:
+        """
+        Position the capture so that the next ``grab()`` hits ``index`` and
+        grab it.  Returns False at end of stream.
+        """
+        if use_seek and index != self._position:
+            if self._cap.set(cv2.CAP_PROP_POS_FRAMES, index):
+                self._position = index
+            # If seeking is unsupported, fall through and grab forward
+
+        while self._position < index:
+            if not self._cap.grab():
+                return False
+            self._position += 1
+
+        return self._cap.grab()
+
+
+class PyAVFrameSource:
+    """
+    Frame reader on PyAV with the same interface as ``FrameSource``.
+
+    Differences to the OpenCV reader:
+
+      * FFmpeg frame and slice threading (``threads``),
+      * ``keyframes_only`` makes the decoder skip every non-keyframe - a
+        very cheap scan of long recordings; ``step`` then acts as the
+        minimum distance between returned frames,
+      * every ``VideoFrame`` carries the real presentation timestamp, so
+        variable-frame-rate files get correct times,
+      * skipped frames are decoded but never converted; returned frames are
+        converted to BGR (and optionally scaled) in one swscale call and
+        handed over as a NumPy view of the converted buffer, without a
+        further copy.
+
+    Frame indices are counted while decoding sequentially; after a seek and
+    in keyframe-only mode they are derived from the timestamp.
+    """
+
+    def __init__(self, video_path, seek_threshold: int = DEFAULT_SEEK_THRESHOLD, threads: int = 0,
+                 keyframes_only: bool = False, size: Optional[Tuple[int, int]] = None):
+        """
+        Open a video for reading.
+
+        Args:
+            video_path:     Path to the video file.
+            seek_threshold: See ``FrameSource``.
+            threads:        Decoder threads (0: chosen by FFmpeg).
+            keyframes_only: Decode keyframes only.
+            size:           Optional (width, height) the frames are scaled to.
+
+        Raises:
+            ImportError:  PyAV is not installed.
+            RuntimeError: The video cannot be opened.
+        """
+        if not PYAV_AVAILABLE:
+            raise ImportError(t('pyav_not_installed'))
+
+        self.video_path = Path(video_path)
+        self.seek_threshold = seek_threshold
+        self.keyframes_only = keyframes_only
+
+        try:
+            self._container = av.open(str(self.video_path))
+            self._stream = self._container.streams.video[0]
+        except (av.error.FFmpegError, OSError, IndexError):
+            raise RuntimeError(t('cannot_open_video').format(path=str(self.video_path)))
+
+        stream = self._stream
+        stream.thread_type = "AUTO"
+        stream.thread_count = max(0, int(threads))
+        if keyframes_only:
+            stream.codec_context.skip_frame = "NONKEY"
+
+        rate = stream.average_rate or stream.guessed_rate
+        self.fps = float(rate) if rate else 0.0
+        self.width = stream.codec_context.width
+        self.height = stream.codec_context.height
+        self.total_frames = stream.frames
+        if not self.total_frames and stream.duration and self.fps > 0:
+            self.total_frames = int(round(float(stream.duration * stream.time_base) * self.fps))
+
+        self._time_base_exact = stream.time_base  # Fraction: exact PTS → seconds
+        self._time_base = float(stream.time_base) if stream.time_base else 0.0
+        self._start_pts = stream.start_time or 0
+        self._size = size
+        self._frames = self._container.decode(stream)
+        # Index of the next decoded frame; None after a seek (taken from the PTS)
+        self._position = 0
+
+    # ── Context manager ──────────────────────────────────────────────────────
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def release(self):
+        """Close the container."""
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    def iter_frames(self) -> Iterator[VideoFrame]:
+        """Yield every remaining (key)frame of the video in order."""
+        while True:
+            decoded = self._next()
+            if decoded is None:
+                break
+            yield self._to_video_frame(*decoded)
+
+    def iter_sampled(self, step: int, start: int = 0) -> Iterator[VideoFrame]:
+        """
+        Yield frames ``start, start + step, start + 2*step, ...``.
+
+        In keyframe-only mode the first keyframe at or after each target is
+        returned and the next target is counted from it.
+
+        Args:
+            step:  Stride between sampled frames (>= 1).
+            start: 0-based index of the first sampled frame.
+        """
+        step = max(1, int(step))
+        use_seek = self.seek_threshold > 0 and step >= self.seek_threshold
+        target = max(0, int(start))
+
+        while self.total_frames <= 0 or target < self.total_frames:
+            decoded = self._advance_to(target, use_seek)
+            if decoded is None:
+                break
+            yield self._to_video_frame(*decoded)
+            target = (decoded[0] if self.keyframes_only else target) + step
+
+    def read_at(self, index: int) -> Optional[np.ndarray]:
+        """
+        Return the frame at ``index`` (0-based) or None if it cannot be read.
+
+        Decodes forward when the target is close to the current position and
+        seeks otherwise.  In keyframe-only mode the next keyframe is returned.
+        """
+        frame = self.read_frame(index)
+        return frame.image if frame is not None else None
+
+    def read_frame(self, index: int) -> Optional[VideoFrame]:
+        """Like ``read_at()``, but returns a ``VideoFrame`` with timestamp."""
+        position = self._position if self._position is not None else -1
+        use_seek = index < position or (
+            self.seek_threshold > 0 and index - position >= self.seek_threshold
+        )
+        decoded = self._advance_to(index, use_seek)
+        return self._to_video_frame(*decoded) if decoded is not None else None
+
+    # ── Private helpers ──────────────────────────────────────────────────────
+
+    def _next(self):
+        """Decode the next frame; returns (index, av.VideoFrame) or None at the end."""
+        try:
+            frame = next(self._frames)
+        except (StopIteration, av.error.FFmpegError):
+            return None
+        if self._position is None or self.keyframes_only:
+            index = self._pts_index(frame)
+        else:
+            index = self._position
+        self._position = index + 1
+        return index, frame
+
+    def _advance_to(self, index: int, use_seek: bool):
+        """Decode up to the first frame at or after ``index``; (index, frame) or None."""
+        if use_seek and index != self._position:
+            self._seek(index)
+        while True:
+            decoded = self._next()
+            if decoded is None or decoded[0] >= index:
+                return decoded
+
+    def _seek(self, index: int) -> None:
+        """Seek to the keyframe at or before ``index``."""
+        if self.fps <= 0 or self._time_base <= 0:
+            return
+        pts = self._start_pts + int(index / self.fps / self._time_base)
+        self._container.seek(pts, stream=self._stream, backward=True, any_frame=False)
+        self._frames = self._container.decode(self._stream)
+        self._position = None
+
+    def _pts_index(self, frame) -> int:
+        if frame.pts is None or self._time_base <= 0:
+            return self._position or 0
+        return int(round((frame.pts - self._start_pts) * self._time_base * self.fps))
+
+    def _timestamp(self, index: int, frame) -> Optional[float]:
+        if frame.pts is None or self._time_base <= 0:
+            return index / self.fps if self.fps > 0 else None
+        return float((frame.pts - self._start_pts) * self._time_base_exact)
+
+    def _convert(self, frame) -> np.ndarray:
+        if self._size is None:
+            return frame.to_ndarray(format="bgr24")
+        # Bilinear like ScaledFrameSource, so --detect-width frames match across readers
+        return frame.to_ndarray(format="bgr24", width=self._size[0], height=self._size[1],
+                                interpolation="BILINEAR")
+
+    def _to_video_frame(self, index: int, frame) -> VideoFrame:
+        return VideoFrame(index, self._convert(frame), self._timestamp(index, frame))
+
+
+class ScaledFrameSource:
+    """
+    Frame reader that delivers sampled frames at a reduced resolution.
+
+    4K camera footage is only used at 640 px by the detector, so decoding it
+    into full-size BGR arrays wastes most of the conversion, copy and memory
+    bandwidth.  With ffmpeg on PATH the sampled frames are selected and
+    scaled inside an ffmpeg process and only the small frames are piped out;
+    otherwise the frames are decoded with OpenCV and shrunk right away.
+
+    With the PyAV decoder the frames are scaled by PyAV instead and keep
+    their timestamps.
+
+    Full-resolution frames (for species crops) are read on demand with
+    ``read_full()``, so they are only decoded when a bird was found.  Boxes
+    found on the small frames map back with ``scale_x`` / ``scale_y``.
+
+    Exposes the same reading interface as ``FrameSource``; ``width`` and
+    ``height`` are those of the original video.
+    """
+
+    def __init__(self, video_path, width: int, seek_threshold: int = DEFAULT_SEEK_THRESHOLD,
+                 use_ffmpeg: Optional[bool] = None, decoder: str = DEFAULT_DECODER,
+                 threads: int = 0, keyframes_only: bool = False):
+        """
+        Open a video for downscaled reading.
+
+        Args:
+            video_path:     Path to the video file.
+            width:          Width of the delivered frames (height follows the
+                            aspect ratio, rounded to an even number).
+            seek_threshold: See ``FrameSource``.
+            use_ffmpeg:     Decode through an ffmpeg pipe.  None (default)
+                            uses ffmpeg when it is installed (OpenCV decoder).
+            decoder:        Frame reader backend (see ``open_frame_source``).
+            threads:        Decoder threads (0: backend default).
+            keyframes_only: Decode keyframes only (PyAV only).
+
+        Raises:
+            RuntimeError: The video cannot be opened.
+        """
+        self._full = open_frame_source(video_path, decoder, seek_threshold, threads, keyframes_only)
+        self.decoder = decoder
+        self.threads = threads
+        self.keyframes_only = keyframes_only
+        self._lock = threading.Lock()
+        self._last_full = None  # (index, image) of the last read_at() frame
+
+        self.video_path = self._full.video_path
+        self.seek_threshold = seek_threshold
+        self.total_frames = self._full.total_frames
+        self.fps = self._full.fps
+        self.width = self._full.width
+        self.height = self._full.height
+
+        self.scaled_width = min(int(width), self.width) if self.width > 0 else int(width)
+        self.scaled_height = max(2, round(self.height * self.scaled_width / max(self.width, 1) / 2) * 2)
+        self.scale_x = self.width / self.scaled_width
+        self.scale_y = self.height / self.scaled_height
+
+        if decoder == "pyav":
+            self.use_ffmpeg = False
+        else:
+            self.use_ffmpeg = FFmpegVideoWriter.available() if use_ffmpeg is None else use_ffmpeg
+
+    @property
+    def scaler(self) -> str:
+        """Name of the component that scales the sampled frames."""
+        if self.decoder == "pyav":
+            return "PyAV"
+        return "ffmpeg" if self.use_ffmpeg else "OpenCV"
+
+    # ── Context manager ──────────────────────────────────────────────────────
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def release(self):
+        """Release the full-resolution capture."""
+        with self._lock:
+            self._full.release()
+            self._last_full = None
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    def iter_sampled(self, step: int, start: int = 0) -> Iterator[VideoFrame]:
+        """
+        Yield downscaled frames ``start, start + step, start + 2*step, ...``.
+
+        Args:
+            step:  Stride between sampled frames (>= 1).
+            start: 0-based index of the first sampled frame.
+
+        Raises:
+            RuntimeError: The ffmpeg decoder failed.
+        """
+        step = max(1, int(step))
+        start = max(0, int(start))
+        if self.use_ffmpeg:
+            yield from self._iter_ffmpeg(step, start)
+            return
+
+        # Separate reader: read_full() may be called while this one runs
+        if self.decoder == "pyav":
+            size = (self.scaled_width, self.scaled_height)
+            with PyAVFrameSource(self.video_path, self.seek_threshold, self.threads,
+                                 self.keyframes_only, size) as source:
+                yield from source.iter_sampled(step, start)
+            return
+
+        with FrameSource(self.video_path, self.seek_threshold, self.threads) as source:
+            for frame in source.iter_sampled(step, start):
+                yield VideoFrame(frame.index, self._shrink(frame.image))
+
+    def read_at(self, index: int) -> Optional[np.ndarray]:
+        """
+        Return the downscaled frame at ``index`` (0-based) or None.
+
+        The full-resolution frame is kept until the next call, so a
+        following ``read_full()`` of the same index does not decode again.
+        """
+        frame = self.read_frame(index)
+        return frame.image if frame is not None else None
+
+    def read_frame(self, index: int) -> Optional[VideoFrame]:
+        """Like ``read_at()``, but returns a ``VideoFrame``."""
+        with self._lock:
+            frame = self._full.read_frame(index)
+            self._last_full = (frame.index, frame.image) if frame is not None else None
+        if frame is None:
+            return None
+        return VideoFrame(frame.index, self._shrink(frame.image), frame.timestamp)
+
+    def read_full(self, index: int) -> Optional[np.ndarray]:
+        """Return the full-resolution frame at ``index`` (0-based) or None."""
+        with self._lock:
+            if self._last_full is not None and self._last_full[0] == index:
+                return self._last_full[1]
+            return self._full.read_at(index)
+
+    # ── Private helpers ──────────────────────────────────────────────────────
+
+    def _shrink(self, image: np.ndarray) -> np.ndarray:
+        if image.shape[1] == self.scaled_width and image.shape[0] == self.scaled_height:
+            return image
+        # INTER_LINEAR like the detector's own letterbox (and the bilinear
+        # ffmpeg/PyAV scalers); INTER_AREA costs ~6x more on 4K frames
+        return cv2.resize(image, (self.scaled_width, self.scaled_height), interpolation=cv2.INTER_LINEAR)
+
+    def _iter_ffmpeg(self, step: int, start: int) -> Iterator[VideoFrame]:
+        """Select and scale the sampled frames in ffmpeg and read them from its stdout."""
+        video_filter = (
+            rf"select='gte(n\,{start})*not(mod(n-{start}\,{step}))',"
+            f"scale={self.scaled_width}:{self.scaled_height}:flags=bilinear"
+        )
+        cmd = [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", str(self.video_path),
+            "-map", "0:v:0", "-vf", video_filter, "-vsync", "passthrough",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1",
+        ]
+        shape = (self.scaled_height, self.scaled_width, 3)
+        frame_bytes = shape[0] * shape[1] * 3
+
+        stderr = tempfile.TemporaryFile()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        try:
+            target = start
+            while self.total_frames <= 0 or target < self.total_frames:
+                image = np.empty(shape, dtype=np.uint8)
+                if proc.stdout.readinto(memoryview(image).cast("B")) != frame_bytes:
+                    break
+                yield VideoFrame(target, image)
+                target += step
+            else:
+                return
+
+            if proc.wait() != 0:
+                stderr.seek(0)
+                message = stderr.read().decode("utf-8", errors="replace").strip()
+                raise RuntimeError(f"ffmpeg decoder failed: {message}")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            stderr.close()
+
+
+class FFmpegVideoWriter:
+    """
+    Video writer that streams raw BGR frames to an ffmpeg subprocess.
+
+    Mirrors the ``write()`` / ``release()`` interface of ``cv2.VideoWriter``.
+    Encoding happens in the ffmpeg process (libx264 by default), and the
+    first audio stream of ``audio_source`` is muxed in the same pass, so no
+    second copy of the output file is written.
+    """
+
+    def __init__(self, output_path, fps: float, width: int, height: int,
+                 audio_source=None, codec: str = "libx264",
+                 preset: str = DEFAULT_PRESET, crf: int = DEFAULT_CRF):
+        """
+        Start the ffmpeg encoder process.
+
+        Args:
+            output_path:  Path of the video to write.
+            fps:          Frame rate of the written frames.
+            width:        Frame width in pixels.
+            height:       Frame height in pixels.
+            audio_source: Optional video whose first audio stream is copied
+                          into the output (ignored if it has none).
+            codec:        ffmpeg video encoder (default: libx264).
+            preset:       Encoder speed/size preset (default: medium).
+            crf:          Constant rate factor, lower is better quality (default: 23).
+
+        Raises:
+            FileNotFoundError: ffmpeg is not installed.
+        """
+        self.output_path = Path(output_path)
+        self.width = width
+        self.height = height
+
+        cmd = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", f"{fps}",
+            "-i", "pipe:0",
+        ]
+        if audio_source is not None:
+            cmd += ["-i", str(audio_source), "-map", "0:v:0", "-map", "1:a:0?", "-c:a", "aac", "-shortest"]
+        if width % 2 or height % 2:
+            # yuv420p needs even dimensions
+            cmd += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2"]
+        cmd += [
+            "-c:v", codec, "-preset", preset, "-crf", str(crf),
+            "-pix_fmt", "yuv420p",
+            str(self.output_path),
+        ]
+
+        # stderr goes to a file so a chatty encoder can never block on a full pipe
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=self._stderr)
+
+    @staticmethod
+    def available() -> bool:
+        """Return True if an ffmpeg executable is on PATH."""
+        return shutil.which("ffmpeg") is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.release()
+        else:
+            self.abort()
+        return False
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Append a BGR frame.
+
+        Raises:
+            RuntimeError: The ffmpeg process exited early.
+        """
+        try:
+            self._proc.stdin.write(np.ascontiguousarray(frame).tobytes())
+        except (BrokenPipeError, OSError):
+            self._proc.wait()
+            raise RuntimeError(f"ffmpeg encoder failed: {self._error_output()}")
+
+    def release(self) -> None:
+        """
+        Finish encoding and wait for ffmpeg to exit.
+
+        Raises:
+            RuntimeError: ffmpeg exited with an error.
+        """
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        returncode = self._proc.wait()
+        error_output = self._error_output()
+        self._proc = None
+        self._stderr.close()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg encoder failed: {error_output}")
+
+    def __del__(self):
+        # Never leave an encoder process behind (e.g. after an exception)
+        if getattr(self, "_proc", None) is not None:
+            self.abort()
+
+    def abort(self) -> None:
+        """Stop ffmpeg without waiting for a clean finish and remove the partial output."""
+        if self._proc is None:
+            return
+        self._proc.kill()
+        self._proc.wait()
+        try:
+            self._proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self._proc = None
+        self._stderr.close()
+        self.output_path.unlink(missing_ok=True)
+
+    def _error_output(self) -> str:
+        self._stderr.seek(0)
+        return self._stderr.read().decode("utf-8", errors="replace").strip()
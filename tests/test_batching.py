@@ -0,0 +1,87 @@
+"""
+Tests for batched YOLO inference (analyze_video(batch_size=N))
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+
+NUM_FRAMES = 10  # not a multiple of the batch sizes below
+
+
+def _frames(count=NUM_FRAMES):
+    """Sampled frames whose pixels encode their index"""
+    return [SimpleNamespace(index=i, image=np.full((4, 4, 3), i, dtype=np.uint8)) for i in range(count)]
+
+
+def _result(image):
+    return SimpleNamespace(value=int(image[0, 0, 0]))
+
+
+class BatchModel:
+    """Detector accepting a list of frames per call (like ultralytics)"""
+
+    supports_batch = True
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, images, verbose=False):
+        images = images if isinstance(images, list) else [images]
+        self.calls.append(len(images))
+        return [_result(image) for image in images]
+
+
+class SingleModel:
+    """Detector without batch support (like OnnxDetector): one frame per call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, image, verbose=False):
+        assert not isinstance(image, list)
+        self.calls.append(1)
+        return [_result(image)]
+
+
+def _detect(model, batch_size):
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    return [(frame.index, result.value)
+            for frame, result in video_analyzer._iter_detections(_frames(), batch_size)]
+
+
+def test_group_batches_tail():
+    """Test: frames are split into full batches plus a partial tail batch"""
+    batches = list(analyzer.VideoAnalyzer._group_batches(_frames(), 4))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [frame.index for batch in batches for frame, run in batch] == list(range(NUM_FRAMES))
+    assert all(run for batch in batches for _, run in batch)
+
+
+@pytest.mark.parametrize('batch_size', [3, 4, 16])
+def test_batched_results_match_single_frames(batch_size):
+    """Test: batch sizes 1 and N give the same per-frame results in the same order"""
+    expected = [(i, i) for i in range(NUM_FRAMES)]
+    assert _detect(BatchModel(), 1) == expected
+
+    model = BatchModel()
+    assert _detect(model, batch_size) == expected
+    full, tail = divmod(NUM_FRAMES, batch_size)
+    assert model.calls == [batch_size] * full + ([tail] if tail else [])
+
+
+@pytest.mark.parametrize('batch_size', [1, 3])
+def test_models_without_batch_support(batch_size):
+    """Test: engines without supports_batch get one call per frame in order"""
+    model = SingleModel()
+    assert _detect(model, batch_size) == [(i, i) for i in range(NUM_FRAMES)]
+    assert len(model.calls) == NUM_FRAMES
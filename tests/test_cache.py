@@ -0,0 +1,90 @@
+"""
+Tests for the persistent analysis cache
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from vogel_video_analyzer.cache import AnalysisCache, file_fingerprint
+
+
+PARAMS = {'model': 'yolo26n.pt', 'threshold': 0.3, 'sample_rate': 5}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Creates a cache in a temporary directory"""
+    return AnalysisCache(tmp_path / 'cache')
+
+
+@pytest.fixture
+def video(tmp_path):
+    """Creates a dummy video file"""
+    path = tmp_path / 'clip.mp4'
+    path.write_bytes(b'\x00' * 4096)
+    return path
+
+
+def _stats(video):
+    return {
+        'video_file': video.name,
+        'video_path': str(video),
+        'bird_percentage': 12.5,
+        'detections': [{'frame': 5, 'timestamp': 0.2, 'birds': 1}],
+    }
+
+
+def test_roundtrip(cache, video):
+    """Test: stored statistics are returned for identical input"""
+    assert cache.get(video, PARAMS) is None
+    cache.put(video, PARAMS, _stats(video))
+    assert cache.get(video, PARAMS) == _stats(video)
+
+
+def test_parameter_change_is_miss(cache, video):
+    """Test: different analysis settings do not share entries"""
+    cache.put(video, PARAMS, _stats(video))
+    assert cache.get(video, dict(PARAMS, sample_rate=10)) is None
+    assert cache.get(video, dict(PARAMS, threshold=0.5)) is None
+
+
+def test_file_change_is_miss(cache, video):
+    """Test: modified video content invalidates the entry"""
+    cache.put(video, PARAMS, _stats(video))
+    video.write_bytes(b'\x01' * 4096)
+    assert cache.get(video, PARAMS) is None
+
+
+def test_fingerprint_uses_mtime(video):
+    """Test: touching the file changes the fingerprint"""
+    before = file_fingerprint(video)
+    stat = video.stat()
+    os.utime(video, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert file_fingerprint(video) != before
+
+
+def test_moved_video_reports_new_path(cache, video, tmp_path):
+    """Test: a hit reports the path that was asked for"""
+    cache.put(video, PARAMS, _stats(video))
+    moved = tmp_path / 'moved.mp4'
+    os.link(video, moved)
+
+    stats = cache.get(moved, PARAMS)
+    assert stats['video_path'] == str(moved)
+    assert stats['video_file'] == 'moved.mp4'
+
+
+def test_persistence_and_clear(tmp_path, video):
+    """Test: entries survive reopening and can be cleared"""
+    AnalysisCache(tmp_path / 'cache').put(video, PARAMS, _stats(video))
+
+    reopened = AnalysisCache(tmp_path / 'cache')
+    assert reopened.get(video, PARAMS) is not None
+    assert reopened.clear() == 1
+    assert reopened.get(video, PARAMS) is None
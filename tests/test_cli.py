@@ -0,0 +1,179 @@
+"""
+Tests for the vogel-analyze command line flow (with a stub detector)
+"""
+
+import argparse
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+
+from vogel_video_analyzer import cli
+from vogel_video_analyzer.detection_utils import _MockResult
+
+FPS = 10.0
+
+
+def _detector(images, verbose=False):
+    """Reports a bird (class 14, conf 0.8) where a bright square is visible"""
+    single = not isinstance(images, list)
+    results = []
+    for image in [images] if single else images:
+        bird = image[30:70, 40:90].mean() > 128
+        results.append(_MockResult([[40, 30, 90, 70, 0.8, 14]] if bird else []))
+    return results
+
+
+class StubAnalyzer(analyzer.VideoAnalyzer):
+    """VideoAnalyzer with the stub detector instead of a YOLO model"""
+
+    def __init__(self, threshold=0.3, cache=None, **kwargs):
+        self.model = _detector
+        self.threshold = threshold
+        self.target_class = 14
+        self.identify_species = False
+        self.species_classifier = None
+        self.cache = cache
+        self._model_source = 'stub.pt'
+
+
+def write_video(path, bird_frames, frames=100):
+    """10 FPS MJPG video with a bright square on bird_frames"""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), FPS, (160, 120))
+    if not writer.isOpened():
+        pytest.skip('MJPG writer not available')
+    for index in range(frames):
+        image = np.full((120, 160, 3), 20, dtype=np.uint8)
+        if index in bird_frames:
+            image[30:70, 40:90] = 230
+        writer.write(image)
+    writer.release()
+    return path
+
+
+@pytest.fixture
+def run_cli(monkeypatch):
+    """Runs main() with the given arguments and the stub analyzer"""
+    monkeypatch.setattr(cli, 'VideoAnalyzer', StubAnalyzer)
+
+    def run(*arguments):
+        monkeypatch.setattr(sys, 'argv', ['vogel-analyze', '--language', 'en', *map(str, arguments)])
+        return cli.main()
+    return run
+
+
+def test_delete_file_removes_empty_videos(run_cli, tmp_path):
+    """Test: --delete-file removes videos without birds and keeps the others"""
+    empty = write_video(tmp_path / 'empty.avi', set())
+    bird = write_video(tmp_path / 'bird.avi', set(range(40, 60)))
+
+    assert run_cli('--delete-file', empty, bird) == 0
+    assert not empty.exists()
+    assert bird.exists()
+
+
+def test_annotate_does_not_delete_or_report(run_cli, tmp_path, capsys):
+    """Test: the analysis pass of --annotate-video neither reports nor deletes videos"""
+    empty = write_video(tmp_path / 'empty.avi', set())
+
+    assert run_cli('--annotate-video', '--delete-file', empty) == 0
+    assert empty.exists()
+    assert 'Video Analysis Report' not in capsys.readouterr().out
+
+
+def test_triage_delete_needs_opt_in(run_cli, tmp_path, capsys):
+    """Test: videos found empty by the triage scan alone are deleted only with --delete-triaged"""
+    empty = write_video(tmp_path / 'empty.avi', set())
+    late = write_video(tmp_path / 'late.avi', set(range(95, 100)))  # between the checked frames
+
+    assert run_cli('--triage', '--delete-file', empty, late) == 0
+    assert empty.exists() and late.exists()
+    assert 'Kept late.avi' in capsys.readouterr().out
+
+    assert run_cli('--triage', '--delete-triaged', '--delete-file', empty, late) == 0
+    assert not empty.exists() and not late.exists()
+
+
+def test_early_exit_does_not_delete_late_birds(run_cli, tmp_path, capsys):
+    """Test: a video that stopped early at 0% is kept by --delete-file"""
+    late = write_video(tmp_path / 'late.avi', set(range(90, 100)))
+    output = tmp_path / 'report.json'
+
+    assert run_cli('--delete-file', '--min-bird-percentage', 50, '--output', output, late) == 0
+    stats = json.loads(output.read_text())
+    assert stats['early_exit']['reason'] == 'below_bound' and stats['bird_percentage'] == 0.0
+    assert late.exists()
+    assert 'Kept late.avi' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('early_exit', [{}, {'stop_at_first_bird': True}])
+def test_pipeline_matches_serial(tmp_path, early_exit):
+    """Test: analyze_video(pipeline=True) gives the same statistics as the serial path"""
+    video = write_video(tmp_path / 'bird.avi', set(range(30, 45)) | set(range(70, 80)))
+    keys = ['frames_analyzed', 'frames_with_birds', 'bird_percentage', 'bird_segments', 'detections']
+
+    serial = StubAnalyzer().analyze_video(video, sample_rate=2, **early_exit)
+    pipelined = StubAnalyzer().analyze_video(video, sample_rate=2, pipeline=True, batch_size=4, **early_exit)
+    assert {key: pipelined[key] for key in keys} == {key: serial[key] for key in keys}
+    assert serial['frames_analyzed'] == (16 if early_exit else 50)
+    # The decode and inference stages are closed, also after an early exit
+    assert not any(thread.name.startswith('vogel-') for thread in threading.enumerate())
+
+
+def _pool_args(videos, workers):
+    """Command line arguments of a plain analysis run"""
+    return argparse.Namespace(videos=[str(video) for video in videos], workers=workers, language='en',
+                              annotate_video=False, create_summary=False, html_report=None, max_thumbnails=0)
+
+
+@pytest.fixture
+def clips(tmp_path):
+    """Three clips with different bird shares"""
+    return [write_video(tmp_path / f'clip{index}.avi', set(range(0, 20 * index))) for index in range(3)]
+
+
+def test_worker_pool_matches_serial(clips):
+    """Test: a single worker process gives the same statistics as the serial loop"""
+    serial = [cli._process_video(StubAnalyzer(), video, _pool_args(clips, 1), {'sample_rate': 5})[0]
+              for video in clips]
+    pooled, tracks = cli._analyze_videos_parallel(_pool_args(clips, 1), {}, {'sample_rate': 5},
+                                                  analyzer_class=StubAnalyzer)
+    assert pooled == serial
+    assert [stats['bird_percentage'] for stats in pooled] == [0.0, 20.0, 40.0]
+    assert tracks == {}
+
+
+def test_worker_pool_order_and_errors(run_cli, clips, tmp_path, capsys):
+    """Test: --workers keeps the command-line order and reports failed videos"""
+    missing = tmp_path / 'missing.avi'
+    output = tmp_path / 'report.json'
+    videos = [clips[2], missing, clips[0], clips[1]]
+
+    assert run_cli('--workers', 2, '--output', output, *videos) == 0
+    assert [stats['video_file'] for stats in json.loads(output.read_text())['videos']] == [
+        'clip2.avi', 'clip0.avi', 'clip1.avi'
+    ]
+    assert f'{missing}' in capsys.readouterr().err
+
+
+def test_worker_init_failure_shows_output(capsys):
+    """Test: loading messages of a worker whose model fails to load go to stderr"""
+    class BrokenAnalyzer:
+        def __init__(self, **kwargs):
+            print('model.pt not found')
+            raise FileNotFoundError('model.pt')
+
+    with pytest.raises(FileNotFoundError):
+        cli._init_worker({}, 'en', 1, analyzer_class=BrokenAnalyzer)
+    captured = capsys.readouterr()
+    assert 'model.pt not found' in captured.err
+    assert captured.out == ''
@@ -0,0 +1,138 @@
+"""
+Tests for the detection track shared between analysis outputs
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from vogel_video_analyzer.detection_track import DetectionTrack, encode_thumbnail
+
+
+def _frame(value=100, width=640, height=480):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_add_frame():
+    """Test: analyzed frames and bird boxes are recorded"""
+    track = DetectionTrack()
+    track.begin('video.mp4', 30.0, 300, 640, 480, 5)
+    box = {'bbox': (1, 2, 3, 4), 'conf': 0.8, 'species': None}
+    track.add_frame(5, [])
+    track.add_frame(10, [box])
+    track.finish()
+
+    assert track.complete
+    assert track.analyzed_frames == [5, 10]
+    assert track.bird_frames() == [10]
+    assert track.boxes_at(10) == [box]
+    assert track.boxes_at(5) == []
+
+
+def test_begin_resets():
+    """Test: begin() discards the previous pass"""
+    track = DetectionTrack()
+    track.begin('a.mp4', 30.0, 300, 640, 480, 5)
+    track.add_frame(5, [{'bbox': (1, 2, 3, 4), 'conf': 0.8, 'species': None}])
+    track.offer_thumbnail(5, 0.9, _frame())
+    track.finish()
+
+    track.begin('b.mp4', 25.0, 100, 320, 240, 1)
+    assert not track.complete
+    assert track.analyzed_frames == []
+    assert track.bird_frames() == []
+    assert track.thumbnail(5) is None
+
+
+def test_thumbnails_keep_best():
+    """Test: only the best-scoring frames are kept as thumbnails"""
+    track = DetectionTrack(max_thumbnails=2)
+    for frame_number, score in [(1, 0.5), (2, 0.9), (3, 0.7), (4, 0.6)]:
+        track.offer_thumbnail(frame_number, score, _frame())
+
+    assert track.thumbnail(2) is not None
+    assert track.thumbnail(3) is not None
+    assert track.thumbnail(1) is None
+    assert track.thumbnail(4) is None
+
+
+def test_thumbnails_disabled():
+    """Test: max_thumbnails=0 keeps no thumbnails"""
+    track = DetectionTrack(max_thumbnails=0)
+    track.offer_thumbnail(1, 0.9, _frame())
+    assert track.thumbnail(1) is None
+
+
+def test_encode_thumbnail_downscales():
+    """Test: thumbnails are JPEGs of at most 300 px width"""
+    data = base64.b64decode(encode_thumbnail(_frame()))
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert image.shape[1] == 300
+    assert image.shape[0] == 225
+
+
+def _mixed_video_analyzer(tmp_path, cache=None):
+    """Video with a bird, a non-bird object and a weak bird detection; analyzer with a stub detector"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    from vogel_video_analyzer.detection_utils import _MockResult
+
+    path = tmp_path / 'mixed.avi'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 10.0, (64, 48))
+    if not writer.isOpened():
+        pytest.skip('MJPG writer not available')
+    # Grey level selects the detector output: 250 bird, 150 cat, 80 weak bird
+    for value in [0] * 10 + [250] * 10 + [150] * 10 + [80] * 10:
+        writer.write(_frame(value, 64, 48))
+    writer.release()
+
+    boxes = {250: [[0, 0, 10, 10, 0.9, 14]], 150: [[0, 0, 10, 10, 0.9, 15]], 80: [[0, 0, 10, 10, 0.1, 14]]}
+
+    def model(image, verbose=False):
+        model.calls += 1
+        level = int(image[0, 0, 0])
+        return [_MockResult(next((rows for value, rows in boxes.items() if abs(level - value) < 20), []))]
+    model.calls = 0
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    video_analyzer.threshold = 0.3
+    video_analyzer.target_class = 14
+    video_analyzer.identify_species = False
+    video_analyzer.species_classifier = None
+    video_analyzer.cache = cache
+    video_analyzer._model_source = 'stub.pt'
+    return video_analyzer, path
+
+
+def test_summary_bird_frames_match_track(tmp_path):
+    """Test: the summary's own detection uses the track's bird definition (class and threshold)"""
+    video_analyzer, path = _mixed_video_analyzer(tmp_path)
+    track = DetectionTrack(max_thumbnails=0)
+    video_analyzer.analyze_video(path, sample_rate=1, track=track)
+
+    _, _, bird_frames = video_analyzer._detect_summary_frames(path, 1)
+    assert bird_frames == {frame - 1 for frame in track.bird_frames()} == set(range(10, 20))
+
+
+def test_track_pass_skips_cache_lookup(tmp_path):
+    """Test: a pass recording a track runs detection even when the result is cached"""
+    from vogel_video_analyzer.cache import AnalysisCache
+    video_analyzer, path = _mixed_video_analyzer(tmp_path, AnalysisCache(tmp_path / 'cache'))
+
+    stats = video_analyzer.analyze_video(path, sample_rate=2)
+    calls = video_analyzer.model.calls
+    assert video_analyzer.analyze_video(path, sample_rate=2) == stats
+    assert video_analyzer.model.calls == calls  # cache hit
+
+    track = DetectionTrack(max_thumbnails=0)
+    assert video_analyzer.analyze_video(path, sample_rate=2, track=track) == stats
+    assert track.complete
+    assert video_analyzer.model.calls == 2 * calls
@@ -0,0 +1,84 @@
+"""
+Tests for the engine-independent detection helpers (letterbox, NMS)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+cv2 = pytest.importorskip('cv2')
+
+from vogel_video_analyzer.detection_utils import (
+    letterbox, scale_boxes, nms, batched_nms, make_result, LETTERBOX_COLOR
+)
+
+
+def test_letterbox_geometry():
+    """Test: wide frames are scaled to the target width and padded top/bottom"""
+    frame = np.full((720, 1280, 3), 200, dtype=np.uint8)
+    image, scale, (pad_x, pad_y) = letterbox(frame, (640, 640))
+
+    assert image.shape == (640, 640, 3)
+    assert scale == pytest.approx(0.5)
+    assert (pad_x, pad_y) == (0, 140)
+    assert (image[:140] == LETTERBOX_COLOR).all()
+    assert (image[140:500] == 200).all()
+    assert (image[500:] == LETTERBOX_COLOR).all()
+
+
+def test_letterbox_into_buffer():
+    """Test: letterboxing into a reused buffer overwrites the old padding and content"""
+    buffer = np.zeros((64, 64, 3), dtype=np.uint8)
+    letterbox(np.full((50, 100, 3), 7, dtype=np.uint8), (64, 64), out=buffer)
+    image, scale, pad = letterbox(np.full((100, 50, 3), 9, dtype=np.uint8), (64, 64), out=buffer)
+
+    assert image is buffer
+    assert (scale, pad) == (pytest.approx(0.64), (16, 0))
+    expected, _, _ = letterbox(np.full((100, 50, 3), 9, dtype=np.uint8), (64, 64))
+    np.testing.assert_array_equal(buffer, expected)
+
+
+def test_scale_boxes_roundtrip():
+    """Test: boxes in letterboxed coordinates map back to the frame (clipped)"""
+    frame_shape = (720, 1280, 3)
+    _, scale, pad = letterbox(np.zeros(frame_shape, dtype=np.uint8), (640, 640))
+    boxes = np.array([[100, 200, 300, 400], [0, 100, 700, 520]], dtype=np.float32)
+    mapped = scale_boxes(boxes, scale, pad, frame_shape)
+    np.testing.assert_allclose(mapped[0], [200, 120, 600, 520])
+    np.testing.assert_allclose(mapped[1], [0, 0, 1280, 720])
+
+
+def test_nms_matches_opencv():
+    """Test: NumPy NMS keeps the same boxes as cv2.dnn.NMSBoxes"""
+    rng = np.random.default_rng(1)
+    xy = rng.uniform(0, 500, (200, 2))
+    wh = rng.uniform(20, 120, (200, 2))
+    boxes = np.hstack([xy, xy + wh]).astype(np.float32)
+    scores = rng.uniform(0, 1, 200).astype(np.float32)
+
+    keep = nms(boxes, scores, 0.45)
+    expected = cv2.dnn.NMSBoxes(np.hstack([xy, wh]).tolist(), scores.tolist(), 0.0, 0.45)
+    assert sorted(keep.tolist()) == sorted(np.array(expected).flatten().tolist())
+    # Best score first
+    assert keep[0] == int(np.argmax(scores))
+
+
+def test_batched_nms_keeps_other_classes():
+    """Test: overlapping boxes of different classes are both kept"""
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+    scores = np.array([0.9, 0.8, 0.7])
+    classes = np.array([14, 14, 3])
+    assert batched_nms(boxes, scores, classes, 0.5).tolist() == [0, 2]
+    assert batched_nms(np.empty((0, 4)), np.empty(0), np.empty(0), 0.5).size == 0
+
+
+def test_make_result():
+    """Test: arrays become an ultralytics-style result"""
+    result = make_result([[1, 2, 3, 4]], [0.5], [14])
+    np.testing.assert_allclose(result.boxes.data.numpy(), [[1, 2, 3, 4, 0.5, 14]])
+    assert len(make_result(np.empty((0, 4)), [], []).boxes) == 0
@@ -0,0 +1,319 @@
+"""
+Tests for the Hailo engine (no Hailo hardware required, hailo_platform is mocked)
+"""
+
+import contextlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+cv2 = pytest.importorskip('cv2')
+
+from vogel_video_analyzer.hailo_engine import _MockBox, _MockBoxes, _MockResult
+
+
+def _boxes():
+    return [
+        _MockBox(10, 20, 110, 220, 0.9, 14),
+        _MockBox(5.7, 6.2, 50.9, 60.1, 0.2, 14),
+        _MockBox(0, 0, 30, 30, 0.8, 3),
+    ]
+
+
+def test_mock_boxes_data():
+    """Test: _MockBoxes exposes ultralytics-style (N, 6) arrays"""
+    boxes = _MockBoxes(_boxes())
+    data = boxes.data.cpu().numpy()
+    assert data.shape == (3, 6)
+    np.testing.assert_allclose(data[0], [10, 20, 110, 220, 0.9, 14], rtol=1e-6)
+    np.testing.assert_allclose(boxes.conf.numpy(), [0.9, 0.2, 0.8], rtol=1e-6)
+    np.testing.assert_array_equal(boxes.cls.numpy(), [14, 14, 3])
+    assert boxes.xyxy.numpy().shape == (3, 4)
+
+
+def test_mock_boxes_empty():
+    """Test: an empty result has a (0, 6) data array"""
+    assert _MockBoxes([]).data.numpy().shape == (0, 6)
+
+
+def test_mock_boxes_match_per_box_access():
+    """Test: array access agrees with the per-box API"""
+    result = _MockResult(_boxes())
+    data = result.boxes.data.numpy()
+    for row, box in zip(data, result.boxes):
+        assert int(row[5]) == int(box.cls[0])
+        assert float(row[4]) == float(box.conf[0])
+        np.testing.assert_array_equal(row[:4], box.xyxy[0].cpu().numpy())
+
+
+def test_filter_birds_mask():
+    """Test: VideoAnalyzer._filter_birds applies class and threshold as a mask"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    detector = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    detector.target_class = 14
+    detector.threshold = 0.3
+
+    xyxy, conf = detector._filter_birds(_MockBoxes(_boxes()))
+    assert xyxy.tolist() == [[10, 20, 110, 220]]
+    assert conf.tolist() == [pytest.approx(0.9)]
+
+    xyxy, conf = detector._filter_birds(_MockBoxes([]))
+    assert xyxy.shape == (0, 4) and conf.shape == (0,)
+
+
+class _FakeHailo:
+    """Minimal stand-in for the hailo_platform API used by HailoDetector"""
+
+    def __init__(self, detections):
+        self.detections = np.asarray(detections, dtype=np.float32)  # (N, 6) normalised
+        self.activations = 0
+        self.streams_opened = 0
+        self.streams_closed = 0
+        self.batches = []
+        self.inputs = []
+
+    def install(self, monkeypatch, hailo_engine):
+        fake = self
+        info = lambda name, shape: type('Info', (), {'name': name, 'shape': shape})()
+
+        class HEF:
+            def __init__(self, path):
+                pass
+
+            def get_input_vstream_infos(self):
+                return [info('input', (64, 64, 3))]
+
+            def get_output_vstream_infos(self):
+                return [info('nms', (len(fake.detections), 6))]
+
+        class NetworkGroup:
+            def create_params(self):
+                return 'params'
+
+            @contextlib.contextmanager
+            def activate(self, params):
+                fake.activations += 1
+                yield
+
+        class VDevice:
+            def configure(self, hef, params):
+                return [NetworkGroup()]
+
+        class InferVStreams:
+            def __init__(self, network_group, input_params, output_params):
+                pass
+
+            def __enter__(self):
+                fake.streams_opened += 1
+                return self
+
+            def __exit__(self, *exc):
+                fake.streams_closed += 1
+
+            def infer(self, input_data):
+                batch = input_data['input']
+                fake.batches.append(batch.shape)
+                fake.inputs.append((id(batch), batch.copy()))
+                return {'nms': np.repeat(fake.detections[None], len(batch), axis=0)}
+
+        namespace = SimpleNamespace(
+            HEF=HEF, VDevice=VDevice, InferVStreams=InferVStreams,
+            HailoStreamInterface=SimpleNamespace(PCIe='pcie'),
+            ConfigureParams=SimpleNamespace(create_from_hef=lambda hef, interface: {}),
+            InputVStreamParams=SimpleNamespace(make=lambda group, format_type: 'in'),
+            OutputVStreamParams=SimpleNamespace(make=lambda group, format_type: 'out'),
+            FormatType=SimpleNamespace(UINT8='uint8', FLOAT32='float32'),
+        )
+        for name, value in vars(namespace).items():
+            monkeypatch.setattr(hailo_engine, name, value, raising=False)
+        monkeypatch.setattr(hailo_engine, 'HAILO_AVAILABLE', True)
+
+
+@pytest.fixture
+def hailo_detector(monkeypatch, tmp_path):
+    from vogel_video_analyzer import hailo_engine
+
+    fake = _FakeHailo([[0.1, 0.2, 0.5, 0.6, 0.9, 14], [0, 0, 0, 0, 0.0, 0]])
+    fake.install(monkeypatch, hailo_engine)
+    hef = tmp_path / 'model.hef'
+    hef.write_bytes(b'')
+    detector = hailo_engine.HailoDetector(str(hef))
+    yield detector, fake
+    detector.close()
+
+
+def test_hailo_streams_stay_open(hailo_detector):
+    """Test: the network group is activated and vstreams opened once for all calls"""
+    detector, fake = hailo_detector
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    for _ in range(3):
+        results = detector(frame, verbose=False)
+        assert len(results) == 1
+
+    assert (fake.activations, fake.streams_opened, fake.streams_closed) == (1, 1, 0)
+    # 200×100 frame letterboxed into 64×64: scale 0.32, 16 px padding top and bottom
+    assert results[0].boxes.data.numpy().tolist() == [[20, 0, 100, 70, pytest.approx(0.9), 14]]
+
+    detector.close()
+    assert fake.streams_closed == 1
+    with pytest.raises(RuntimeError):
+        detector(frame)
+
+
+def test_hailo_batch_inference(hailo_detector):
+    """Test: a list of frames is inferred as one batch with one result per frame"""
+    detector, fake = hailo_detector
+    frames = [np.zeros((100, 200, 3), dtype=np.uint8), np.zeros((50, 40, 3), dtype=np.uint8)]
+    results = detector(frames)
+
+    assert fake.batches == [(2, 64, 64, 3)]
+    assert [r.boxes.xyxy.numpy().tolist() for r in results] == [[[20, 0, 100, 70]], [[0, 10, 20, 30]]]
+
+
+def test_hailo_letterbox_buffer_reused(hailo_detector):
+    """Test: frames are letterboxed into one reused input buffer"""
+    detector, fake = hailo_detector
+    detector(np.full((100, 200, 3), 50, dtype=np.uint8))
+    detector(np.full((200, 100, 3), 60, dtype=np.uint8))
+
+    (first_id, first), (second_id, second) = fake.inputs
+    assert first_id == second_id
+    # Wide frame: padded top/bottom; tall frame: padded left/right
+    assert (first[0, :16] == 114).all() and (first[0, 16:48] == 50).all() and (first[0, 48:] == 114).all()
+    assert (second[0, :, :16] == 114).all() and (second[0, :, 16:48] == 60).all()
+    assert (second[0, :16, 16:48] == 60).all()
+
+
+def test_hailo_submit_collect_order(hailo_detector):
+    """Test: submitted batches are collected in submission order"""
+    detector, fake = hailo_detector
+    small = np.zeros((10, 10, 3), dtype=np.uint8)
+    large = np.zeros((100, 100, 3), dtype=np.uint8)
+    detector.submit([small])
+    detector.submit([large, large])
+    assert detector.pending == 2
+
+    assert [r.boxes.xyxy.numpy().tolist() for r in detector.collect()] == [[[1, 2, 5, 6]]]
+    assert len(detector.collect()) == 2
+    assert detector.pending == 0
+    with pytest.raises(IndexError):
+        detector.collect()
+
+
+def test_analyzer_pipelines_async_engine(hailo_detector):
+    """Test: VideoAnalyzer keeps batches in flight on submit/collect engines"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    detector, fake = hailo_detector
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = detector
+
+    frames = [SimpleNamespace(image=np.zeros((20, 20, 3), dtype=np.uint8), index=i) for i in range(5)]
+    output = list(video_analyzer._iter_detections(frames, batch_size=2))
+
+    assert [frame.index for frame, _ in output] == [0, 1, 2, 3, 4]
+    assert fake.batches == [(2, 64, 64, 3), (2, 64, 64, 3), (1, 64, 64, 3)]
+    assert detector.pending == 0
+
+
+def test_parse_nms_output_vectorized():
+    """Test: NMS output is scaled, clipped, truncated and class-filtered as arrays"""
+    from vogel_video_analyzer.hailo_engine import HailoDetector
+
+    detector = HailoDetector.__new__(HailoDetector)
+    detector._output_names = ['nms']
+    detector._input_w, detector._input_h = 200, 100
+    detector.target_classes = None
+    raw = np.array([[
+        [0.1, 0.2, 0.555, 1.2, 0.9, 14],
+        [-0.1, 0.0, 0.3, 0.3, 0.5, 3],
+        [0.2, 0.2, 0.4, 0.4, 0.0, 14],    # padding row
+    ]], dtype=np.float32)
+
+    data = detector._parse_nms_output({'nms': raw}, 1.0, (0, 0), (100, 200, 3))
+    np.testing.assert_allclose(data, [[20, 20, 111, 100, 0.9, 14], [0, 0, 60, 30, 0.5, 3]], rtol=1e-6)
+
+    detector.target_classes = np.array([14], dtype=np.float32)
+    result = _MockResult(detector._parse_nms_output({'nms': raw}, 1.0, (0, 0), (100, 200, 3)))
+    assert len(result.boxes) == 1
+    box = next(iter(result.boxes))
+    assert int(box.cls[0]) == 14 and box.xyxy[0].numpy().tolist() == [20, 20, 111, 100]
+
+
+def _raw_outputs(num_classes=3, seed=0):
+    """Random raw feature maps for a 64×64 input at strides 8/16/32"""
+    rng = np.random.default_rng(seed)
+    outputs = {}
+    for name, size in (('out_a', 8), ('out_b', 4), ('out_c', 2)):
+        pred = rng.normal(0, 1, (1, size, size, 4 + num_classes)).astype(np.float32)
+        pred[..., 4:] -= 4  # mostly background
+        outputs[name] = pred
+    return outputs
+
+
+def _reference_multi_output(outputs, orig_w, orig_h, input_size=64):
+    """Previous decoder: per-call meshgrid, full sigmoid, cv2.dnn.NMSBoxes"""
+    boxes, scores, classes = [], [], []
+    for name, stride in zip(sorted(outputs), [8, 16, 32]):
+        pred = outputs[name][0]
+        grid_x, grid_y = np.meshgrid(np.arange(pred.shape[1]), np.arange(pred.shape[0]))
+        cls_scores = 1 / (1 + np.exp(-pred[..., 4:]))
+        cx = (grid_x + pred[..., 0]) * stride
+        cy = (grid_y + pred[..., 1]) * stride
+        w = np.exp(np.clip(pred[..., 2], -10, 10)) * stride
+        h = np.exp(np.clip(pred[..., 3], -10, 10)) * stride
+        mask = cls_scores.max(-1) > 0.01
+        box = np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], -1)[mask]
+        boxes.append(box / input_size * [orig_w, orig_h, orig_w, orig_h])
+        scores.append(cls_scores.max(-1)[mask])
+        classes.append(cls_scores.argmax(-1)[mask])
+    boxes, scores, classes = map(np.concatenate, (boxes, scores, classes))
+    xywh = [[b[0], b[1], b[2] - b[0], b[3] - b[1]] for b in boxes.tolist()]
+    indices = np.array(cv2.dnn.NMSBoxes(xywh, scores.tolist(), 0.01, 0.45)).flatten()
+    return [
+        [int(np.clip(boxes[i, 0], 0, orig_w)), int(np.clip(boxes[i, 1], 0, orig_h)),
+         int(np.clip(boxes[i, 2], 0, orig_w)), int(np.clip(boxes[i, 3], 0, orig_h)),
+         float(scores[i]), int(classes[i])]
+        for i in indices
+    ]
+
+
+def _raw_detector(target_classes=None):
+    from vogel_video_analyzer.hailo_engine import HailoDetector
+
+    detector = HailoDetector.__new__(HailoDetector)
+    detector._output_names = ['out_a', 'out_b', 'out_c']
+    detector._input_w = detector._input_h = 64
+    detector.target_classes = None if target_classes is None else np.asarray(target_classes, np.float32)
+    detector._grids = {}
+    return detector
+
+
+def test_parse_multi_output_matches_reference():
+    """Test: cached-grid decode with NumPy NMS matches the previous cv2 decoder"""
+    outputs = _raw_outputs()
+    detector = _raw_detector()
+    # Square frame: letterbox without padding, same as the old stretch resize
+    data = detector._parse_multi_output(outputs, 0.2, (0, 0), (320, 320, 3))
+    expected = _reference_multi_output(outputs, 320, 320)
+
+    assert len(data) == len(expected) > 0
+    np.testing.assert_allclose(data, np.array(expected, dtype=np.float32), rtol=1e-5, atol=1)
+    # Grids are built once per feature-map size and reused
+    assert sorted(detector._grids) == [(2, 2), (4, 4), (8, 8)]
+    grid = detector._grids[(8, 8)]
+    detector._parse_multi_output(outputs, 0.2, (0, 0), (320, 320, 3))
+    assert detector._grids[(8, 8)] is grid
+
+
+def test_parse_multi_output_target_classes():
+    """Test: only target class columns are decoded; unknown class ids are ignored"""
+    outputs = _raw_outputs()
+    data = _raw_detector(target_classes=[2, 14])._parse_multi_output(outputs, 1.0, (0, 0), (64, 64, 3))
+    assert len(data) and set(data[:, 5].tolist()) == {2}
+    assert _raw_detector(target_classes=[14])._parse_multi_output(outputs, 1.0, (0, 0), (64, 64, 3)).shape == (0, 6)
@@ -0,0 +1,88 @@
+"""
+Tests for the motion gate (YOLO is skipped on static frames)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('cv2')
+
+from vogel_video_analyzer.motion import MotionGate
+
+
+def _scene(seed=0, noise=3):
+    """1280×720 static scene with mild sensor noise"""
+    rng = np.random.default_rng(seed)
+    frame = np.full((720, 1280, 3), 90, dtype=np.uint8)
+    frame[400:] = 60
+    return np.clip(frame + rng.integers(-noise, noise + 1, frame.shape), 0, 255).astype(np.uint8)
+
+
+def test_static_frames_are_gated():
+    """Test: the first frame runs the detector, noisy static frames are gated"""
+    gate = MotionGate()
+    assert gate.check(_scene(0))
+    assert [gate.check(_scene(seed)) for seed in range(1, 6)] == [False] * 5
+    assert gate.frames_gated == 5
+
+
+def test_small_bird_passes_gate():
+    """Test: a 30×30 px object in a 1280×720 frame counts as motion"""
+    gate = MotionGate()
+    gate.check(_scene(0))
+    frame = _scene(1)
+    frame[300:330, 600:630] = 250
+    assert gate.check(frame)
+    # The new frame is the reference: the bird sitting still is gated again
+    assert not gate.check(frame)
+
+
+def test_reference_only_moves_on_motion():
+    """Test: slow changes accumulate against the last detector frame"""
+    gate = MotionGate(motion_threshold=0.01)
+    base = _scene(0, noise=0)
+    gate.check(base)
+    results = []
+    for step in range(1, 6):
+        frame = base.copy()
+        frame[:, :step * 4] = 255  # edge strip grows by 4 px per frame
+        results.append(gate.check(frame))
+    # 4 px (0.3%) and 8 px are below 1%, 12 px passes (compared to base)
+    assert results[:2] == [False, False] and results[2]
+
+
+def test_max_gated_forces_detector():
+    """Test: the detector runs after max_gated consecutive gated frames"""
+    gate = MotionGate(max_gated=2)
+    frame = _scene(0)
+    assert [gate.check(frame) for _ in range(7)] == [True, False, False, True, False, False, True]
+
+
+def test_gated_frames_reuse_previous_result():
+    """Test: _iter_detections skips the detector on gated frames and carries results forward"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    calls = []
+
+    def model(image, verbose=False):
+        calls.append(int(image[0, 0, 0]))
+        return [SimpleNamespace(value=int(image[0, 0, 0]))]
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+
+    values = [10, 10, 10, 200, 200, 10, 10]
+    frames = [SimpleNamespace(index=i, image=np.full((90, 160, 3), v, dtype=np.uint8))
+              for i, v in enumerate(values)]
+    for batch_size in (1, 2, 3):
+        calls.clear()
+        output = list(video_analyzer._iter_detections(frames, batch_size, MotionGate()))
+        assert [frame.index for frame, _ in output] == list(range(7))
+        assert [result.value for _, result in output] == values
+        assert calls == [10, 200, 10]
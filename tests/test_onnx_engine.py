@@ -0,0 +1,69 @@
+"""
+Tests for the ONNX Runtime detector engine (constant-output test models)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('cv2')
+pytest.importorskip('onnxruntime')
+onnx = pytest.importorskip('onnx')
+
+from onnx import helper, numpy_helper, TensorProto
+
+from vogel_video_analyzer.onnx_engine import OnnxDetector
+
+
+def _constant_model(path, output):
+    """Model with a 1x3x64x64 image input that always returns `output`"""
+    output = np.asarray(output, dtype=np.float32)
+    graph = helper.make_graph(
+        [helper.make_node('Constant', [], ['output0'], value=numpy_helper.from_array(output))],
+        'constant',
+        [helper.make_tensor_value_info('images', TensorProto.FLOAT, [1, 3, 64, 64])],
+        [helper.make_tensor_value_info('output0', TensorProto.FLOAT, list(output.shape))],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid('', 13)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+    return path
+
+
+def test_raw_head_output(tmp_path):
+    """Test: raw (4 + nc, anchors) output is decoded, NMS'd and mapped to the frame"""
+    # 3 anchors, 2 classes: cx, cy, w, h, score class 0, score class 1
+    head = np.array([
+        [32, 32, 16, 16, 0.1, 0.9],   # kept, class 1
+        [33, 32, 16, 16, 0.1, 0.8],   # suppressed by the first box
+        [10, 20, 8, 8, 0.6, 0.05],    # kept, class 0
+        [50, 50, 4, 4, 0.1, 0.1],     # below the confidence threshold
+    ], dtype=np.float32).T[np.newaxis]
+    detector = OnnxDetector(_constant_model(tmp_path / 'raw.onnx', head))
+
+    # 128x64 frame → scale 0.5, 16 px padding top and bottom
+    result = detector(np.zeros((64, 128, 3), dtype=np.uint8))[0]
+    data = result.boxes.data.numpy()
+    assert data.shape == (2, 6)
+    np.testing.assert_allclose(data[0], [48, 16, 80, 48, 0.9, 1], atol=1e-4)
+    np.testing.assert_allclose(data[1], [12, 0, 28, 16, 0.6, 0], atol=1e-4)
+
+
+def test_end_to_end_output(tmp_path):
+    """Test: (N, 6) end-to-end output is only thresholded and rescaled"""
+    e2e = np.array([[[16, 16, 48, 48, 0.8, 14], [0, 0, 8, 8, 0.1, 14]]], dtype=np.float32)
+    detector = OnnxDetector(_constant_model(tmp_path / 'e2e.onnx', e2e))
+
+    data = detector(np.zeros((128, 128, 3), dtype=np.uint8))[0].boxes.data.numpy()
+    np.testing.assert_allclose(data, [[32, 32, 96, 96, 0.8, 14]], atol=1e-4)
+
+
+def test_missing_model(tmp_path):
+    """Test: a missing ONNX file raises FileNotFoundError"""
+    with pytest.raises(FileNotFoundError):
+        OnnxDetector(tmp_path / 'missing.onnx')
@@ -0,0 +1,75 @@
+"""
+Tests for the background prefetch stages of the analysis pipeline
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from vogel_video_analyzer.prefetch import PrefetchIterator
+
+
+def test_preserves_order():
+    """Test: items arrive in source order"""
+    with PrefetchIterator(range(100), maxsize=3) as items:
+        assert list(items) == list(range(100))
+
+
+def test_chained_stages():
+    """Test: two chained stages behave like a plain generator pipeline"""
+    decoded = PrefetchIterator(range(20), maxsize=2)
+    squared = PrefetchIterator((x * x for x in decoded), maxsize=2)
+    try:
+        assert list(squared) == [x * x for x in range(20)]
+    finally:
+        squared.close()
+        decoded.close()
+
+
+def test_exception_is_reraised():
+    """Test: errors in the worker thread surface in the consumer"""
+    def failing():
+        yield 1
+        raise ValueError("decode failed")
+
+    items = PrefetchIterator(failing())
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="decode failed"):
+        next(items)
+    # Iterator stays exhausted afterwards
+    assert list(items) == []
+
+
+def test_backpressure():
+    """Test: the worker blocks once the queue is full"""
+    produced = []
+
+    def source():
+        for i in range(50):
+            produced.append(i)
+            yield i
+
+    items = PrefetchIterator(source(), maxsize=2)
+    time.sleep(0.3)
+    # maxsize buffered + one item held by the blocked put()
+    assert len(produced) <= 3
+    items.close()
+
+
+def test_close_stops_worker():
+    """Test: close() terminates an unfinished worker thread"""
+    def endless():
+        while True:
+            yield 0
+
+    items = PrefetchIterator(endless(), maxsize=1, name='test-prefetch')
+    next(items)
+    items.close()
+    assert not any(t.name == 'test-prefetch' for t in threading.enumerate())
+    assert list(items) == []
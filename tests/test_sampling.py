@@ -0,0 +1,88 @@
+"""
+Tests for adaptive frame sampling
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+
+from vogel_video_analyzer.sampling import AdaptiveSampler, sample_weights, weighted_share
+
+
+def _schedule(sampler, bird_frames, total):
+    """Run a sampler over a video; returns the analyzed 0-based indices in analysis order"""
+    analyzed = []
+    index = sampler.first_index
+    while index < total:
+        backfill, next_index = sampler.update(index, index in bird_frames)
+        analyzed.extend(backfill)
+        analyzed.append(index)
+        index = next_index
+    return analyzed
+
+
+def test_coarse_stride_without_birds():
+    """Test: an empty video is sampled like the fixed sample rate"""
+    sampler = AdaptiveSampler(coarse_step=10)
+    assert _schedule(sampler, set(), 50) == [9, 19, 29, 39, 49]
+    assert sampler.frames_backfilled == 0
+
+
+def test_densify_backfill_and_relax():
+    """Test: a detection backfills the gap, samples densely and relaxes after N empty samples"""
+    sampler = AdaptiveSampler(coarse_step=10, fine_step=2, relax_after=3)
+    analyzed = _schedule(sampler, set(range(15, 25)), 60)
+
+    assert analyzed == [9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29, 39, 49, 59]
+    assert analyzed == sorted(analyzed)
+    assert sampler.frames_backfilled == 4  # 11, 13, 15, 17
+
+
+def test_fine_step_limited_to_coarse_step():
+    """Test: the fine stride never exceeds the coarse stride"""
+    assert AdaptiveSampler(coarse_step=2, fine_step=5).fine_step == 2
+
+
+def test_sample_weights_are_time_based():
+    """Test: each sample counts for the frames closest to it"""
+    weights = sample_weights([10, 20, 22, 24, 40], 50)
+    np.testing.assert_allclose(weights, [15, 6, 2, 9, 18])
+    assert weights.sum() == 50
+    assert weighted_share(weights, [False, True, True, True, False]) == pytest.approx(34.0)
+    assert len(sample_weights([], 50)) == 0
+
+
+def test_adaptive_detections_in_frame_order():
+    """Test: backfilled frames are detected and yielded before the triggering sample"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    from vogel_video_analyzer.detection_utils import _MockResult
+    from vogel_video_analyzer.video_io import VideoFrame
+    birds = set(range(14, 20))
+
+    class Source:
+        total_frames = 40
+
+        def read_frame(self, index):
+            return VideoFrame(index, np.full((4, 4, 3), index, dtype=np.uint8))
+
+    def model(image, verbose=False):
+        index = int(image[0, 0, 0])
+        return [_MockResult([[0, 0, 2, 2, 0.9, 14]] if index in birds else [])]
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    video_analyzer.target_class = 14
+    video_analyzer.threshold = 0.3
+
+    sampler = AdaptiveSampler(coarse_step=10, fine_step=1, relax_after=2)
+    output = list(video_analyzer._iter_adaptive_detections(Source(), sampler, batch_size=4))
+    indices = [frame.index for frame, _ in output]
+
+    assert indices == [9] + list(range(10, 22)) + [31]
+    assert sampler.frames_backfilled == 9
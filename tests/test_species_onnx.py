@@ -0,0 +1,88 @@
+"""
+Tests for the ONNX Runtime species classifier engine
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+
+from vogel_video_analyzer.species_onnx import species_onnx_dir, META_FILE_NAME, MODEL_FILE_NAME
+
+
+def test_onnx_dir_per_model(tmp_path):
+    """Test: each model gets its own, stable export directory"""
+    first = species_onnx_dir('dima806/bird_species_image_detection', tmp_path)
+    assert first == species_onnx_dir('dima806/bird_species_image_detection', tmp_path)
+    assert first != species_onnx_dir('chriamue/bird-species-classifier', tmp_path)
+    assert first.parent == tmp_path / 'species-onnx'
+    assert '/' not in first.name
+
+
+def _tiny_model(path):
+    """Save a small randomly initialised ViT classifier with its image processor"""
+    transformers = pytest.importorskip('transformers')
+    config = transformers.ViTConfig(
+        image_size=32, patch_size=8, hidden_size=16, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=32, num_labels=5,
+        id2label={i: f'BIRD {i}' for i in range(5)}, label2id={f'BIRD {i}': i for i in range(5)},
+    )
+    transformers.ViTForImageClassification(config).save_pretrained(path)
+    transformers.ViTImageProcessor(size={'height': 32, 'width': 32}).save_pretrained(path)
+    return path
+
+
+def test_onnx_engine_matches_transformers(tmp_path, monkeypatch):
+    """Test: exported model gives the same predictions and is reused from the cache"""
+    pytest.importorskip('torch')
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('PIL')
+    from PIL import Image
+    from vogel_video_analyzer.species_classifier import BirdSpeciesClassifier
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    model_dir = _tiny_model(tmp_path / 'model')
+
+    rng = np.random.default_rng(0)
+    crops = [Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8))
+             for h, w in [(32, 32), (50, 20), (10, 90)]]
+
+    exact = BirdSpeciesClassifier(str(model_dir), confidence_threshold=0.0)
+    fast = BirdSpeciesClassifier(str(model_dir), confidence_threshold=0.0, fast_preprocess=True)
+    onnx = BirdSpeciesClassifier(str(model_dir), confidence_threshold=0.0, engine='onnx')
+    assert onnx.classifier is not None
+    assert exact._preprocess_config is None and fast._preprocess_config is not None
+
+    export_dir = species_onnx_dir(str(model_dir))
+    assert (export_dir / MODEL_FILE_NAME).exists()
+    assert (export_dir / META_FILE_NAME).exists()
+
+    # Same preprocessing: same predictions
+    expected = fast.classify_crops(crops, top_k=3)
+    result = onnx.classify_crops(crops, top_k=3)
+    assert [[p['label'] for p in preds] for preds in result] == [[p['label'] for p in preds] for preds in expected]
+    for preds, expected_preds in zip(result, expected):
+        assert [p['score'] for p in preds] == pytest.approx([p['score'] for p in expected_preds], abs=1e-5)
+
+    # Against the pipeline with the HF image processor: scores within 0.01
+    # (same-size crop identical; resized crops differ by the resize kernel)
+    for preds, exact_preds in zip(onnx.classify_crops(crops, top_k=5), exact.classify_crops(crops, top_k=5)):
+        exact_scores = {p['label']: p['score'] for p in exact_preds}
+        assert {p['label']: p['score'] for p in preds} == pytest.approx(exact_scores, abs=0.01)
+
+    # Second load uses the cached export
+    mtime = (export_dir / MODEL_FILE_NAME).stat().st_mtime_ns
+    BirdSpeciesClassifier(str(model_dir), confidence_threshold=0.0, engine='onnx')
+    assert (export_dir / MODEL_FILE_NAME).stat().st_mtime_ns == mtime
+
+
+def test_unknown_engine():
+    """Test: unknown species engines are rejected"""
+    from vogel_video_analyzer.species_classifier import BirdSpeciesClassifier
+    with pytest.raises(ValueError):
+        BirdSpeciesClassifier('model', engine='tflite')
@@ -0,0 +1,109 @@
+"""
+Tests for the batched species crop preprocessing (fast path)
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('PIL')
+
+from vogel_video_analyzer.species_classifier import BirdSpeciesClassifier
+
+
+def _processor(**overrides):
+    """ViT-style image processor config"""
+    config = dict(
+        do_resize=True, size={'height': 32, 'width': 24}, resample=2,
+        do_rescale=True, rescale_factor=1 / 255,
+        do_normalize=True, image_mean=[0.5, 0.4, 0.3], image_std=[0.2, 0.25, 0.5],
+    )
+    config.update(overrides)
+    return SimpleNamespace(**config)
+
+
+def _classifier(processor):
+    classifier = BirdSpeciesClassifier.__new__(BirdSpeciesClassifier)
+    classifier._preprocess_config = BirdSpeciesClassifier._build_preprocess_config(processor)
+    return classifier
+
+
+def _crop(height, width, seed=0):
+    from PIL import Image
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 3), dtype=np.uint8))
+
+
+def test_batch_shape_and_normalization():
+    """Test: crops of any size become one normalized NCHW float32 batch"""
+    classifier = _classifier(_processor())
+    crop = _crop(32, 24)
+    pixels = classifier._preprocess_crops([crop, _crop(100, 7, seed=1), _crop(5, 300, seed=2)])
+
+    assert pixels.shape == (3, 3, 32, 24)
+    assert pixels.dtype == np.float32
+
+    # Same-size crop is not resampled: (x / 255 - mean) / std per channel
+    expected = (np.asarray(crop, dtype=np.float64) / 255 - [0.5, 0.4, 0.3]) / [0.2, 0.25, 0.5]
+    np.testing.assert_allclose(pixels[0], expected.transpose(2, 0, 1), rtol=1e-5, atol=1e-5)
+
+
+def test_center_crop_and_efficientnet_options():
+    """Test: center crop, rescale_offset and include_top are applied"""
+    processor = _processor(do_center_crop=True, crop_size={'height': 16, 'width': 12},
+                           do_normalize=False, rescale_offset=True, include_top=True,
+                           image_std=[0.5, 0.5, 0.5])
+    classifier = _classifier(processor)
+    crop = _crop(32, 24)
+    pixels = classifier._preprocess_crops([crop])
+
+    assert pixels.shape == (1, 3, 16, 12)
+    center = np.asarray(crop, dtype=np.float64)[8:24, 6:18]
+    expected = (center / 255 - 1) / 0.5
+    np.testing.assert_allclose(pixels[0], expected.transpose(2, 0, 1), rtol=1e-5, atol=1e-5)
+
+
+def test_unsupported_processor_keeps_pipeline():
+    """Test: configs without a fixed height/width resize fall back to the pipeline"""
+    assert BirdSpeciesClassifier._build_preprocess_config(None) is None
+    assert BirdSpeciesClassifier._build_preprocess_config(_processor(size={'shortest_edge': 224})) is None
+    assert BirdSpeciesClassifier._build_preprocess_config(_processor(do_resize=False)) is None
+    assert BirdSpeciesClassifier._build_preprocess_config(_processor(do_pad=True)) is None
+
+
+def test_matches_transformers_processor():
+    """Test: same-size crops give the same pixel values as the HF image processor"""
+    transformers = pytest.importorskip('transformers')
+    processor = transformers.ViTImageProcessor(size={'height': 32, 'width': 24})
+    classifier = _classifier(processor)
+    crops = [_crop(32, 24, seed=seed) for seed in range(3)]
+
+    expected = np.asarray(processor(crops, return_tensors='np')['pixel_values'])
+    np.testing.assert_allclose(classifier._preprocess_crops(crops), expected, atol=1e-4)
+
+
+def test_resized_crops_close_to_transformers_processor():
+    """Test: resized crops stay within 0.05 (about 6 grey levels) of the HF image processor"""
+    transformers = pytest.importorskip('transformers')
+    cv2 = pytest.importorskip('cv2')
+    from PIL import Image
+    processor = transformers.ViTImageProcessor(size={'height': 32, 'width': 24})
+    classifier = _classifier(processor)
+
+    # Smooth, photo-like crops (enlarged and shrunk); per-pixel noise is not representative
+    crops = []
+    for seed, (height, width) in enumerate([(10, 90), (50, 20), (200, 150)]):
+        coarse = np.random.default_rng(seed).integers(0, 256, (4, 4, 3)).astype(np.uint8)
+        crops.append(Image.fromarray(cv2.resize(coarse, (width, height), interpolation=cv2.INTER_CUBIC)))
+
+    for crop in crops:
+        expected = np.asarray(processor([crop], return_tensors='np')['pixel_values'])
+        difference = np.abs(classifier._preprocess_crops([crop]) - expected)
+        assert difference.max() <= 0.05
+        assert difference.mean() <= 0.01
@@ -0,0 +1,81 @@
+"""
+Tests for the cross-frame species crop queue
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('PIL')
+
+from vogel_video_analyzer.species_classifier import SpeciesCropQueue
+
+
+class FakeClassifier:
+    """Labels each crop by its height and records the batch sizes"""
+
+    def __init__(self):
+        self.batches = []
+
+    def classify_crops(self, crops, top_k=1):
+        self.batches.append(len(crops))
+        return [[{'label': f'H{crop.size[1]}', 'score': 0.9}] if crop is not None else [] for crop in crops]
+
+
+def _crop(height):
+    from PIL import Image
+    return Image.fromarray(np.zeros((height, 10, 3), dtype=np.uint8))
+
+
+def test_batches_across_adds():
+    """Test: crops are classified once the batch is full, in order"""
+    classifier = FakeClassifier()
+    queue = SpeciesCropQueue(classifier, batch_size=3)
+    results = []
+    for height in range(1, 8):
+        queue.add(_crop(height), lambda preds, h=height: results.append((h, preds[0]['label'])))
+
+    assert classifier.batches == [3, 3]
+    assert len(queue) == 1
+
+    queue.flush()
+    assert classifier.batches == [3, 3, 1]
+    assert results == [(h, f'H{h}') for h in range(1, 8)]
+
+
+def test_flush_empty():
+    """Test: flushing an empty queue does not call the classifier"""
+    classifier = FakeClassifier()
+    SpeciesCropQueue(classifier, batch_size=4).flush()
+    assert classifier.batches == []
+
+
+def test_empty_crop_gets_no_predictions():
+    """Test: None crops (empty boxes) receive an empty prediction list"""
+    classifier = FakeClassifier()
+    queue = SpeciesCropQueue(classifier, batch_size=8)
+    results = []
+    queue.add(None, results.append)
+    queue.add(_crop(5), results.append)
+    queue.flush()
+    assert results[0] == []
+    assert results[1][0]['label'] == 'H5'
+
+
+def test_crop_image():
+    """Test: crop_image clips boxes to the frame and copies the pixels"""
+    from vogel_video_analyzer.species_classifier import BirdSpeciesClassifier, SPECIES_AVAILABLE
+    if not SPECIES_AVAILABLE:
+        pytest.skip('species dependencies not installed')
+
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    crop = BirdSpeciesClassifier.crop_image(frame, (-10, 20, 50, 300))
+    assert crop.size == (50, 80)
+    frame[:] = 255
+    assert np.asarray(crop).max() == 0
+    assert BirdSpeciesClassifier.crop_image(frame, (50, 50, 50, 60)) is None
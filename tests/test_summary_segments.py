@@ -0,0 +1,61 @@
+"""
+Tests for the segment computation of create_summary_video
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+find_segments = analyzer.VideoAnalyzer._find_activity_segments
+
+
+def test_no_birds():
+    """Test: no bird frames produce no segments"""
+    assert find_segments(set(), 10.0, 300) == []
+
+
+def test_two_segments():
+    """Test: a long gap splits activity into two padded segments"""
+    bird_frames = set(range(0, 51, 5)) | set(range(200, 251, 5))
+    segments = find_segments(bird_frames, 10.0, 300, skip_empty_seconds=3.0, min_activity_duration=2.0)
+    assert segments == [(0.0, 6.0), (19.0, 26.0)]
+
+
+def test_short_gap_merges():
+    """Test: gaps shorter than skip_empty_seconds stay in one segment"""
+    bird_frames = set(range(0, 51, 5)) | set(range(70, 101, 5))
+    segments = find_segments(bird_frames, 10.0, 300, skip_empty_seconds=3.0, min_activity_duration=2.0)
+    assert segments == [(0.0, 11.0)]
+
+
+def test_unsorted_input():
+    """Test: frame order does not matter"""
+    bird_frames = [250, 0, 200, 50, 5, 205]
+    assert find_segments(bird_frames, 10.0, 300) == find_segments(sorted(bird_frames), 10.0, 300)
+
+
+def test_short_activity_at_end_dropped():
+    """Test: segments clipped by the video end below min_activity_duration are dropped"""
+    assert find_segments({295}, 10.0, 300, skip_empty_seconds=3.0, min_activity_duration=2.0) == []
+
+
+def test_concat_script():
+    """Test: the single-pass concat script cuts every segment from the source"""
+    script = analyzer.VideoAnalyzer._build_concat_script('/videos/clip.mp4', [(1.0, 2.5), (10.0, 12.0)])
+    lines = script.splitlines()
+    assert lines[0] == 'ffconcat version 1.0'
+    assert lines[1:] == [
+        "file 'file:/videos/clip.mp4'", 'inpoint 1.000000', 'outpoint 2.500000',
+        "file 'file:/videos/clip.mp4'", 'inpoint 10.000000', 'outpoint 12.000000',
+    ]
+
+
+def test_concat_script_escapes_quotes():
+    """Test: single quotes in paths are escaped for the concat demuxer"""
+    script = analyzer.VideoAnalyzer._build_concat_script("/videos/bird's nest.mp4", [(0.0, 1.0)])
+    assert "file 'file:/videos/bird'\\''s nest.mp4'" in script.splitlines()
@@ -0,0 +1,105 @@
+"""
+Tests for the IoU bird tracker and per-track species voting
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+np = pytest.importorskip('numpy')
+
+from vogel_video_analyzer.tracker import IoUTracker, iou_matrix, vote_species
+
+
+def test_iou_matrix():
+    """Test: pairwise IoU of identical, half-overlapping and disjoint boxes"""
+    ious = iou_matrix([(0, 0, 10, 10)], [(0, 0, 10, 10), (5, 0, 15, 10), (20, 20, 30, 30)])
+    assert ious.shape == (1, 3)
+    assert ious[0, 0] == pytest.approx(1.0)
+    assert ious[0, 1] == pytest.approx(50 / 150)
+    assert ious[0, 2] == 0.0
+
+
+def test_moving_bird_keeps_track_id():
+    """Test: overlapping boxes in consecutive frames continue one track"""
+    tracker = IoUTracker(iou_threshold=0.3)
+    ids = [tracker.update([(x, 0, x + 20, 20)], frame)[0][0] for frame, x in enumerate(range(0, 20, 4))]
+    assert ids == [1] * 5
+    assert tracker.active[0].hits == 5
+
+
+def test_two_birds_get_separate_tracks():
+    """Test: boxes are matched to the best-overlapping track, new boxes open tracks"""
+    tracker = IoUTracker()
+    ids, _ = tracker.update([(0, 0, 20, 20), (100, 100, 120, 120)], 1)
+    assert ids == [1, 2]
+    # Input order swapped, both birds moved a little
+    ids, _ = tracker.update([(102, 101, 122, 121), (1, 1, 21, 21)], 2)
+    assert ids == [2, 1]
+    ids, _ = tracker.update([(1, 1, 21, 21), (300, 0, 320, 20)], 3)
+    assert ids == [1, 3]
+
+
+def test_track_ends_after_max_missed():
+    """Test: a track survives max_missed empty updates and ends after that"""
+    tracker = IoUTracker(max_missed=2)
+    tracker.update([(0, 0, 20, 20)], 1)
+    assert tracker.update([], 2)[1] == []
+    assert tracker.update([], 3)[1] == []
+    ids, finished = tracker.update([], 4)
+    assert [bird.track_id for bird in finished] == [1]
+    assert (finished[0].first_frame, finished[0].last_frame) == (1, 1)
+
+    # The gap is bridged while the track is still open
+    tracker.update([(0, 0, 20, 20)], 5)
+    tracker.update([], 6)
+    ids, finished = tracker.update([(0, 0, 20, 20)], 7)
+    assert ids == [2] and finished == []
+
+    remaining = tracker.finish()
+    assert [bird.track_id for bird in remaining] == [2]
+    assert remaining[0].hits == 2
+    assert tracker.active == []
+
+
+def test_vote_species():
+    """Test: score-weighted vote over the crops of a track"""
+    predictions = [
+        [{'label': 'ROBIN', 'score': 0.9}],
+        [{'label': 'GREAT TIT', 'score': 0.5}],
+        [{'label': 'GREAT TIT', 'score': 0.6}],
+        [],
+    ]
+    assert vote_species(predictions) == {'label': 'GREAT TIT', 'score': pytest.approx(0.55)}
+    assert vote_species([[], []]) is None
+    assert vote_species([]) is None
+
+
+def test_track_ends_after_frame_gap():
+    """Test: with max_gap_frames tracks end by frame distance, not by missed updates"""
+    tracker = IoUTracker(max_gap_frames=10)
+    tracker.update([(0, 0, 20, 20)], 1)
+    for frame in range(2, 12):
+        assert tracker.update([], frame)[1] == []
+    ids, finished = tracker.update([], 12)
+    assert [bird.track_id for bird in finished] == [1]
+
+    # One late coarse sample more than 10 frames away ends the track as well
+    tracker.update([(0, 0, 20, 20)], 20)
+    assert [bird.track_id for bird in tracker.update([], 40)[1]] == [2]
+
+
+def test_box_after_frame_gap_starts_new_track():
+    """Test: a box at the same place after the gap is a new visit, the old track ends"""
+    tracker = IoUTracker(max_gap_frames=10)
+    tracker.update([(0, 0, 20, 20)], 1)
+    assert tracker.update([(0, 0, 20, 20)], 11)[0] == [1]
+
+    ids, finished = tracker.update([(0, 0, 20, 20)], 22)
+    assert ids == [2]
+    assert [(bird.track_id, bird.last_frame) for bird in finished] == [(1, 11)]
+    assert [bird.track_id for bird in tracker.active] == [2]
@@ -0,0 +1,144 @@
+"""
+Tests for the triage scan and early-exit analysis
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+
+from vogel_video_analyzer.detection_utils import _MockResult
+
+FPS = 10.0
+
+
+@pytest.fixture(params=['opencv', 'pyav'])
+def reader(request):
+    """Run each test with the OpenCV seek scan and the PyAV keyframe scan"""
+    if request.param == 'pyav':
+        pytest.importorskip('av')
+    return request.param
+
+
+def _write_video(path, bird_frames, frames=100):
+    """10 FPS MJPG video (every frame a keyframe) with a bright square on bird_frames"""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), FPS, (160, 120))
+    if not writer.isOpened():
+        pytest.skip('MJPG writer not available')
+    for index in range(frames):
+        image = np.full((120, 160, 3), 20, dtype=np.uint8)
+        if index in bird_frames:
+            image[30:70, 40:90] = 230
+        writer.write(image)
+    writer.release()
+    return path
+
+
+def _analyzer(confidence, calls):
+    """VideoAnalyzer with a detector reporting a bird of the given confidence on bright frames"""
+    def model(image, verbose=False):
+        calls.append(1)
+        bird = image[30:70, 40:90].mean() > 128
+        return [_MockResult([[40, 30, 90, 70, confidence, 14]] if bird else [])]
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    video_analyzer.threshold = 0.3
+    video_analyzer.target_class = 14
+    video_analyzer.identify_species = False
+    video_analyzer.species_classifier = None
+    video_analyzer.cache = None
+    return video_analyzer
+
+
+def test_triage_stops_at_confident_bird(tmp_path, reader):
+    """Test: the scan ends at the first confident detection"""
+    path = _write_video(tmp_path / 'bird.avi', set(range(35, 100)))
+    calls = []
+    stats = _analyzer(0.8, calls).analyze_video(path, sample_rate=1, triage=True, decoder=reader)
+
+    assert stats['triage']['result'] == 'bird'
+    assert stats['triage']['keyframes'] == (reader == 'pyav')
+    # Frames 0, 20 and 40 (2 s apart): stopped at frame 40
+    assert len(calls) == stats['frames_analyzed'] == 3
+    assert stats['detections'] == [{'frame': 41, 'timestamp': pytest.approx(4.1 if reader == 'opencv' else 4.0),
+                                    'birds': 1}]
+    assert stats['bird_percentage'] > 0
+
+
+def test_triage_empty_video(tmp_path, reader):
+    """Test: a file without any detection is decided by the scan alone"""
+    path = _write_video(tmp_path / 'empty.avi', set())
+    calls = []
+    stats = _analyzer(0.8, calls).analyze_video(path, sample_rate=1, triage=True, triage_interval=1.0,
+                                                decoder=reader)
+
+    assert stats['triage'] == {'result': 'empty', 'frames_checked': 10, 'keyframes': reader == 'pyav'}
+    assert len(calls) == 10
+    assert stats['bird_percentage'] == 0.0
+    assert stats['bird_segments'] == []
+
+
+def test_triage_escalates_weak_detections(tmp_path, reader):
+    """Test: detections below the triage confidence trigger the full analysis"""
+    path = _write_video(tmp_path / 'weak.avi', set(range(35, 60)))
+    calls = []
+    stats = _analyzer(0.4, calls).analyze_video(path, sample_rate=5, triage=True, decoder=reader)
+
+    assert stats['triage']['result'] == 'escalated'
+    assert stats['triage']['frames_checked'] == 5
+    assert stats['frames_analyzed'] == 20
+    assert len(calls) == 5 + 20
+    assert stats['frames_with_birds'] == 5
+
+
+def test_early_exit_reason_bounds():
+    """Test: the percentage bound is decided only when the remaining samples cannot change it"""
+    reason = analyzer.VideoAnalyzer._early_exit_reason
+    assert reason(1, 1, 10, stop_at_first_bird=True) == 'first_bird'
+    assert reason(1, 0, 10, stop_at_first_bird=True) is None
+    # 20 % of 10 samples: 2 birds decide "above", 9 empty samples "below"
+    assert reason(3, 1, 10, min_bird_percentage=20) is None
+    assert reason(4, 2, 10, min_bird_percentage=20) == 'above_bound'
+    assert reason(8, 0, 10, min_bird_percentage=20) is None
+    assert reason(9, 0, 10, min_bird_percentage=20) == 'below_bound'
+    # Unknown frame count, or more samples than expected: no bound
+    assert reason(5, 5, 0, min_bird_percentage=20) is None
+    assert reason(12, 0, 10, min_bird_percentage=20) is None
+
+
+def test_early_exit_partial_stats(tmp_path):
+    """Test: analyze_video stops once decided and flags the partial statistics"""
+    path = _write_video(tmp_path / 'bird.avi', set(range(30, 60)))
+    analyzer_kwargs = dict(sample_rate=10, batch_size=2)
+    calls = []
+    video_analyzer = _analyzer(0.8, calls)
+
+    full = video_analyzer.analyze_video(path, **analyzer_kwargs)
+    assert full['bird_percentage'] == 30.0 and 'early_terminated' not in full
+
+    stats = video_analyzer.analyze_video(path, stop_at_first_bird=True, **analyzer_kwargs)
+    assert stats['early_terminated'] and stats['early_exit'] == {'reason': 'first_bird', 'frame': 40}
+    assert stats['frames_analyzed'] == 4 and stats['frames_with_birds'] == 1
+
+    stats = video_analyzer.analyze_video(path, min_bird_percentage=50, **analyzer_kwargs)
+    assert stats['early_exit'] == {'reason': 'below_bound', 'frame': 90}
+    assert stats['frames_analyzed'] == 9
+
+    stats = video_analyzer.analyze_video(path, min_bird_percentage=30, **analyzer_kwargs)
+    assert stats['early_exit'] == {'reason': 'above_bound', 'frame': 60}
+
+    # 35 %: 3 of 10 samples, decided only by the last sample
+    stats = video_analyzer.analyze_video(path, min_bird_percentage=35, **analyzer_kwargs)
+    assert stats['early_terminated'] is False
+    assert stats['bird_percentage'] == full['bird_percentage']
+
+    with pytest.raises(ValueError):
+        video_analyzer.analyze_video(path, min_bird_percentage=30, adaptive_sampling=True)
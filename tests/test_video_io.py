@@ -0,0 +1,355 @@
+"""
+Tests for the frame source used by the analysis passes
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from vogel_video_analyzer.video_io import (FFmpegVideoWriter, FrameSource, PyAVFrameSource, ScaledFrameSource,
+                                           open_frame_source)
+
+
+NUM_FRAMES = 40
+
+
+def _frame_value(index):
+    """Grey level encoded into frame ``index`` (robust against MJPG loss)"""
+    return (index * 6) % 250
+
+
+def _decoded_index(image):
+    """Recover the frame index encoded by ``_frame_value``"""
+    return int(round(float(image.mean()) / 6))
+
+
+@pytest.fixture
+def sample_video(tmp_path):
+    """Writes a short MJPG clip whose frames encode their own index"""
+    path = tmp_path / 'sample.avi'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 10.0, (64, 48))
+    if not writer.isOpened():
+        pytest.skip('MJPG writer not available')
+    for index in range(NUM_FRAMES):
+        writer.write(np.full((48, 64, 3), _frame_value(index), dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_properties(sample_video):
+    """Test: video properties are read on open"""
+    with FrameSource(sample_video) as source:
+        assert source.total_frames == NUM_FRAMES
+        assert source.width == 64
+        assert source.height == 48
+        assert source.fps == pytest.approx(10.0)
+
+
+def test_open_missing_file(tmp_path):
+    """Test: opening a missing file raises RuntimeError"""
+    with pytest.raises(RuntimeError):
+        FrameSource(tmp_path / 'missing.mp4')
+
+
+def test_iter_sampled_grab(sample_video):
+    """Test: sampled frames match the frames cap.read() would return"""
+    with FrameSource(sample_video, seek_threshold=0) as source:
+        frames = list(source.iter_sampled(5, start=4))
+
+    assert [f.index for f in frames] == list(range(4, NUM_FRAMES, 5))
+    for frame in frames:
+        assert _decoded_index(frame.image) == frame.index
+
+
+def test_iter_sampled_seek_matches_grab(sample_video):
+    """Test: seeking for large strides yields the same frames as grabbing"""
+    with FrameSource(sample_video, seek_threshold=0) as source:
+        grabbed = [(f.index, _decoded_index(f.image)) for f in source.iter_sampled(7)]
+    with FrameSource(sample_video, seek_threshold=2) as source:
+        seeked = [(f.index, _decoded_index(f.image)) for f in source.iter_sampled(7)]
+
+    assert grabbed == seeked
+
+
+def test_iter_frames(sample_video):
+    """Test: iter_frames yields every frame in order"""
+    with FrameSource(sample_video) as source:
+        indices = [f.index for f in source.iter_frames()]
+    assert indices == list(range(NUM_FRAMES))
+
+
+def test_read_at(sample_video):
+    """Test: random access forward and backward"""
+    with FrameSource(sample_video) as source:
+        assert _decoded_index(source.read_at(10)) == 10
+        assert _decoded_index(source.read_at(12)) == 12
+        assert _decoded_index(source.read_at(3)) == 3
+        assert source.read_at(NUM_FRAMES + 5) is None
+
+
+def test_iter_sampled_matches_seek_per_sample(sample_video):
+    """Test: sequential sampling returns the frames of a seek-per-sample loop"""
+    cap = cv2.VideoCapture(str(sample_video))
+    seeked = []
+    for index in range(0, NUM_FRAMES, 5):
+        cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ret, image = cap.read()
+        assert ret
+        seeked.append((index, _decoded_index(image)))
+    cap.release()
+
+    with FrameSource(sample_video) as source:
+        sampled = [(f.index, _decoded_index(f.image)) for f in source.iter_sampled(5, start=0)]
+
+    assert sampled == seeked
+
+
+
+def test_open_frame_source_backends(sample_video):
+    """Test: the factory returns the OpenCV reader and rejects invalid options"""
+    with open_frame_source(sample_video) as source:
+        assert isinstance(source, FrameSource)
+        assert source.read_frame(5).index == 5
+    with pytest.raises(ValueError):
+        open_frame_source(sample_video, decoder='gstreamer')
+    with pytest.raises(ValueError):
+        open_frame_source(sample_video, keyframes_only=True)
+
+
+def _write_pyav_video(path, pts, gop=5):
+    """Encodes frames with the given PTS (time base 1/10 s) and fixed GOP; frame i has grey level 20*i"""
+    av = pytest.importorskip('av')
+    from fractions import Fraction
+    container = av.open(str(path), 'w')
+    stream = container.add_stream('mpeg4', rate=10, options={'g': str(gop), 'sc_threshold': '1000000000'})
+    stream.width, stream.height, stream.pix_fmt = 64, 48, 'yuv420p'
+    stream.codec_context.time_base = Fraction(1, 10)
+    for index, frame_pts in enumerate(pts):
+        frame = av.VideoFrame.from_ndarray(np.full((48, 64, 3), index * 20, dtype=np.uint8), format='bgr24')
+        frame.pts = frame_pts
+        frame.time_base = Fraction(1, 10)
+        for packet in stream.encode(frame):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+
+
+def _grey_index(image):
+    return int(round(float(image.mean()) / 20))
+
+
+def test_pyav_matches_opencv(sample_video):
+    """Test: the PyAV reader returns the same frames as the OpenCV reader"""
+    pytest.importorskip('av')
+    with PyAVFrameSource(sample_video) as source:
+        assert (source.total_frames, source.width, source.height) == (NUM_FRAMES, 64, 48)
+        assert source.fps == pytest.approx(10.0)
+        frames = list(source.iter_sampled(7, start=6))
+        assert [frame.index for frame in frames] == [6, 13, 20, 27, 34]
+        assert [_decoded_index(frame.image) for frame in frames] == [6, 13, 20, 27, 34]
+        assert [frame.timestamp for frame in frames] == pytest.approx([0.6, 1.3, 2.0, 2.7, 3.4])
+
+    with open_frame_source(sample_video, decoder='pyav', seek_threshold=5) as source:
+        assert [frame.index for frame in source.iter_sampled(7, start=6)] == [6, 13, 20, 27, 34]
+        assert _decoded_index(source.read_at(13)) == 13
+        assert _decoded_index(source.read_at(3)) == 3
+
+
+def test_pyav_seek_on_long_gop(tmp_path):
+    """Test: seeking into an inter-coded GOP decodes forward to the exact frame"""
+    path = tmp_path / 'gop.mp4'
+    _write_pyav_video(path, list(range(12)))
+    with PyAVFrameSource(path, seek_threshold=3) as source:
+        frames = list(source.iter_sampled(3, start=1))
+        assert [(frame.index, _grey_index(frame.image)) for frame in frames] == [(1, 1), (4, 4), (7, 7), (10, 10)]
+        assert _grey_index(source.read_at(9)) == 9
+        assert _grey_index(source.read_at(2)) == 2
+
+
+def test_pyav_variable_frame_rate_timestamps(tmp_path):
+    """Test: PyAV frames carry their real presentation time, not index / fps"""
+    path = tmp_path / 'vfr.mp4'
+    pts = [0, 1, 2, 5, 6, 10, 11, 20]
+    _write_pyav_video(path, pts)
+    with PyAVFrameSource(path) as source:
+        frames = list(source.iter_frames())
+    assert [frame.index for frame in frames] == list(range(len(pts)))
+    assert [frame.timestamp for frame in frames] == pytest.approx([p / 10 for p in pts])
+
+
+def test_pyav_keyframes_only(tmp_path):
+    """Test: keyframe-only mode returns keyframes, at least step frames apart"""
+    path = tmp_path / 'gop.mp4'
+    _write_pyav_video(path, list(range(12)), gop=5)
+    with PyAVFrameSource(path, keyframes_only=True) as source:
+        frames = list(source.iter_sampled(1))
+        assert [frame.index for frame in frames] == [0, 5, 10]
+        assert [_grey_index(frame.image) for frame in frames] == [0, 5, 10]
+    with PyAVFrameSource(path, keyframes_only=True) as source:
+        assert [frame.index for frame in source.iter_sampled(7)] == [0, 10]
+
+
+def test_pyav_scaled_source(sample_video):
+    """Test: with the PyAV decoder the downscaled frames keep their timestamps"""
+    pytest.importorskip('av')
+    with ScaledFrameSource(sample_video, 32, decoder='pyav') as source:
+        assert source.scaler == 'PyAV'
+        frames = list(source.iter_sampled(10, start=9))
+        assert all(frame.image.shape == (24, 32, 3) for frame in frames)
+        assert [frame.timestamp for frame in frames] == pytest.approx([0.9, 1.9, 2.9, 3.9])
+        assert source.read_frame(13).timestamp == pytest.approx(1.3)
+        assert source.read_full(13).shape == (48, 64, 3)
+
+
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which('ffmpeg') is None, reason='ffmpeg not installed')
+
+
+def _check_scaled_source(path, use_ffmpeg):
+    with ScaledFrameSource(path, 32, use_ffmpeg=use_ffmpeg) as source:
+        assert (source.width, source.height) == (64, 48)
+        assert (source.scaled_width, source.scaled_height) == (32, 24)
+        assert (source.scale_x, source.scale_y) == (2.0, 2.0)
+
+        frames = list(source.iter_sampled(7, start=6))
+        assert [frame.index for frame in frames] == [6, 13, 20, 27, 34]
+        assert all(frame.image.shape == (24, 32, 3) for frame in frames)
+        assert [_decoded_index(frame.image) for frame in frames] == [6, 13, 20, 27, 34]
+
+        # Full-resolution frames on demand
+        assert source.read_at(13).shape == (24, 32, 3)
+        full = source.read_full(13)
+        assert full.shape == (48, 64, 3) and _decoded_index(full) == 13
+        assert _decoded_index(source.read_full(3)) == 3
+
+
+def test_scaled_source_opencv(sample_video):
+    """Test: downscaled sampling without ffmpeg, full frames read on demand"""
+    _check_scaled_source(sample_video, use_ffmpeg=False)
+
+
+@requires_ffmpeg
+def test_scaled_source_ffmpeg(sample_video):
+    """Test: ffmpeg selects and scales the same frames as the OpenCV path"""
+    _check_scaled_source(sample_video, use_ffmpeg=True)
+
+
+def test_analyze_downscaled_maps_boxes(tmp_path):
+    """Test: boxes found on downscaled frames are reported in original pixels"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    from vogel_video_analyzer.detection_track import DetectionTrack
+    from vogel_video_analyzer.detection_utils import _MockResult
+
+    path = tmp_path / 'bird.avi'
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 10.0, (320, 240))
+    if not writer.isOpened():
+        pytest.skip('MJPG writer not available')
+    for index in range(10):
+        image = np.zeros((240, 320, 3), dtype=np.uint8)
+        image[80:160, 120 + index * 8:200 + index * 8] = 255
+        writer.write(image)
+    writer.release()
+
+    def model(image, verbose=False):
+        ys, xs = np.nonzero(image[:, :, 0] > 128)
+        return [_MockResult([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1, 0.9, 14]])]
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    video_analyzer.threshold = 0.3
+    video_analyzer.target_class = 14
+    video_analyzer.identify_species = False
+    video_analyzer.species_classifier = None
+    video_analyzer.cache = None
+
+    tracks = {}
+    for detect_width in (None, 160):
+        tracks[detect_width] = DetectionTrack(max_thumbnails=0)
+        stats = video_analyzer.analyze_video(path, sample_rate=2, track=tracks[detect_width],
+                                             detect_width=detect_width)
+    assert stats['detect_resolution'] == '160x120'
+
+    for frame_number in tracks[None].bird_frames():
+        full = np.array(tracks[None].boxes_at(frame_number)[0]['bbox'])
+        scaled = np.array(tracks[160].boxes_at(frame_number)[0]['bbox'])
+        assert np.abs(full - scaled).max() <= 2
+
+
+@requires_ffmpeg
+def test_ffmpeg_writer(sample_video, tmp_path):
+    """Test: frames piped to ffmpeg are encoded; missing audio is tolerated"""
+    output = tmp_path / 'out.mp4'
+    with FFmpegVideoWriter(output, 10.0, 64, 48, audio_source=sample_video, preset='ultrafast') as writer:
+        for index in range(NUM_FRAMES):
+            writer.write(np.full((48, 64, 3), _frame_value(index), dtype=np.uint8))
+
+    with FrameSource(output) as source:
+        assert (source.width, source.height) == (64, 48)
+        assert len(list(source.iter_frames())) == NUM_FRAMES
+
+
+@requires_ffmpeg
+def test_ffmpeg_writer_odd_size(tmp_path):
+    """Test: odd frame sizes are padded to even dimensions for yuv420p"""
+    output = tmp_path / 'odd.mp4'
+    with FFmpegVideoWriter(output, 10.0, 63, 47, preset='ultrafast') as writer:
+        for _ in range(5):
+            writer.write(np.zeros((47, 63, 3), dtype=np.uint8))
+
+    with FrameSource(output) as source:
+        assert (source.width, source.height) == (64, 48)
+
+
+@requires_ffmpeg
+def test_annotate_error_aborts_writer(sample_video, tmp_path, monkeypatch):
+    """Test: an error while annotating stops ffmpeg and removes the partial video"""
+    analyzer = pytest.importorskip('vogel_video_analyzer.analyzer')
+    from vogel_video_analyzer.detection_utils import _MockResult
+    writers = []
+
+    class RecordingWriter(FFmpegVideoWriter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            writers.append(self)
+
+    def model(image, verbose=False):
+        if len(model.calls) == 5:
+            raise RuntimeError('detector failed')
+        model.calls.append(1)
+        return [_MockResult([])]
+    model.calls = []
+
+    video_analyzer = analyzer.VideoAnalyzer.__new__(analyzer.VideoAnalyzer)
+    video_analyzer.model = model
+    video_analyzer.threshold = 0.3
+    video_analyzer.target_class = 14
+    video_analyzer.identify_species = False
+    video_analyzer.species_classifier = None
+    video_analyzer.cache = None
+
+    output = tmp_path / 'annotated.mp4'
+    monkeypatch.setattr(analyzer, 'FFmpegVideoWriter', RecordingWriter)
+    with pytest.raises(RuntimeError, match='detector failed'):
+        video_analyzer.annotate_video(sample_video, output, writer='ffmpeg')
+
+    assert writers and writers[0]._proc is None
+    assert not output.exists()
+
+
+@requires_ffmpeg
+def test_ffmpeg_writer_failure(tmp_path):
+    """Test: encoder errors surface as RuntimeError"""
+    writer = FFmpegVideoWriter(tmp_path / 'missing_dir' / 'out.mp4', 10.0, 64, 48)
+    with pytest.raises(RuntimeError):
+        for _ in range(200):
+            writer.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        writer.release()